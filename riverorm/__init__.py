@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+from .aggregates import Avg as Avg
+from .aggregates import Count as Count
+from .aggregates import Max as Max
+from .aggregates import Min as Min
+from .aggregates import Sum as Sum
+from .batch import Batch as Batch
+from .batch import batch as batch
+from .db import lane as lane
 from .fields import Field as Field
 from .fields import FieldMeta as FieldMeta
 from .fields import FieldRef as FieldRef
 from .models import Model as Model
 from .models import PrimaryKeyError as PrimaryKeyError
+from .queryset import IntegrityError as IntegrityError
@@ -0,0 +1,50 @@
+"""Aggregate expressions for ``QuerySet.aggregate()`` and ``annotate()``.
+
+Each helper returns a :class:`~riverorm.sql.query.Aggregate` computed by the
+database, so only the results cross the wire::
+
+    await Order.objects.filter(status="paid").aggregate(
+        revenue=Sum("total_price"), orders=Count(), buyers=Count("user_id", distinct=True)
+    )
+    await Order.objects.values("status").annotate(n=Count(), avg=Avg("total_price"))
+
+Fields may be given as strings or :class:`~riverorm.fields.FieldRef` values
+(``Order.f.total_price``); the query validates them against its model.
+"""
+
+from __future__ import annotations
+
+from riverorm.fields import FieldRef
+from riverorm.sql import Aggregate, AggregateFunction, Column
+
+
+def _aggregate(
+    function: AggregateFunction, field: str | FieldRef | None, distinct: bool
+) -> Aggregate:
+    column = None if field is None else Column(field if isinstance(field, str) else field.name)
+    return Aggregate(function, column, distinct)
+
+
+def Count(field: str | FieldRef | None = None, *, distinct: bool = False) -> Aggregate:  # noqa: N802
+    """``COUNT(*)``, or ``COUNT(field)`` (non-null values) when ``field`` is given."""
+    return _aggregate(AggregateFunction.COUNT, field, distinct)
+
+
+def Sum(field: str | FieldRef, *, distinct: bool = False) -> Aggregate:  # noqa: N802
+    """``SUM(field)``; ``None`` when no row matches."""
+    return _aggregate(AggregateFunction.SUM, field, distinct)
+
+
+def Avg(field: str | FieldRef, *, distinct: bool = False) -> Aggregate:  # noqa: N802
+    """``AVG(field)``; ``None`` when no row matches."""
+    return _aggregate(AggregateFunction.AVG, field, distinct)
+
+
+def Min(field: str | FieldRef) -> Aggregate:  # noqa: N802
+    """``MIN(field)``; ``None`` when no row matches."""
+    return _aggregate(AggregateFunction.MIN, field, False)
+
+
+def Max(field: str | FieldRef) -> Aggregate:  # noqa: N802
+    """``MAX(field)``; ``None`` when no row matches."""
+    return _aggregate(AggregateFunction.MAX, field, False)
@@ -0,0 +1,206 @@
+"""Send several independent queries to one database together.
+
+A :class:`Batch` collects QuerySet terminals (``all``/``first``/``get``/
+``count``/``exists``) and raw SQL statements, compiles them up front and hands
+them to :meth:`~riverorm.db.base.BaseDatabase.run_batch` in one call. MySQL with
+``multi_statements`` sends the whole batch as a single multi-statement round
+trip; Postgres runs it back to back on one pooled connection. Results come back
+in the order the entries were added::
+
+    users, total, alice = await (
+        riverorm.batch()
+        .all(User.objects.filter(is_active=True))
+        .count(Order.objects.filter(status="paid"))
+        .get(User.objects, username="alice")
+        .run()
+    )
+
+Every entry must target the same database. A batch of QuerySet reads may be
+served by a read replica; raw :meth:`Batch.execute` statements send the batch to
+the primary. ``load_related`` prefetches run after the batch, as extra queries.
+A QuerySet with an empty ``__in`` filter matches nothing anywhere, so its entry
+gets its empty result without being sent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from riverorm.db import BaseDatabase, DatabaseRegistry
+from riverorm.db.base import BatchKind
+from riverorm.queryset import Manager, QuerySet
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """One batched statement: how to compile it and how to finish its result."""
+
+    kind: BatchKind
+    compile: Callable[[BaseDatabase], tuple[str, list[Any]]]
+    finish: Callable[[Any], Awaitable[Any]]
+    queryset: QuerySet[Any] | None = None
+
+    @property
+    def matches_nothing(self) -> bool:
+        """Whether the entry's QuerySet needs no database (an empty ``__in``)."""
+        return self.queryset is not None and not self.queryset._targets(write=True)
+
+
+async def _identity(result: Any) -> Any:
+    return result
+
+
+class Batch:
+    """Builder collecting statements for one database; see the module docstring.
+
+    Each adder returns the batch itself so calls chain. Pass ``alias`` to pin the
+    batch to a registered connection; otherwise it runs where its first QuerySet
+    would (or on the default connection for raw SQL only).
+    """
+
+    def __init__(self, alias: str | None = None) -> None:
+        self.alias = alias
+        self._entries: list[_Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- adders -------------------------------------------------------------
+
+    def all(self, qs: QuerySet[Any] | Manager[Any]) -> Batch:
+        """Add ``qs.all()``; its result is a list of instances."""
+        qs = _queryset(qs)
+        query, hydrate = qs._plan()
+
+        async def finish(rows: Any) -> Any:
+            return await qs._hydrate(rows, hydrate)
+
+        return self._add("fetch", lambda db: db.compiler.compile_select(query), finish, qs)
+
+    def first(self, qs: QuerySet[Any] | Manager[Any]) -> Batch:
+        """Add ``qs.first()``; its result is an instance or ``None``."""
+        qs = _queryset(qs).limit(1)
+        query, hydrate = qs._plan()
+
+        async def finish(rows: Any) -> Any:
+            objects = await qs._hydrate(rows, hydrate)
+            return objects[0] if objects else None
+
+        return self._add("fetch", lambda db: db.compiler.compile_select(query), finish, qs)
+
+    def get(self, qs: QuerySet[Any] | Manager[Any], **lookups: Any) -> Batch:
+        """Add ``qs.get(**lookups)``; ``run()`` raises if it matches zero or several rows."""
+        qs = _queryset(qs)
+        qs = (qs.filter(**lookups) if lookups else qs).limit(2)
+        query, hydrate = qs._plan()
+
+        async def finish(rows: Any) -> Any:
+            return qs._single(await qs._hydrate(rows, hydrate))
+
+        return self._add("fetch", lambda db: db.compiler.compile_select(query), finish, qs)
+
+    def count(self, qs: QuerySet[Any] | Manager[Any]) -> Batch:
+        """Add ``qs.count()``; its result is an ``int``."""
+        qs = _queryset(qs)
+        query = qs._count_query()
+
+        async def finish(row: Any) -> Any:
+            return qs._count_from_row(row)
+
+        return self._add("fetchrow", lambda db: db.compiler.compile_select(query), finish, qs)
+
+    def exists(self, qs: QuerySet[Any] | Manager[Any]) -> Batch:
+        """Add ``qs.exists()``; its result is a ``bool``."""
+        qs = _queryset(qs)
+        query = qs._count_query()
+
+        async def finish(row: Any) -> Any:
+            return qs._count_from_row(row) > 0
+
+        return self._add("fetchrow", lambda db: db.compiler.compile_select(query), finish, qs)
+
+    def fetch(self, sql: str, *args: Any) -> Batch:
+        """Add a raw read statement; its result is the backend's rows."""
+        return self._add("fetch", lambda db: (sql, list(args)), _identity)
+
+    def execute(self, sql: str, *args: Any) -> Batch:
+        """Add a raw write statement; its result is what ``db.execute`` returns.
+
+        A batch containing ``execute`` entries always runs on the primary.
+        """
+        return self._add("execute", lambda db: (sql, list(args)), _identity)
+
+    def _add(
+        self,
+        kind: BatchKind,
+        compile: Callable[[BaseDatabase], tuple[str, list[Any]]],
+        finish: Callable[[Any], Awaitable[Any]],
+        qs: QuerySet[Any] | None = None,
+    ) -> Batch:
+        self._entries.append(_Entry(kind, compile, finish, qs))
+        return self
+
+    # -- execution ----------------------------------------------------------
+
+    def _database(self, entries: list[_Entry]) -> BaseDatabase:
+        """Pick the database for ``entries``, checking every one shares its primary."""
+        querysets = [e.queryset for e in entries if e.queryset is not None]
+        reads_only = all(e.kind != "execute" for e in entries) and not any(
+            qs.use_primary for qs in querysets
+        )
+        if self.alias is not None:
+            primary = DatabaseRegistry.get(self.alias)
+            db = DatabaseRegistry.get(self.alias, read=reads_only)
+        elif querysets:
+            primary = _primary_of(querysets[0])
+            db = querysets[0]._targets()[0] if reads_only else primary
+        else:
+            primary = db = DatabaseRegistry.get()
+        for qs in querysets:
+            if _primary_of(qs) is not primary:
+                raise ValueError(
+                    f"Batch entries must share one database; {qs.model.__name__} is routed "
+                    "to a different connection. Use separate batches."
+                )
+        return db
+
+    async def run(self) -> list[Any]:
+        """Send every entry together and return their results in insertion order."""
+        skipped = [entry.matches_nothing for entry in self._entries]
+        sent = [entry for entry, skip in zip(self._entries, skipped) if not skip]
+        results = iter(await self._send(sent))
+        return [
+            await entry.finish(([] if entry.kind == "fetch" else None) if skip else next(results))
+            for entry, skip in zip(self._entries, skipped)
+        ]
+
+    async def _send(self, entries: list[_Entry]) -> list[Any]:
+        if not entries:
+            return []
+        db = self._database(entries)
+        statements = []
+        for entry in entries:
+            sql, params = entry.compile(db)
+            statements.append((sql, tuple(params), entry.kind))
+        return await db.run_batch(statements)
+
+
+def _queryset(qs: QuerySet[Any] | Manager[Any]) -> QuerySet[Any]:
+    return qs.get_queryset() if isinstance(qs, Manager) else qs
+
+
+def _primary_of(qs: QuerySet[Any]) -> BaseDatabase:
+    targets = qs._targets(write=True)
+    if len(targets) != 1:
+        raise ValueError(
+            f"Cannot batch a {qs.model.__name__} query spanning {len(targets)} shards; "
+            "filter on the shard key or run it on its own."
+        )
+    return targets[0]
+
+
+def batch(alias: str | None = None) -> Batch:
+    """Start a new :class:`Batch` (optionally pinned to connection ``alias``)."""
+    return Batch(alias)
@@ -3,8 +3,15 @@
 # Database types
 MYSQL = "mysql"
 POSTGRES = "postgres"
-SUPPORTED_DBS = {MYSQL, POSTGRES}
+SQLITE = "sqlite"
+SUPPORTED_DBS = {MYSQL, POSTGRES, SQLITE}
 DEFAULT_DB = POSTGRES
 
 # Default primary key field name
 DEFAULT_PRIMARY_KEY = "id"
+
+# Rows fetched per round trip when streaming a QuerySet through a server-side cursor
+DEFAULT_CHUNK_SIZE = 1000
+
+# Rows per statement for batched multi-row writes (capped by the dialect's parameter limit)
+DEFAULT_BATCH_SIZE = 1000
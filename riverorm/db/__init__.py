@@ -1,6 +1,64 @@
+"""Database backends, the connection registry and their supporting types.
+
+The driver-backed backends (:class:`PostgresDatabase`, :class:`MySQLDatabase`,
+:class:`SQLiteDatabase`) are imported on first attribute access, so importing
+this package loads no database driver.
+"""
+
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .backends import backend_class as backend_class
+from .backends import register_backend as register_backend
 from .base import BaseDatabase as BaseDatabase
-from .mysql import MySQLDatabase as MySQLDatabase
-from .postgres import PostgresDatabase as PostgresDatabase
+from .breaker import BreakerPolicy as BreakerPolicy
+from .breaker import BreakerStats as BreakerStats
+from .breaker import CircuitBreaker as CircuitBreaker
+from .breaker import CircuitOpenError as CircuitOpenError
+from .breaker import DatabaseUnavailableError as DatabaseUnavailableError
+from .breaker import LoadShedError as LoadShedError
+from .codecs import CodecRegistry as CodecRegistry
+from .codecs import TypeCodec as TypeCodec
+from .fake import FakeDatabase as FakeDatabase
+from .lanes import lane as lane
+from .pool import PoolConfig as PoolConfig
+from .pool import PoolStats as PoolStats
+from .pool import PoolTimeoutError as PoolTimeoutError
 from .registry import DatabaseRegistry as DatabaseRegistry
+from .retry import RetryPolicy as RetryPolicy
+from .retry import RetryStats as RetryStats
+from .retry import retry_writes as retry_writes
+from .routing import LeastOutstandingPolicy as LeastOutstandingPolicy
+from .routing import ReplicaPolicy as ReplicaPolicy
+from .routing import RoundRobinPolicy as RoundRobinPolicy
+from .sharding import HashShardMap as HashShardMap
+from .sharding import RangeShardMap as RangeShardMap
+from .sharding import ShardMap as ShardMap
+from .timeout import QueryTimeoutError as QueryTimeoutError
+from .timeout import statement_timeout as statement_timeout
+
+if TYPE_CHECKING:
+    from .mysql import MySQLDatabase as MySQLDatabase
+    from .postgres import PostgresDatabase as PostgresDatabase
+    from .sqlite import SQLiteDatabase as SQLiteDatabase
+
+#: Backends imported on first access: ``name -> submodule``.
+_LAZY = {
+    "MySQLDatabase": "mysql",
+    "PostgresDatabase": "postgres",
+    "SQLiteDatabase": "sqlite",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -0,0 +1,90 @@
+"""Backend classes resolved lazily from DSN schemes.
+
+Each backend module imports its driver (``asyncpg``, ``aiomysql``, ...), so
+none is imported until a DSN actually asks for it: ``import riverorm`` stays
+cheap and works without the optional extras installed. Third-party backends
+register under the ``riverorm.backends`` entry-point group, by scheme::
+
+    [project.entry-points."riverorm.backends"]
+    duckdb = "riverorm_duckdb:DuckDBDatabase"
+"""
+
+from __future__ import annotations
+
+import importlib
+
+from .base import BaseDatabase
+
+#: Entry-point group scanned for backends whose scheme is not built in.
+ENTRY_POINT_GROUP = "riverorm.backends"
+
+#: ``scheme -> "module:Class"`` for the built-in backends.
+_BACKENDS: dict[str, str | type[BaseDatabase]] = {
+    "postgres": "riverorm.db.postgres:PostgresDatabase",
+    "postgresql": "riverorm.db.postgres:PostgresDatabase",
+    "mysql": "riverorm.db.mysql:MySQLDatabase",
+    "sqlite": "riverorm.db.sqlite:SQLiteDatabase",
+    "fake": "riverorm.db.fake:FakeDatabase",
+}
+
+#: Extra to install when a built-in backend's driver is missing.
+_EXTRAS = {"riverorm.db.postgres": "postgres", "riverorm.db.mysql": "mysql"}
+
+_entry_points_loaded = False
+
+
+def register_backend(scheme: str, backend: str | type[BaseDatabase]) -> None:
+    """Serve DSNs starting with ``scheme://`` with ``backend``.
+
+    ``backend`` is a class or a ``"module:Class"`` path imported on first use.
+    Replaces any backend already registered for ``scheme``.
+    """
+    _BACKENDS[scheme.lower()] = backend
+
+
+def backend_class(dsn: str) -> type[BaseDatabase]:
+    """Return the backend class for ``dsn`` (or a bare scheme), importing it if needed.
+
+    A ``+suffix`` on the scheme (``postgresql+pool://``) is ignored here.
+    Raises ``ValueError`` for an unknown scheme, ``ImportError`` naming the
+    extra to install when the backend's driver is missing, and ``TypeError``
+    when the registered object is not a :class:`BaseDatabase` subclass.
+    """
+    scheme = dsn.partition("://")[0].partition("+")[0].lower()
+    if scheme not in _BACKENDS:
+        _load_entry_points()
+    if scheme not in _BACKENDS:
+        raise ValueError(f"No database backend for scheme {scheme!r}; known: {sorted(_BACKENDS)}")
+    backend = _BACKENDS[scheme]
+    if isinstance(backend, str):
+        backend = _import(backend)
+        _BACKENDS[scheme] = backend
+    return backend
+
+
+def _import(path: str) -> type[BaseDatabase]:
+    module_name, _, attr = path.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as exc:
+        extra = _EXTRAS.get(module_name)
+        if extra is None:
+            raise
+        raise ImportError(
+            f"{attr} needs the {extra!r} extra: pip install 'riverorm[{extra}]'"
+        ) from exc
+    backend = getattr(module, attr)
+    if not (isinstance(backend, type) and issubclass(backend, BaseDatabase)):
+        raise TypeError(f"Database backend {path!r} is {backend!r}, not a BaseDatabase subclass")
+    return backend
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        _BACKENDS.setdefault(entry_point.name.lower(), entry_point.value)
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Sequence
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, ClassVar, Literal, Sequence, TypeVar
 
-from riverorm.sql import Compiler, Dialect
+from riverorm import constants
+from riverorm.sql import Compiler, Dialect, InsertQuery
+
+from .breaker import CircuitBreaker
+from .pool import PoolConfig, PoolStats, PoolTimeoutError
+from .retry import RetryPolicy, RetryStats, writes_retryable
+from .timeout import QueryTimeoutError, current_timeout
+
+R = TypeVar("R")
+
+#: How a batched statement's result is read: like ``fetch``, ``fetchrow`` or ``execute``.
+BatchKind = Literal["fetch", "fetchrow", "execute"]
 
 
 class BaseDatabase(ABC):
     is_connected: bool = False
+    pool_config: PoolConfig
+    pool_stats: PoolStats
+    retry_policy: RetryPolicy = RetryPolicy(max_attempts=1)
+    retry_stats: RetryStats
+    #: Default per-statement time limit in seconds (``None`` = unlimited).
+    statement_timeout: float | None = None
+    #: Optional circuit breaker / in-flight cap in front of every statement.
+    breaker: CircuitBreaker | None = None
+    #: Backend-specific URL options for :meth:`DatabaseRegistry.from_url`:
+    #: ``option -> (constructor argument, converter)`` (see :mod:`riverorm.db.url`).
+    url_options: ClassVar[dict[str, tuple[str, Callable[[str], Any]]]] = {}
+    #: URL options left in the DSN for the driver to interpret (e.g. ``sslmode``).
+    driver_options: ClassVar[frozenset[str]] = frozenset()
+    #: Whether :meth:`run_batch` holds one connection for the whole batch and
+    #: rolls back a transaction the batch opened when one of its statements fails.
+    atomic_batches: ClassVar[bool] = False
 
     @abstractmethod
-    def __init__(self, dsn: str, debug: bool = False) -> None: ...
+    def __init__(self, dsn: str, debug: bool = False, pool: PoolConfig | None = None) -> None: ...
 
     @property
     @abstractmethod
@@ -29,6 +60,156 @@ class BaseDatabase(ABC):
     @abstractmethod
     async def close(self) -> None: ...
 
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Check a driver connection out of the pool for the duration of the block.
+
+        Every statement method acquires through here, so concurrent tasks run
+        on separate connections. Wait time, timeouts and saturation are
+        recorded on :attr:`pool_stats`. Raises :class:`PoolTimeoutError` when
+        no connection frees up within ``pool_config.acquire_timeout``.
+        """
+        stats = self.pool_stats
+        started = time.perf_counter()
+        deadline = asyncio.timeout(self.pool_config.acquire_timeout)
+        stats.waiting += 1
+        try:
+            async with deadline:
+                conn = await self._acquire_connection()
+        except TimeoutError as exc:
+            if not deadline.expired():
+                raise
+            stats.timeouts += 1
+            raise PoolTimeoutError(
+                f"No pooled connection available within {self.pool_config.acquire_timeout}s "
+                f"({stats.in_use}/{stats.max_size} in use)"
+            ) from exc
+        finally:
+            stats.waiting -= 1
+        waited = time.perf_counter() - started
+        stats.acquired += 1
+        stats.wait_time_total += waited
+        stats.wait_time_max = max(stats.wait_time_max, waited)
+        stats.in_use += 1
+        try:
+            yield conn
+        finally:
+            stats.in_use -= 1
+            await self._release_connection(conn)
+
+    async def _acquire_connection(self) -> Any:
+        """Take a raw driver connection from the backend's pool."""
+        raise NotImplementedError(f"{type(self).__name__} does not support pooled connections")
+
+    async def _release_connection(self, conn: Any) -> None:
+        """Return ``conn`` to the backend's pool (or retire it)."""
+        raise NotImplementedError(f"{type(self).__name__} does not support pooled connections")
+
+    async def warm_up(self) -> None:
+        """Check out ``pool_config.min_size`` connections at once and prime each.
+
+        Holding them together guarantees that many distinct connections are open
+        and validated before traffic arrives; each is then primed concurrently
+        by :meth:`_warm_connection` (e.g. preparing ``pool_config.warm_up``).
+        """
+        async with AsyncExitStack() as stack:
+            conns = [
+                await stack.enter_async_context(self.acquire())
+                for _ in range(self.pool_config.min_size)
+            ]
+            await asyncio.gather(*(self._warm_connection(conn) for conn in conns))
+
+    async def _warm_connection(self, conn: Any) -> None:
+        """Prime one freshly checked-out connection; backends override this."""
+
+    async def _retrying(self, operation: Callable[[], Awaitable[R]], *, read: bool) -> R:
+        """Run ``operation`` (one full attempt of a statement), retrying transient errors.
+
+        Reads (see :func:`is_read`) are retried per :attr:`retry_policy`; writes
+        only inside :func:`~riverorm.db.retry.retry_writes`. Each attempt should
+        acquire its own connection so a dropped one is not reused. With a
+        :attr:`breaker`, the statement (all its attempts) first passes through it.
+        """
+        if self.breaker is not None:
+            return await self.breaker.call(
+                lambda: self._with_retries(operation, read=read), self._is_unhealthy
+            )
+        return await self._with_retries(operation, read=read)
+
+    async def _with_retries(self, operation: Callable[[], Awaitable[R]], *, read: bool) -> R:
+        policy = self.retry_policy
+        retryable = read or writes_retryable()
+        attempt = 1
+        while True:
+            try:
+                result = await operation()
+            except Exception as exc:
+                reason = policy.classify(exc) if retryable else None
+                if reason is None:
+                    raise
+                if attempt >= policy.max_attempts:
+                    if policy.max_attempts > 1:
+                        self.retry_stats.exhausted += 1
+                    raise
+                self.retry_stats.retries += 1
+                self.retry_stats.reasons[reason] += 1
+                await asyncio.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+            if attempt > 1:
+                self.retry_stats.recovered += 1
+            return result
+
+    def _is_unhealthy(self, exc: Exception) -> bool:
+        """Whether ``exc`` counts against the :attr:`breaker`: timeouts
+        (pool or statement) and errors :attr:`retry_policy` deems transient."""
+        return isinstance(exc, TimeoutError) or self.retry_policy.classify(exc) is not None
+
+    def _timeout(self) -> float | None:
+        """The limit for the statement about to run: the innermost
+        :func:`~riverorm.db.timeout.statement_timeout` scope, else :attr:`statement_timeout`."""
+        scoped = current_timeout()
+        return self.statement_timeout if scoped is None else scoped
+
+    async def _bounded(self, timeout: float | None, operation: Callable[[], Awaitable[R]]) -> R:
+        """Run ``operation`` under a client-side deadline of ``timeout`` seconds.
+
+        The deadline cancels ``operation``; backends clean up the connection on
+        that cancellation. Both an expired deadline and a statement the server
+        aborted (see :meth:`_is_server_timeout`) raise :class:`QueryTimeoutError`.
+        """
+        deadline = asyncio.timeout(timeout)
+        try:
+            async with deadline:
+                return await operation()
+        except TimeoutError as exc:
+            if not deadline.expired():
+                raise
+            raise QueryTimeoutError(f"Statement cancelled after {timeout}s") from exc
+        except Exception as exc:
+            if timeout is None or not self._is_server_timeout(exc):
+                raise
+            raise QueryTimeoutError(f"Statement exceeded {timeout}s on the server") from exc
+
+    def _is_server_timeout(self, exc: Exception) -> bool:
+        """Whether ``exc`` is the server aborting a statement over its time limit."""
+        return False
+
+    def _should_recycle(self, born: float | None, queries: int) -> bool:
+        """Whether a connection has exceeded ``max_lifetime`` or ``max_queries``.
+
+        ``born`` is a :func:`time.monotonic` timestamp (``None`` if unknown) and
+        ``queries`` the number of statements the connection has served.
+        """
+        cfg = self.pool_config
+        if (
+            cfg.max_lifetime is not None
+            and born is not None
+            and time.monotonic() - born >= cfg.max_lifetime
+        ):
+            return True
+        return cfg.max_queries is not None and queries >= cfg.max_queries
+
     @abstractmethod
     async def execute(self, query: str, *args: Any) -> Any: ...
 
@@ -38,9 +219,105 @@ class BaseDatabase(ABC):
     @abstractmethod
     async def fetchrow(self, query: str, *args: Any) -> Any: ...
 
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        """Run ``query`` and return ``(column_names, rows)`` with positional rows.
+
+        Hydration reads values by index against the one column list instead
+        of building a dict per row. Backends override this to skip their
+        mapping rows; this fallback converts what :meth:`fetch` returns.
+        """
+        rows = [dict(row) for row in await self.fetch(query, *args)]
+        if not rows:
+            return [], []
+        return list(rows[0]), [tuple(row.values()) for row in rows]
+
     @abstractmethod
     async def update(self, query: str, *args: Any) -> Any: ...
 
+    async def run_batch(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run ``(sql, args, kind)`` statements together and return their results in order.
+
+        Each result is what the ``kind`` method would have returned. Backends
+        override this to share one connection (or one round trip); this
+        fallback simply runs the statements one after another.
+        """
+        return [await getattr(self, kind)(sql, *args) for sql, args, kind in statements]
+
+    async def run_transaction(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run ``(sql, args, kind)`` statements in one transaction on one connection.
+
+        The transaction commits if every statement succeeds and is rolled back
+        otherwise, so a failure never leaves it, or its row locks, open on a
+        pooled connection. Results come back in order, as from :meth:`run_batch`.
+        With :attr:`atomic_batches` the statements are sent as one batch between
+        ``BEGIN`` and ``COMMIT``; the :meth:`run_batch` fallback spreads them
+        over separate connections, so other backends must override this.
+        """
+        if not self.atomic_batches:
+            raise NotImplementedError(
+                f"{type(self).__name__} cannot run statements in one transaction"
+            )
+        batch: list[tuple[str, tuple[Any, ...], BatchKind]] = [
+            (self.dialect.begin_transaction, (), "execute"),
+            *statements,
+            ("COMMIT", (), "execute"),
+        ]
+        results = await self.run_batch(batch)
+        return results[1:-1]
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = constants.DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        """Yield the rows of ``query`` in chunks of at most ``chunk_size``.
+
+        Backends override this with a server-side cursor so only one chunk is
+        held in memory at a time. This fallback fetches the full result first.
+        """
+        rows = await self.fetch(query, *args)
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size]
+
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: AsyncIterable[tuple[Any, ...]],
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Bulk-load ``records`` into ``table`` and return the number of rows written.
+
+        This fallback sends multi-row ``INSERT`` statements of at most
+        ``batch_size`` rows (fewer if the dialect's parameter limit demands it),
+        holding one batch in memory at a time. Backends with a native bulk-load
+        protocol override it.
+        """
+        per_batch = max(1, min(batch_size, self.dialect.max_params // max(len(columns), 1)))
+        total = 0
+        batch: list[tuple[Any, ...]] = []
+        async for record in records:
+            batch.append(record)
+            if len(batch) >= per_batch:
+                total += await self._insert_rows(table, columns, batch)
+                batch = []
+        if batch:
+            total += await self._insert_rows(table, columns, batch)
+        return total
+
+    async def _insert_rows(
+        self, table: str, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]
+    ) -> int:
+        """Insert ``rows`` with one multi-row ``INSERT`` and return how many were sent."""
+        query = InsertQuery(table=table, columns=tuple(columns), rows=tuple(rows))
+        sql, params = self.compiler.compile_insert(query)
+        await self.execute(sql, *params)
+        return len(rows)
+
     @abstractmethod
     async def execute_insert(self, query: str, *args: Any) -> Any:
         """Execute an ``INSERT`` and return the generated primary key.
@@ -55,3 +332,8 @@ class BaseDatabase(ABC):
     async def execute_returning_rowcount(self, query: str, *args: Any) -> int:
         """Execute a write query (``UPDATE`` / ``DELETE``) and return affected row count."""
         ...
+
+
+def is_read(query: str) -> bool:
+    """Whether ``query`` is a plain ``SELECT`` (safe to retry)."""
+    return query.lstrip()[:6].upper() == "SELECT"
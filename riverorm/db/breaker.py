@@ -0,0 +1,214 @@
+"""Per-backend circuit breaking and load shedding.
+
+When a database degrades, every request keeps queueing for a connection and
+waits out its full timeout, so callers pile up faster than they drain. A
+:class:`CircuitBreaker` in front of a backend fails those calls fast instead::
+
+    PostgresDatabase(
+        dsn,
+        breaker=BreakerPolicy(failure_rate=0.5, slow_call=2.0, max_in_flight=200),
+    )
+
+The breaker watches the outcome of the last ``window`` statements. Once at
+least ``min_calls`` have finished and the share that failed (dropped
+connections, transient server errors, timeouts, or statements slower than
+``slow_call``) reaches ``failure_rate``, it *opens*: every call raises
+:class:`CircuitOpenError` without touching the pool. After ``open_for``
+seconds it goes *half-open* and lets ``half_open_trials`` statements through;
+if they all succeed it closes again, and any failure re-opens it.
+
+``max_in_flight`` independently caps concurrent statements on the backend:
+one more is rejected at once with :class:`LoadShedError` rather than queued.
+Errors the database answered with (constraint violations, syntax errors)
+say nothing about its health and count as successes. Both rejections derive
+from :class:`DatabaseUnavailableError` and are never retried.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal, TypeVar
+
+R = TypeVar("R")
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+
+class DatabaseUnavailableError(Exception):
+    """Raised when a statement is rejected before reaching the database."""
+
+
+class CircuitOpenError(DatabaseUnavailableError):
+    """Raised while the backend's circuit breaker is open."""
+
+
+class LoadShedError(DatabaseUnavailableError):
+    """Raised when the backend already runs ``max_in_flight`` statements."""
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """When a :class:`CircuitBreaker` opens, how long it stays open, and the in-flight cap.
+
+    ``slow_call`` (seconds) counts statements at least that slow as failures;
+    ``None`` judges by errors alone. ``max_in_flight=None`` disables load
+    shedding.
+    """
+
+    failure_rate: float = 0.5
+    window: int = 20
+    min_calls: int = 10
+    slow_call: float | None = None
+    open_for: float = 5.0
+    half_open_trials: int = 3
+    max_in_flight: int | None = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.failure_rate <= 1:
+            raise ValueError("BreakerPolicy.failure_rate must be in (0, 1]")
+        if self.window < 1 or not 1 <= self.min_calls <= self.window:
+            raise ValueError("BreakerPolicy needs window >= 1 and 1 <= min_calls <= window")
+        if self.slow_call is not None and self.slow_call <= 0:
+            raise ValueError("BreakerPolicy.slow_call must be positive or None")
+        if self.open_for < 0:
+            raise ValueError("BreakerPolicy.open_for must be >= 0")
+        if self.half_open_trials < 1:
+            raise ValueError("BreakerPolicy.half_open_trials must be >= 1")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("BreakerPolicy.max_in_flight must be >= 1 or None")
+
+
+@dataclass
+class BreakerStats:
+    """Cumulative breaker counters for one backend.
+
+    ``opened`` counts transitions to open, ``rejected`` calls refused while
+    open (or half-open with every trial slot taken), ``shed`` calls refused by
+    ``max_in_flight``, and ``failures`` / ``slow_calls`` the outcomes recorded.
+    """
+
+    opened: int = 0
+    rejected: int = 0
+    shed: int = 0
+    failures: int = 0
+    slow_calls: int = 0
+
+
+class CircuitBreaker:
+    """The open / half-open / closed state machine for one backend.
+
+    Backends run each statement through :meth:`call`; see the module
+    docstring for the rules.
+    """
+
+    def __init__(self, policy: BreakerPolicy | None = None) -> None:
+        self.policy = policy or BreakerPolicy()
+        self.stats = BreakerStats()
+        #: Statements currently running through the breaker.
+        self.in_flight = 0
+        self._state: BreakerState = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=self.policy.window)
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+
+    @property
+    def state(self) -> BreakerState:
+        """``closed``, ``open`` or ``half_open`` (an expired open state reads as half-open)."""
+        if self._state == "open" and time.monotonic() - self._opened_at >= self.policy.open_for:
+            return "half_open"
+        return self._state
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[R]],
+        is_failure: Callable[[Exception], bool],
+    ) -> R:
+        """Run ``operation`` if the breaker admits it, recording the outcome.
+
+        ``is_failure`` decides whether an exception reflects the database's
+        health. Raises :class:`CircuitOpenError` or :class:`LoadShedError`
+        without running ``operation`` when the call is refused.
+        """
+        trial = self._admit()
+        self.in_flight += 1
+        started = time.monotonic()
+        try:
+            result = await operation()
+        except Exception as exc:
+            self._record(trial, failed=is_failure(exc))
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the database, but free the trial slot.
+            if trial and self._state == "half_open":
+                self._trials -= 1
+            raise
+        finally:
+            self.in_flight -= 1
+        slow = self.policy.slow_call is not None and (
+            time.monotonic() - started >= self.policy.slow_call
+        )
+        if slow:
+            self.stats.slow_calls += 1
+        self._record(trial, failed=slow)
+        return result
+
+    def reset(self) -> None:
+        """Close the breaker and forget recorded outcomes."""
+        self._state = "closed"
+        self._outcomes.clear()
+
+    def _admit(self) -> bool:
+        """Admit one call or raise; returns whether it is a half-open trial."""
+        policy = self.policy
+        if self._state == "open":
+            if time.monotonic() - self._opened_at < policy.open_for:
+                self.stats.rejected += 1
+                raise CircuitOpenError(
+                    f"Circuit open after repeated failures; retrying in "
+                    f"{policy.open_for - (time.monotonic() - self._opened_at):.1f}s"
+                )
+            self._state = "half_open"
+            self._trials = self._trial_successes = 0
+        if policy.max_in_flight is not None and self.in_flight >= policy.max_in_flight:
+            self.stats.shed += 1
+            raise LoadShedError(f"{self.in_flight} statements already in flight (max_in_flight)")
+        if self._state == "half_open":
+            if self._trials >= policy.half_open_trials:
+                self.stats.rejected += 1
+                raise CircuitOpenError("Circuit half-open; trial statements already in progress")
+            self._trials += 1
+            return True
+        return False
+
+    def _record(self, trial: bool, *, failed: bool) -> None:
+        if failed:
+            self.stats.failures += 1
+        if trial:
+            if self._state != "half_open":
+                return
+            if failed:
+                self._open()
+            else:
+                self._trial_successes += 1
+                if self._trial_successes >= self.policy.half_open_trials:
+                    self.reset()
+            return
+        if self._state != "closed":
+            # Started before the breaker opened; the verdict is already in.
+            return
+        self._outcomes.append(failed)
+        outcomes = self._outcomes
+        if len(outcomes) >= self.policy.min_calls and (
+            sum(outcomes) / len(outcomes) >= self.policy.failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.stats.opened += 1
@@ -0,0 +1,133 @@
+"""Type codecs installed on every new asyncpg connection.
+
+asyncpg hands ``json``/``jsonb`` values over as ``str`` and expects ``str``
+parameters, so without a codec JSON columns round-trip as text and are decoded
+a second time by pydantic. A :class:`CodecRegistry` is applied to each new pooled
+connection (via :meth:`asyncpg.Connection.set_type_codec`), so values are
+encoded and decoded exactly once, in the driver::
+
+    codecs = CodecRegistry.default()          # json/jsonb via orjson, msgspec or json
+    codecs.register(TypeCodec("money_cents", encoder=str, decoder=int, schema="public"))
+    db = PostgresDatabase(dsn, codecs=codecs)
+
+``uuid``, ``numeric``, date/time and array types already use asyncpg's
+built-in binary codecs; registering a codec for them replaces that fast path, so
+only do it to change the Python type they map to.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+#: JSON libraries tried by :func:`json_functions`, fastest first.
+JSON_LIBRARIES: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+#: Version byte prefixing the binary wire format of ``jsonb``.
+_JSONB_VERSION = b"\x01"
+
+
+@dataclass(frozen=True)
+class TypeCodec:
+    """How one Postgres type is encoded to and decoded from the wire.
+
+    ``format="text"`` codecs work with ``str``; ``"binary"`` ones with
+    ``bytes`` in the type's binary wire format.
+    """
+
+    typename: str
+    encoder: Callable[[Any], Any]
+    decoder: Callable[[Any], Any]
+    schema: str = "pg_catalog"
+    format: Literal["text", "binary"] = "text"
+
+
+def json_functions(
+    library: str | None = None,
+) -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """Return ``(dumps, loads)`` working on UTF-8 bytes from a JSON library.
+
+    ``library`` is ``"orjson"``, ``"msgspec"`` or ``"json"``; ``None`` picks the
+    first installed of :data:`JSON_LIBRARIES`. Raises ``ImportError`` if the
+    requested library is not installed.
+    """
+    if library is not None and library not in JSON_LIBRARIES:
+        raise ValueError(f"Unsupported JSON library {library!r}; choose from {JSON_LIBRARIES}")
+    for name in (library,) if library else JSON_LIBRARIES:
+        try:
+            module = importlib.import_module("msgspec.json" if name == "msgspec" else name)
+        except ImportError:
+            if library:
+                raise ImportError(
+                    f"JSON library {library!r} is not installed; pip install {library}"
+                ) from None
+            continue
+        if name == "orjson":
+            return module.dumps, module.loads
+        if name == "msgspec":
+            return module.encode, module.decode
+        break
+    import json
+
+    return lambda value: json.dumps(value, separators=(",", ":")).encode(), json.loads
+
+
+def json_codecs(library: str | None = None) -> list[TypeCodec]:
+    """Binary ``json`` and ``jsonb`` codecs backed by ``library`` (see :func:`json_functions`)."""
+    dumps, loads = json_functions(library)
+
+    def encode_jsonb(value: Any) -> bytes:
+        return _JSONB_VERSION + dumps(value)
+
+    def decode_jsonb(data: bytes) -> Any:
+        return loads(data[1:])
+
+    return [
+        TypeCodec("json", dumps, loads, format="binary"),
+        TypeCodec("jsonb", encode_jsonb, decode_jsonb, format="binary"),
+    ]
+
+
+class CodecRegistry:
+    """Ordered set of :class:`TypeCodec` applied to each new connection.
+
+    Codecs are keyed by ``(schema, typename)``; registering one for a type that
+    already has a codec replaces it.
+    """
+
+    def __init__(self, codecs: Iterable[TypeCodec] = ()) -> None:
+        self._codecs: dict[tuple[str, str], TypeCodec] = {}
+        for codec in codecs:
+            self.register(codec)
+
+    @classmethod
+    def default(cls, json: str | None = None) -> CodecRegistry:
+        """A registry with ``json``/``jsonb`` codecs from the fastest available library."""
+        return cls(json_codecs(json))
+
+    def register(self, codec: TypeCodec) -> None:
+        """Add ``codec``, replacing any codec for the same type."""
+        self._codecs[(codec.schema, codec.typename)] = codec
+
+    def unregister(self, typename: str, schema: str = "pg_catalog") -> None:
+        """Remove the codec for ``schema.typename`` (restoring asyncpg's own)."""
+        self._codecs.pop((schema, typename), None)
+
+    def __iter__(self) -> Iterator[TypeCodec]:
+        return iter(self._codecs.values())
+
+    def __len__(self) -> int:
+        return len(self._codecs)
+
+    async def apply(self, conn: Any) -> None:
+        """Install every codec on the asyncpg connection ``conn``."""
+        for codec in self:
+            await conn.set_type_codec(
+                codec.typename,
+                encoder=codec.encoder,
+                decoder=codec.decoder,
+                schema=codec.schema,
+                format=codec.format,
+            )
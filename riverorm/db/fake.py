@@ -0,0 +1,171 @@
+"""In-memory backend that records statements and answers them instantly.
+
+:class:`FakeDatabase` never touches a server: every compiled ``(sql, params)``
+is appended to :attr:`~FakeDatabase.statements` and reads are answered from
+scripted responses. Timing ORM code against it measures RiverORM's own
+overhead (compiling, hydration, prefetch stitching) with the database taken
+out of the picture, and tests can assert on the exact SQL sent::
+
+    db = FakeDatabase()                      # or FakeDatabase(dialect="mysql")
+    db.on(r'FROM "user"', [{"id": 1, "username": "alice"}])
+    db.on(r'FROM "order"', lambda sql, params: [{"id": 7, "user_id": params[0]}])
+    DatabaseRegistry.register("default", db)
+
+Responses are matched by regular expression against the SQL, newest first.
+A response is a list of row mappings, a callable ``(sql, params) -> rows``
+generating them, or (for ``UPDATE`` / ``DELETE``) an ``int`` row count.
+Unmatched reads return no rows, and inserts get increasing primary keys (one
+per ``VALUES`` group of a multi-row insert).
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from riverorm import constants
+from riverorm.sql import Dialect, MySQLDialect, PostgresDialect, SQLiteDialect
+
+from .base import BaseDatabase
+from .pool import PoolConfig, PoolStats
+from .retry import RetryStats
+from .url import Options
+
+#: Rows, a generator of rows, or an affected-row count.
+Response = Sequence[Mapping[str, Any]] | Callable[[str, tuple[Any, ...]], Any] | int
+
+_DIALECTS: dict[str, type[Dialect]] = {
+    constants.POSTGRES: PostgresDialect,
+    constants.MYSQL: MySQLDialect,
+    constants.SQLITE: SQLiteDialect,
+}
+
+
+@dataclass(frozen=True)
+class Statement:
+    """One statement received by a :class:`FakeDatabase`.
+
+    ``kind`` is the backend method that ran it (``"fetch"``, ``"execute"``, ...).
+    """
+
+    sql: str
+    params: tuple[Any, ...]
+    kind: str
+
+
+class FakeDatabase(BaseDatabase):
+    """Backend that records every statement and returns scripted rows instantly."""
+
+    url_options: ClassVar[Options] = {"dialect": ("dialect", str)}
+    # Nothing runs, so recording a batch statement by statement is all it takes.
+    atomic_batches: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        dsn: str = "fake://",
+        debug: bool = False,
+        pool: PoolConfig | None = None,
+        *,
+        dialect: Dialect | str = constants.POSTGRES,
+    ) -> None:
+        if isinstance(dialect, str):
+            if dialect not in _DIALECTS:
+                raise ValueError(
+                    f"Unsupported dialect {dialect!r}; choose from {sorted(_DIALECTS)}"
+                )
+            dialect = _DIALECTS[dialect]()
+        self._dialect = dialect
+        self.dsn = dsn
+        self.debug = debug
+        self.pool_config = pool or PoolConfig()
+        self.pool_stats = PoolStats()
+        self.retry_stats = RetryStats()
+        #: Every statement received, in order.
+        self.statements: list[Statement] = []
+        self._responses: list[tuple[re.Pattern[str], Response]] = []
+        self._ids = itertools.count(1)
+
+    @property
+    def dialect(self) -> Dialect:
+        return self._dialect
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def close(self) -> None:
+        self.is_connected = False
+
+    def on(self, pattern: str, response: Response) -> None:
+        """Answer statements whose SQL matches ``pattern`` (``re.search``) with ``response``.
+
+        Later registrations take precedence over earlier ones.
+        """
+        self._responses.insert(0, (re.compile(pattern), response))
+
+    def reset(self) -> None:
+        """Forget recorded statements (scripted responses are kept)."""
+        self.statements.clear()
+
+    def _respond(self, sql: str, args: tuple[Any, ...], kind: str) -> Any:
+        self.statements.append(Statement(sql, args, kind))
+        for pattern, response in self._responses:
+            if pattern.search(sql):
+                return response(sql, args) if callable(response) else response
+        return None
+
+    def _rows(self, sql: str, args: tuple[Any, ...], kind: str) -> Sequence[Mapping[str, Any]]:
+        result = self._respond(sql, args, kind)
+        if result is None:
+            return self._returning(sql)
+        return [] if isinstance(result, int) else result
+
+    async def execute(self, query: str, *args: Any) -> Any:
+        return self._respond(query, args, "execute")
+
+    async def fetch(self, query: str, *args: Any) -> Sequence[Any]:
+        return self._rows(query, args, "fetch")
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        rows = self._rows(query, args, "fetchrow")
+        return rows[0] if rows else None
+
+    def _returning(self, query: str) -> list[dict[str, Any]]:
+        """Rows for an unscripted ``INSERT ... RETURNING``: the next key per inserted row."""
+        if not query.startswith("INSERT") or " RETURNING " not in query:
+            return []
+        columns = [c.strip().strip('"`') for c in query.rsplit(" RETURNING ", 1)[1].split(",")]
+        return [dict.fromkeys(columns) | {columns[0]: key} for key in self._generated_keys(query)]
+
+    def _generated_keys(self, query: str) -> list[int]:
+        """Hand out the next key for each ``VALUES (...)`` group of ``query``."""
+        values = query.partition(" VALUES ")[2]
+        groups = values.partition(" RETURNING ")[0].partition(" ON ")[0].count("(")
+        return [next(self._ids) for _ in range(max(groups, 1))]
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        rows = self._rows(query, args, "fetch_tuples")
+        if not rows:
+            return [], []
+        columns = list(rows[0])
+        return columns, [tuple(row[c] for c in columns) for row in rows]
+
+    async def update(self, query: str, *args: Any) -> Any:
+        return self._respond(query, args, "update")
+
+    async def execute_insert(self, query: str, *args: Any) -> Any:
+        rows = self._rows(query, args, "execute_insert")
+        if rows:
+            return next(iter(rows[0].values()))
+        keys = self._generated_keys(query)
+        return keys[-1] if self.dialect.bulk_lastrowid == "last" else keys[0]
+
+    async def execute_returning_rowcount(self, query: str, *args: Any) -> int:
+        result = self._respond(query, args, "execute_returning_rowcount")
+        if result is None:
+            return 0
+        return result if isinstance(result, int) else len(result)
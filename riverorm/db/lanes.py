@@ -0,0 +1,50 @@
+"""Priority lanes: separate connection pools per kind of work on one alias.
+
+Background jobs and reports sharing a pool with latency-sensitive requests
+can hold every connection for seconds at a time. A lane is a second backend
+for the same database, with its own :class:`~riverorm.db.pool.PoolConfig`,
+registered under the alias::
+
+    DatabaseRegistry.register(
+        "default",
+        PostgresDatabase(dsn, pool=PoolConfig(max_size=20, acquire_timeout=0.5)),
+        lanes={"bulk": PostgresDatabase(dsn, pool=PoolConfig(max_size=4))},
+    )
+
+    with lane("bulk"):                       # or QuerySet.lane("bulk")
+        await Order.objects.filter(status="paid").all()
+
+Statements issued inside a :func:`lane` scope run on that lane's pool, so
+bulk work waits in its own queue and never holds more than its ``max_size``
+connections; everything else keeps using the alias' main pool. Aliases without
+the requested lane use their main pool, and a lane serves reads as well as
+writes (it bypasses read replicas).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_lane: ContextVar[str | None] = ContextVar("riverorm_lane", default=None)
+
+
+@contextmanager
+def lane(name: str | None) -> Iterator[None]:
+    """Run statements issued inside the block on the lane ``name``.
+
+    ``None`` leaves the surrounding lane (or the main pool) in place.
+    """
+    if name is not None and not name:
+        raise ValueError("lane name must be a non-empty string")
+    token = _lane.set(name if name is not None else _lane.get())
+    try:
+        yield
+    finally:
+        _lane.reset(token)
+
+
+def current_lane() -> str | None:
+    """The lane selected by the innermost :func:`lane` scope, if any."""
+    return _lane.get()
@@ -1,26 +1,107 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import ssl
+import struct
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, ClassVar
+from weakref import WeakKeyDictionary
 
 import aiomysql
+from pymysql.constants import COMMAND
 
+from riverorm import constants
 from riverorm.sql import Dialect, MySQLDialect
 
-from .base import BaseDatabase
+from .base import BaseDatabase, BatchKind, R, is_read
+from .breaker import BreakerPolicy, CircuitBreaker
+from .pool import PoolConfig, PoolStats
+from .retry import RetryPolicy, RetryStats
+from .timeout import milliseconds
+from .url import SERVER_OPTIONS, Options, boolean
 
 logger = logging.getLogger(__name__)
 
+#: Server error raised when a ``SELECT`` exceeds its ``MAX_EXECUTION_TIME``.
+ER_QUERY_TIMEOUT = 3024
+#: ``COM_SET_OPTION`` argument switching multi-statement mode off.
+_MYSQL_OPTION_MULTI_STATEMENTS_OFF = 1
+
+
+def _ssl_context(mode: str, cafile: str | None) -> ssl.SSLContext | None:
+    """TLS settings for ``sslmode`` (libpq names, or MySQL's ``ssl-mode`` names).
+
+    ``disable`` turns TLS off; ``require`` encrypts without checking the
+    certificate; ``verify-ca`` checks it against ``cafile`` (or the system
+    store); ``verify-full`` also checks the host name.
+    """
+    mode = mode.lower().replace("_", "-")
+    if mode in ("disable", "disabled"):
+        return None
+    context = ssl.create_default_context(cafile=cafile)
+    if mode in ("require", "required"):
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif mode == "verify-ca":
+        context.check_hostname = False
+    elif mode not in ("verify-full", "verify-identity"):
+        raise ValueError(f"Unsupported sslmode {mode!r}")
+    return context
+
 
 class MySQLDatabase(BaseDatabase):
-    _conn: aiomysql.Connection | None
+    _pool: aiomysql.Pool | None
     _debug: bool
     _dsn: str
     _dialect: Dialect = MySQLDialect()
+    url_options: ClassVar[Options] = {
+        **SERVER_OPTIONS,
+        "multi_statements": ("multi_statements", boolean),
+    }
+    # Read by :meth:`dsn_to_dict`.
+    driver_options: ClassVar[frozenset[str]] = frozenset(
+        {"charset", "connect_timeout", "sslmode", "sslrootcert"}
+    )
 
-    def __init__(self, dsn: str, debug: bool = False):
-        self._conn = None
+    def __init__(
+        self,
+        dsn: str,
+        debug: bool = False,
+        pool: PoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        statement_timeout: float | None = None,
+        breaker: BreakerPolicy | None = None,
+        *,
+        multi_statements: bool = False,
+    ):
+        if statement_timeout is not None and statement_timeout <= 0:
+            raise ValueError("statement_timeout must be positive or None")
+        # Parse now so a bad DSN option fails at startup, not on first connect.
+        self.dsn_to_dict(dsn)
+        self._pool = None
         self._debug = debug
         self._dsn = dsn
+        self.pool_config = pool or PoolConfig()
+        self.pool_stats = PoolStats(max_size=self.pool_config.max_size)
+        # Per-connection birth time and statement count, used to enforce
+        # ``max_lifetime`` / ``max_queries`` (aiomysql only recycles idle ones).
+        self._born: WeakKeyDictionary[aiomysql.Connection, float] = WeakKeyDictionary()
+        self._queries: WeakKeyDictionary[aiomysql.Connection, int] = WeakKeyDictionary()
+        # One slot per connection the pool may hand out; see _acquire_connection.
+        self._slots = asyncio.Semaphore(self.pool_config.max_size)
+        self.retry_policy = retry or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.statement_timeout = statement_timeout
+        self.breaker = CircuitBreaker(breaker) if breaker is not None else None
+        #: Open connections in multi-statement mode so :meth:`run_batch` sends a
+        #: batch in one round trip. Off by default: in that mode a raw statement
+        #: built from untrusted input could smuggle in stacked statements.
+        self.multi_statements = multi_statements
+        # Background ``KILL QUERY`` tasks for statements cancelled mid-flight.
+        self._kills: set[asyncio.Task[None]] = set()
         if debug:
             logger.setLevel(logging.DEBUG)
         else:
@@ -31,8 +112,13 @@ class MySQLDatabase(BaseDatabase):
         return self._dialect
 
     def dsn_to_dict(self, dsn: str) -> dict:
-        """Convert DSN string (RFC 1738 style) to a dictionary for aiomysql.connect."""
-        from urllib.parse import unquote, urlparse
+        """Convert DSN string (RFC 1738 style) to a dictionary for aiomysql.connect.
+
+        Query parameters in :attr:`driver_options` are passed on to the driver
+        (``sslmode`` becomes an :class:`ssl.SSLContext`); any other raises
+        ``ValueError``.
+        """
+        from urllib.parse import parse_qsl, unquote, urlparse
 
         url = urlparse(dsn)
         if url.scheme not in ("mysql", "mariadb"):
@@ -45,67 +131,349 @@ class MySQLDatabase(BaseDatabase):
         port = url.port or 3306
         db = url.path.lstrip("/") if url.path else None
 
-        dct = {"host": host, "port": port}
+        dct: dict[str, Any] = {"host": host, "port": port}
         if user:
             dct["user"] = user
         if password:
             dct["password"] = password
         if db:
             dct["db"] = db
-        # Optionally: parse query params for extra options
-        # from urllib.parse import parse_qs
-        # opts = parse_qs(url.query)
-        # for k, v in opts.items():
-        #     dct[k] = v[0] if v else None
+        opts = dict(parse_qsl(url.query, keep_blank_values=True))
+        unknown = opts.keys() - self.driver_options
+        if unknown:
+            raise ValueError(
+                f"Unknown MySQL DSN option(s) {sorted(unknown)}; "
+                f"supported: {', '.join(sorted(self.driver_options))}"
+            )
+        if "charset" in opts:
+            dct["charset"] = opts["charset"]
+        if "connect_timeout" in opts:
+            dct["connect_timeout"] = float(opts["connect_timeout"])
+        context = _ssl_context(opts.get("sslmode", "disable"), opts.get("sslrootcert"))
+        if context is not None:
+            dct["ssl"] = context
         return dct
 
     async def connect(self) -> None:
+        cfg = self.pool_config
         # autocommit so writes/DDL persist without explicit transaction handling,
-        # matching asyncpg's default behaviour.
-        self._conn = await aiomysql.connect(autocommit=True, **self.dsn_to_dict(self._dsn))
+        # matching asyncpg's default behaviour. ``pool_recycle`` closes
+        # connections idle for longer than the given number of seconds.
+        # aiomysql always negotiates multi-statement support; unless
+        # :attr:`multi_statements` is set, _acquire_connection turns it off.
+        self._pool = await aiomysql.create_pool(
+            minsize=cfg.min_size,
+            maxsize=cfg.max_size,
+            pool_recycle=cfg.max_idle_time or -1,
+            autocommit=True,
+            **self.dsn_to_dict(self._dsn),
+        )
+        # The handshake reports the server version, which picks the upsert syntax.
+        async with self.acquire() as conn:
+            self._dialect = MySQLDialect.for_server(conn.get_server_info())
         self.is_connected = True
 
     async def close(self) -> None:
-        if self._conn is None:
+        if self._pool is None:
             raise Exception("Connection is already closed")
-        self._conn.close()  # MySQL driver still uses regular sync style for closing connection
+        await asyncio.gather(*self._kills, return_exceptions=True)
+        self._pool.close()  # MySQL driver still uses regular sync style for closing the pool
+        await self._pool.wait_closed()
+        self._pool = None
         self.is_connected = False
 
-    async def execute(self, query: str, *args):
-        if self._conn is None:
+    async def _acquire_connection(self) -> aiomysql.Connection:
+        """Wait for a free slot, then take a connection from the aiomysql pool.
+
+        aiomysql only wakes its waiters when a live connection is released, so
+        a task queued inside ``pool.acquire()`` would sleep through a retired
+        (closed) one. Queueing on :attr:`_slots` instead means the pool is only
+        entered when it has room to hand out or open a connection.
+        """
+        if self._pool is None:
             raise Exception("Connection is not established")
+        await self._slots.acquire()
+        try:
+            conn = await self._pool.acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        if conn not in self._born:
+            # First checkout of a new connection: apply per-session settings.
+            self._born[conn] = time.monotonic()
+            try:
+                if not self.multi_statements:
+                    await _disable_multi_statements(conn)
+                if self.pool_config.session_init:
+                    async with conn.cursor() as cursor:
+                        for statement in self.pool_config.session_init:
+                            await cursor.execute(statement)
+            except BaseException:
+                conn.close()
+                await self._release_connection(conn)
+                raise
+        return conn
+
+    async def _warm_connection(self, conn: aiomysql.Connection) -> None:
+        """Round-trip a ping; aiomysql keeps no server-side statement cache to prime."""
+        await conn.ping(reconnect=False)
+
+    async def _release_connection(self, conn: aiomysql.Connection) -> None:
+        if self._pool is None:
+            self._slots.release()
+            return
+        queries = self._queries.get(conn, 0) + 1
+        self._queries[conn] = queries
+        if not conn.closed and self._should_recycle(self._born.get(conn), queries):
+            self.pool_stats.recycled += 1
+            conn.close()
+        try:
+            # A closed connection is dropped by the pool instead of reused.
+            await self._pool.release(conn)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def _cursor(
+        self, conn: aiomysql.Connection, cursor_class: type[aiomysql.Cursor]
+    ) -> AsyncIterator[aiomysql.Cursor]:
+        """Open a cursor, closing it afterwards unless :meth:`_abandon` closed ``conn``."""
+        cursor = await conn.cursor(cursor_class)
+        try:
+            yield cursor
+        finally:
+            if not conn.closed:
+                await cursor.close()
+
+    async def _guard(self, conn: aiomysql.Connection, operation: Awaitable[R]) -> R:
+        """Await ``operation`` on ``conn``, abandoning ``conn`` if it is cancelled.
+
+        Draining a half-read result after cancellation (e.g. by the client
+        deadline) could block or leave the protocol out of sync, so the
+        connection is closed instead (the pool drops it) and the statement is
+        killed on the server.
+        """
+        try:
+            return await operation
+        except asyncio.CancelledError:
+            self._abandon(conn)
+            raise
+
+    async def _rollback(self, conn: aiomysql.Connection) -> None:
+        """Roll back a transaction that a failed statement left open on ``conn``.
+
+        Otherwise the pool would hand the transaction, and its row locks, to the
+        next caller. If the rollback fails too, ``conn`` is closed instead.
+        """
+        if conn.closed or not conn.get_transaction_status():
+            return
+        try:
+            await conn.rollback()
+        except Exception:
+            conn.close()
+
+    def _abandon(self, conn: aiomysql.Connection) -> None:
+        """Close ``conn`` and send ``KILL QUERY`` for its statement in the background."""
+        thread_id = conn.thread_id()
+        conn.close()
+        task = asyncio.create_task(self._kill_query(thread_id))
+        self._kills.add(task)
+        task.add_done_callback(self._kills.discard)
+
+    async def _kill_query(self, thread_id: int) -> None:
+        """Best effort: stop the server working on a cancelled statement."""
+        try:
+            conn = await aiomysql.connect(**self.dsn_to_dict(self._dsn))
+            try:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(f"KILL QUERY {int(thread_id)}")
+            finally:
+                conn.close()
+        except Exception:
+            logger.warning("Could not kill query on MySQL thread %s", thread_id, exc_info=True)
+
+    def _hint(self, query: str, timeout: float | None) -> str:
+        """Add a ``MAX_EXECUTION_TIME`` optimizer hint to a ``SELECT``.
+
+        MySQL only enforces the limit for ``SELECT``; other statements rely on
+        the client deadline and ``KILL QUERY``. MariaDB ignores the hint.
+        """
+        if timeout is None or not is_read(query):
+            return query
+        body = query.lstrip()[len("SELECT") :]
+        return f"SELECT /*+ MAX_EXECUTION_TIME({milliseconds(timeout)}) */{body}"
+
+    def _is_server_timeout(self, exc: Exception) -> bool:
+        return bool(exc.args) and exc.args[0] == ER_QUERY_TIMEOUT
+
+    async def _call(
+        self,
+        query: str,
+        args: tuple[Any, ...],
+        result: Callable[[aiomysql.Cursor], Awaitable[R]],
+        cursor_class: type[aiomysql.Cursor] = aiomysql.Cursor,
+        *,
+        read: bool | None = None,
+        statements: int = 1,
+    ) -> R:
+        """Run one statement on a freshly acquired connection, retrying transient errors.
+
+        ``result`` reads the outcome off the cursor once the statement ran.
+        ``read`` overrides the retry classification derived from ``query``.
+        ``statements > 1`` marks an already-hinted multi-statement ``query``; the
+        client deadline then allows :meth:`_timeout` for each of them.
+        """
+        timeout = self._timeout()
+        budget = None if timeout is None else timeout * statements
+        if statements == 1:
+            query = self._hint(query, timeout)
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor() as cursor:
+
+        async def run(cursor: aiomysql.Cursor) -> R:
             await cursor.execute(query, args)
-            return cursor.rowcount
+            return await result(cursor)
+
+        return await self._on_connection(
+            run, cursor_class, budget, read=is_read(query) if read is None else read
+        )
+
+    async def _on_connection(
+        self,
+        run: Callable[[aiomysql.Cursor], Awaitable[R]],
+        cursor_class: type[aiomysql.Cursor],
+        budget: float | None,
+        *,
+        read: bool,
+    ) -> R:
+        """Await ``run`` on a cursor of a freshly acquired connection, retrying transient errors.
+
+        ``budget`` is the client deadline. If ``run`` fails, a transaction it left
+        open is rolled back before the connection goes back to the pool.
+        """
+
+        async def attempt() -> R:
+            async with self.acquire() as conn:
+                try:
+                    async with self._cursor(conn, cursor_class) as cursor:
+                        return await self._bounded(budget, lambda: self._guard(conn, run(cursor)))
+                except Exception:
+                    await self._rollback(conn)
+                    raise
+
+        return await self._retrying(attempt, read=read)
+
+    async def execute(self, query: str, *args):
+        return await self._call(query, args, _rowcount)
 
     async def fetch(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
-        if self._debug:
-            logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(query, args)
-            return await cursor.fetchall()
+        return await self._call(query, args, _fetchall, aiomysql.DictCursor)
 
     async def fetchrow(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
+        return await self._call(query, args, _fetchone, aiomysql.DictCursor)
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        """Fetch with a plain tuple ``Cursor``; names come once from ``cursor.description``."""
+        return await self._call(query, args, _columns_and_rows)
+
+    async def run_batch(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Send every statement in one multi-statement round trip.
+
+        The statements are joined with ``;`` and their arguments concatenated;
+        each result set is then read in order with ``nextset()``. If one of them
+        fails, a transaction the batch opened is rolled back. Without
+        :attr:`multi_statements` the statements run one by one, as in the base
+        class.
+        """
+        if not statements:
+            return []
+        if not self.multi_statements:
+            return await super().run_batch(statements)
+        timeout = self._timeout()
+        query = "; ".join(self._hint(sql, timeout) for sql, _, _ in statements)
+        args = tuple(arg for _, stmt_args, _ in statements for arg in stmt_args)
+
+        async def results(cursor: aiomysql.Cursor) -> list[Any]:
+            collected: list[Any] = []
+            for index, (_, _, kind) in enumerate(statements):
+                collected.append(await _READERS[kind](cursor))
+                if index < len(statements) - 1:
+                    await cursor.nextset()
+            return collected
+
+        return await self._call(
+            query,
+            args,
+            results,
+            aiomysql.DictCursor,
+            read=all(is_read(sql) for sql, _, _ in statements),
+            statements=len(statements),
+        )
+
+    async def run_transaction(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run the statements between ``START TRANSACTION`` and ``COMMIT`` on one connection.
+
+        With :attr:`multi_statements` they go out as one :meth:`run_batch`;
+        otherwise one round trip each on a held connection. Either way a failed
+        statement rolls the transaction back.
+        """
+        batch: list[tuple[str, tuple[Any, ...], BatchKind]] = [
+            (self.dialect.begin_transaction, (), "execute"),
+            *statements,
+            ("COMMIT", (), "execute"),
+        ]
+        if self.multi_statements:
+            return (await self.run_batch(batch))[1:-1]
+        timeout = self._timeout()
+        budget = None if timeout is None else timeout * len(batch)
         if self._debug:
-            logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor(aiomysql.DictCursor) as cursor:
-            await cursor.execute(query, args)
-            return await cursor.fetchone()
+            for query, args, _ in batch:
+                logger.debug(f"SQL: {query} - {args}")
 
-    async def update(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
+        async def run(cursor: aiomysql.Cursor) -> list[Any]:
+            collected: list[Any] = []
+            for query, args, kind in batch:
+                await cursor.execute(self._hint(query, timeout), args)
+                collected.append(await _READERS[kind](cursor))
+            return collected[1:-1]
+
+        return await self._on_connection(run, aiomysql.DictCursor, budget, read=False)
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = constants.DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        """Yield rows in chunks from an unbuffered ``SSDictCursor``.
+
+        The server streams the result set over the connection, which stays
+        checked out until the stream is exhausted or closed. :meth:`_timeout`
+        bounds each chunk on the client; no server hint is added, as it would
+        also count the time spent waiting on the consumer.
+
+        Closing the stream early abandons the connection: closing an
+        unbuffered cursor would read (and discard) the rest of the result.
+        """
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor() as cursor:
-            await cursor.execute(query, args)
-            return cursor.rowcount
+        timeout = self._timeout()
+        async with self.acquire() as conn, self._cursor(conn, aiomysql.SSDictCursor) as cursor:
+            await self._bounded(timeout, lambda: self._guard(conn, cursor.execute(query, args)))
+            while rows := await self._bounded(
+                timeout, lambda: self._guard(conn, cursor.fetchmany(chunk_size))
+            ):
+                try:
+                    yield rows
+                except BaseException:
+                    self._abandon(conn)
+                    raise
+
+    async def update(self, query: str, *args):
+        return await self._call(query, args, _rowcount)
 
     async def execute_insert(self, query: str, *args):
         """Run an ``INSERT`` and return the auto-increment PK via ``lastrowid``.
@@ -113,19 +481,51 @@ class MySQLDatabase(BaseDatabase):
         MySQL has no ``RETURNING`` clause; the generated primary key is taken
         from ``cursor.lastrowid``. Assumes a single integer auto-increment PK.
         """
-        if self._conn is None:
-            raise Exception("Connection is not established")
-        if self._debug:
-            logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor() as cursor:
-            await cursor.execute(query, args)
-            return cursor.lastrowid
+        return await self._call(query, args, _lastrowid)
 
     async def execute_returning_rowcount(self, query: str, *args) -> int:
-        if self._conn is None:
-            raise Exception("Connection is not established")
-        if self._debug:
-            logger.debug(f"SQL: {query} - {args}")
-        async with self._conn.cursor() as cursor:
-            await cursor.execute(query, args)
-            return int(cursor.rowcount)
+        return await self._call(query, args, _rowcount)
+
+
+async def _disable_multi_statements(conn: aiomysql.Connection) -> None:
+    """Turn the session's multi-statement mode off with ``COM_SET_OPTION``.
+
+    aiomysql always sets ``CLIENT.MULTI_STATEMENTS`` in the handshake, so the
+    mode can only be switched off once connected. aiomysql has no public call
+    for the command; the server answers with a bare OK/EOF packet.
+    """
+    await conn._execute_command(
+        COMMAND.COM_SET_OPTION, struct.pack("<H", _MYSQL_OPTION_MULTI_STATEMENTS_OFF)
+    )
+    await conn._read_packet()
+
+
+async def _rowcount(cursor: aiomysql.Cursor) -> int:
+    return int(cursor.rowcount)
+
+
+async def _lastrowid(cursor: aiomysql.Cursor) -> Any:
+    return cursor.lastrowid
+
+
+async def _fetchall(cursor: aiomysql.Cursor) -> Any:
+    return await cursor.fetchall()
+
+
+async def _fetchone(cursor: aiomysql.Cursor) -> Any:
+    return await cursor.fetchone()
+
+
+async def _columns_and_rows(
+    cursor: aiomysql.Cursor,
+) -> tuple[list[str], Sequence[Sequence[Any]]]:
+    columns = [column[0] for column in cursor.description or ()]
+    return columns, await cursor.fetchall()
+
+
+#: How :meth:`MySQLDatabase.run_batch` reads each :data:`BatchKind`.
+_READERS: dict[str, Callable[[aiomysql.Cursor], Awaitable[Any]]] = {
+    "fetch": _fetchall,
+    "fetchrow": _fetchone,
+    "execute": _rowcount,
+}
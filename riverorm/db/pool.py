@@ -0,0 +1,82 @@
+"""Connection-pool configuration and observability shared by all backends.
+
+Every backend checks a driver connection out of a pool for each statement (see
+:meth:`riverorm.db.base.BaseDatabase.acquire`) instead of sharing one
+connection for the whole process. :class:`PoolConfig` describes how the pool is
+sized and recycled; :class:`PoolStats` exposes acquire wait times and
+saturation so the pool can be sized from real traffic.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+class PoolTimeoutError(TimeoutError):
+    """Raised when no pooled connection became free within ``acquire_timeout``."""
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Sizing and recycling rules for a backend's connection pool.
+
+    ``None`` disables the corresponding limit. Recycling limits are enforced on
+    release: a connection past ``max_lifetime`` seconds or ``max_queries``
+    statements is closed instead of being returned to the pool, and one idle
+    for longer than ``max_idle_time`` seconds is closed by the pool.
+
+    ``session_init`` statements (e.g. ``SET TIME ZONE 'UTC'``) run once on every
+    new connection. ``warm_up`` statements are prepared on each of the
+    ``min_size`` pre-opened connections by
+    :meth:`~riverorm.db.base.BaseDatabase.warm_up`, so the first requests skip
+    parsing and planning (backends without a statement cache ignore them).
+    """
+
+    min_size: int = 1
+    max_size: int = 10
+    acquire_timeout: float | None = None
+    max_idle_time: float | None = 300.0
+    max_lifetime: float | None = None
+    max_queries: int | None = None
+    session_init: tuple[str, ...] = ()
+    warm_up: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.min_size < 0:
+            raise ValueError("PoolConfig.min_size must be >= 0")
+        if self.max_size < 1 or self.max_size < self.min_size:
+            raise ValueError("PoolConfig.max_size must be >= 1 and >= min_size")
+        for name in ("acquire_timeout", "max_idle_time", "max_lifetime", "max_queries"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"PoolConfig.{name} must be positive or None")
+
+
+@dataclass
+class PoolStats:
+    """Live counters describing how a pool is being used.
+
+    ``in_use`` and ``waiting`` are gauges; the remaining fields are cumulative
+    since the pool was created. Wait times are in seconds and measure how long
+    :meth:`~riverorm.db.base.BaseDatabase.acquire` blocked before a connection
+    was handed out.
+    """
+
+    max_size: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    acquired: int = 0
+    timeouts: int = 0
+    recycled: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Mean acquire wait over all successful acquisitions."""
+        return self.wait_time_total / self.acquired if self.acquired else 0.0
+
+    @property
+    def saturation(self) -> float:
+        """Fraction of ``max_size`` currently checked out (``1.0`` = exhausted)."""
+        return self.in_use / self.max_size if self.max_size else 0.0
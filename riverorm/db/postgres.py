@@ -1,26 +1,169 @@
 from __future__ import annotations
 
 import logging
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterable, Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar
 
 import asyncpg
+from asyncpg.exceptions import (
+    InvalidCachedStatementError,
+    OutdatedSchemaCacheError,
+    QueryCanceledError,
+)
+from asyncpg.prepared_stmt import PreparedStatement
 
+from riverorm import constants
 from riverorm.sql import Dialect, PostgresDialect
 
-from .base import BaseDatabase
+from .base import BaseDatabase, BatchKind, is_read
+from .breaker import BreakerPolicy, CircuitBreaker
+from .codecs import CodecRegistry
+from .pool import PoolConfig, PoolStats
+from .retry import RetryPolicy, RetryStats
+from .timeout import milliseconds
+from .url import SERVER_OPTIONS, Options
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StatementCacheStats:
+    """Prepared-statement cache counters, aggregated over all pooled connections."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class StatementCache:
+    """LRU of prepared statements for one connection, keyed by SQL text.
+
+    Statements are prepared on the raw connection (never a pool proxy) so they
+    stay valid across acquire/release cycles of that connection.
+    """
+
+    def __init__(self, conn: asyncpg.Connection, max_size: int, stats: StatementCacheStats):
+        self._conn = conn
+        self._max_size = max_size
+        self._stats = stats
+        self._entries: OrderedDict[str, PreparedStatement] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, query: str) -> PreparedStatement:
+        """Return the prepared statement for ``query``, preparing it on a miss."""
+        stmt = self._entries.get(query)
+        if stmt is not None:
+            self._entries.move_to_end(query)
+            self._stats.hits += 1
+            return stmt
+        self._stats.misses += 1
+        stmt = await self._conn.prepare(query)
+        self._entries[query] = stmt
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+        return stmt
+
+    async def run(self, query: str, args: tuple[Any, ...], method: str) -> Any:
+        """Execute ``query`` as ``fetch``/``fetchrow``/``execute`` via its prepared statement.
+
+        ``execute`` returns the command status string (e.g. ``"UPDATE 2"``),
+        matching :meth:`asyncpg.Connection.execute`.
+        """
+        stmt = await self.get(query)
+        if method == "execute":
+            await stmt.fetch(*args)
+            return stmt.get_statusmsg()
+        return await getattr(stmt, method)(*args)
+
+    def clear(self) -> None:
+        """Drop every cached statement (e.g. after DDL invalidated their plans)."""
+        self._entries.clear()
+        self._stats.invalidations += 1
+
+
+class _CachingConnection(asyncpg.Connection):
+    """asyncpg connection carrying its own :class:`StatementCache`."""
+
+    statement_cache: StatementCache | None = None
+
+
 class PostgresDatabase(BaseDatabase):
-    _conn: asyncpg.Connection | None
+    _pool: asyncpg.Pool | None
     _debug: bool
     _dsn: str
     _dialect: Dialect = PostgresDialect()
+    url_options: ClassVar[Options] = {
+        **SERVER_OPTIONS,
+        "statement_cache": ("statement_cache_size", int),
+        "connect_timeout": ("connect_timeout", float),
+    }
+    # Connection parameters asyncpg reads from the DSN itself.
+    driver_options: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sslmode",
+            "sslrootcert",
+            "sslcert",
+            "sslkey",
+            "sslpassword",
+            "sslcrl",
+            "ssl_min_protocol_version",
+            "ssl_max_protocol_version",
+            "target_session_attrs",
+            "application_name",
+        }
+    )
 
-    def __init__(self, dsn: str, debug: bool = False):
-        self._conn = None
+    def __init__(
+        self,
+        dsn: str,
+        debug: bool = False,
+        pool: PoolConfig | None = None,
+        statement_cache_size: int = 100,
+        retry: RetryPolicy | None = None,
+        statement_timeout: float | None = None,
+        codecs: CodecRegistry | None = None,
+        connect_timeout: float = 60.0,
+        breaker: BreakerPolicy | None = None,
+    ):
+        if statement_cache_size < 0:
+            raise ValueError("statement_cache_size must be >= 0")
+        if statement_timeout is not None and statement_timeout <= 0:
+            raise ValueError("statement_timeout must be positive or None")
+        if connect_timeout <= 0:
+            raise ValueError("connect_timeout must be positive")
+        self._pool = None
         self._debug = debug
         self._dsn = dsn
+        self.pool_config = pool or PoolConfig()
+        self.pool_stats = PoolStats(max_size=self.pool_config.max_size)
+        # Server PID -> monotonic birth time, used to enforce ``max_lifetime``
+        # (asyncpg only recycles on idle time and query count natively).
+        self._born: dict[int, float] = {}
+        #: Per-connection prepared-statement LRU size; ``0`` disables it.
+        self.statement_cache_size = statement_cache_size
+        self.statement_cache_stats = StatementCacheStats()
+        self.retry_policy = retry or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.statement_timeout = statement_timeout
+        self.breaker = CircuitBreaker(breaker) if breaker is not None else None
+        #: Type codecs installed on every new connection (JSON decoded in the driver).
+        self.codecs = CodecRegistry.default() if codecs is None else codecs
+        #: Seconds to wait for each new connection to be established.
+        self.connect_timeout = connect_timeout
         if debug:
             logger.setLevel(logging.DEBUG)
         else:
@@ -31,42 +174,251 @@ class PostgresDatabase(BaseDatabase):
         return self._dialect
 
     async def connect(self) -> None:
-        self._conn = await asyncpg.connect(self._dsn)
+        cfg = self.pool_config
+        self._pool = await asyncpg.create_pool(
+            self._dsn,
+            min_size=cfg.min_size,
+            max_size=cfg.max_size,
+            # asyncpg uses 0 for "never" and requires a positive query cap.
+            max_inactive_connection_lifetime=cfg.max_idle_time or 0,
+            max_queries=cfg.max_queries or sys.maxsize,
+            init=self._init_connection,
+            reset=self._reset_connection,
+            connection_class=_CachingConnection,
+            timeout=self.connect_timeout,
+            # Our StatementCache is the only one, so ``statement_cache_size``
+            # bounds the server-side prepared statements per connection.
+            statement_cache_size=0,
+        )
         self.is_connected = True
 
     async def close(self) -> None:
-        if self._conn is None:
+        if self._pool is None:
             raise Exception("Connection is already closed")
-        await self._conn.close()
+        await self._pool.close()
+        self._pool = None
+        self._born.clear()
         self.is_connected = False
 
-    async def execute(self, query: str, *args):
-        if self._conn is None:
+    def _session_script(self) -> str:
+        """``pool_config.session_init`` plus the default ``statement_timeout``, as one script."""
+        statements = [s.strip().rstrip(";") for s in self.pool_config.session_init]
+        if self.statement_timeout is not None:
+            statements.append(f"SET statement_timeout = {milliseconds(self.statement_timeout)}")
+        return "".join(f"{s};\n" for s in statements)
+
+    async def _init_connection(self, conn: _CachingConnection) -> None:
+        """Record when a new pooled connection was opened, install the type
+        codecs, give it a statement cache and apply the session settings."""
+        self._born[conn.get_server_pid()] = time.monotonic()
+        await self.codecs.apply(conn)
+        if self.statement_cache_size:
+            conn.statement_cache = StatementCache(
+                conn, self.statement_cache_size, self.statement_cache_stats
+            )
+        if script := self._session_script():
+            await conn.execute(script)
+
+    async def _reset_connection(self, conn: asyncpg.Connection) -> None:
+        """Reset a released connection and re-apply the session settings.
+
+        asyncpg's default reset runs ``RESET ALL``, which would drop
+        ``session_init`` settings and any per-query ``statement_timeout``
+        override; both are restored in the same round trip.
+        """
+        await conn.execute(conn.get_reset_query() + "\n" + self._session_script())
+
+    async def _warm_connection(self, conn: Any) -> None:
+        """Prepare ``pool_config.warm_up`` into the connection's statement cache."""
+        cache: StatementCache | None = conn.statement_cache
+        if cache is None:
+            return
+        for query in self.pool_config.warm_up:
+            await cache.get(query)
+
+    async def _acquire_connection(self) -> asyncpg.Connection:
+        if self._pool is None:
             raise Exception("Connection is not established")
+        return await self._pool.acquire()
+
+    async def _release_connection(self, conn: asyncpg.Connection) -> None:
+        if self._pool is None:
+            return
+        pid = conn.get_server_pid()
+        if self._should_recycle(self._born.get(pid), 0):
+            # Closing a pooled proxy releases its slot; the pool reconnects
+            # lazily on the next acquire.
+            self._born.pop(pid, None)
+            self.pool_stats.recycled += 1
+            await conn.close()
+            return
+        await self._pool.release(conn)
+
+    async def _run(self, conn: Any, query: str, args: tuple[Any, ...], method: str) -> Any:
+        """Run ``query`` on ``conn`` through its prepared-statement cache.
+
+        Argument-less ``execute`` calls (DDL, multi-statement scripts) bypass the
+        cache. A plan invalidated by DDL clears the connection's cache and the
+        statement is re-prepared once.
+        """
+        cache: StatementCache | None = conn.statement_cache
+        if cache is None or (method == "execute" and not args):
+            return await getattr(conn, method)(query, *args)
+        try:
+            return await cache.run(query, args, method)
+        except (InvalidCachedStatementError, OutdatedSchemaCacheError):
+            cache.clear()
+            return await cache.run(query, args, method)
+
+    async def _override_timeout(self, conn: Any, timeout: float | None, scope: str = "") -> None:
+        """Set ``statement_timeout`` on ``conn`` if ``timeout`` differs from the default.
+
+        A session-level override is undone by :meth:`_reset_connection` when
+        the connection is released; pass ``scope="LOCAL"`` inside a transaction.
+        """
+        if timeout is None or timeout == self.statement_timeout:
+            return
+        setting = f"statement_timeout = {milliseconds(timeout)}"
+        await conn.execute(f"SET {scope} {setting}" if scope else f"SET {setting}")
+
+    def _is_server_timeout(self, exc: Exception) -> bool:
+        return isinstance(exc, QueryCanceledError)
+
+    async def _call(self, query: str, args: tuple[Any, ...], method: str) -> Any:
+        """Run one statement on a freshly acquired connection, retrying transient errors.
+
+        The statement is bounded by :meth:`_timeout` on the server and the
+        client. A cancelled call makes asyncpg send a cancel request, and the
+        pool waits for it to land before the connection is reused.
+        """
+        timeout = self._timeout()
+
+        async def attempt() -> Any:
+            async with self.acquire() as conn:
+
+                async def run() -> Any:
+                    await self._override_timeout(conn, timeout)
+                    return await self._run(conn, query, args, method)
+
+                return await self._bounded(timeout, run)
+
+        return await self._retrying(attempt, read=is_read(query))
+
+    async def execute(self, query: str, *args):
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        return await self._conn.execute(query, *args)
+        return await self._call(query, args, "execute")
 
     async def fetch(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        return await self._conn.fetch(query, *args)
+        return await self._call(query, args, "fetch")
 
     async def fetchrow(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        return await self._conn.fetchrow(query, *args)
+        return await self._call(query, args, "fetchrow")
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        """asyncpg ``Record``s already index by position, so they are returned as is."""
+        rows = await self.fetch(query, *args)
+        return (list(rows[0].keys()) if rows else []), rows
+
+    async def run_batch(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run the statements back to back on one pooled connection.
+
+        asyncpg has no public multi-statement pipeline for parameterized
+        queries, so this saves the per-statement pool checkout and, through the
+        statement cache, the parse/plan round trip of repeated shapes. The
+        server limits each statement to :meth:`_timeout`; the client deadline
+        allows that much per statement for the whole batch.
+        """
+        return await self._run_all(statements, transaction=False)
+
+    async def run_transaction(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run the statements like :meth:`run_batch`, inside ``conn.transaction()``."""
+        return await self._run_all(statements, transaction=True)
+
+    async def _run_all(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]], *, transaction: bool
+    ) -> list[Any]:
+        if self._debug:
+            for query, args, _ in statements:
+                logger.debug(f"SQL: {query} - {args}")
+        timeout = self._timeout()
+        budget = None if timeout is None else timeout * max(len(statements), 1)
+
+        async def attempt() -> list[Any]:
+            async with self.acquire() as conn:
+
+                async def run() -> list[Any]:
+                    await self._override_timeout(conn, timeout, "LOCAL" if transaction else "")
+                    return [
+                        await self._run(conn, query, args, kind) for query, args, kind in statements
+                    ]
+
+                if not transaction:
+                    return await self._bounded(budget, run)
+                async with conn.transaction():
+                    return await self._bounded(budget, run)
+
+        return await self._retrying(attempt, read=all(is_read(q) for q, _, _ in statements))
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = constants.DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        """Yield rows in chunks from a server-side cursor.
+
+        asyncpg cursors only live inside a transaction, so the connection stays
+        checked out (in a read-only transaction) until the stream is exhausted
+        or closed. :meth:`_timeout` bounds each chunk, not the whole stream.
+        """
+        if self._debug:
+            logger.debug(f"SQL: {query} - {args}")
+        timeout = self._timeout()
+        async with self.acquire() as conn, conn.transaction(readonly=True):
+            await self._override_timeout(conn, timeout, "LOCAL")
+            cursor = await self._bounded(timeout, lambda: conn.cursor(query, *args))
+            while rows := await self._bounded(timeout, lambda: cursor.fetch(chunk_size)):
+                yield rows
+
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: AsyncIterable[tuple[Any, ...]],
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Bulk-load ``records`` with binary ``COPY ... FROM STDIN``.
+
+        asyncpg pulls from the async iterable as it writes, so memory stays
+        bounded without batching; ``batch_size`` is accepted for interface
+        parity and ignored.
+        """
+        if self._debug:
+            logger.debug(f"COPY {table} ({', '.join(columns)})")
+        copied = 0
+
+        async def counted() -> AsyncGenerator[tuple[Any, ...], None]:
+            nonlocal copied
+            async for record in records:
+                copied += 1
+                yield record
+
+        async with self.acquire() as conn:
+            await conn.copy_records_to_table(table, records=counted(), columns=list(columns))
+        return copied
 
     async def update(self, query: str, *args):
-        if self._conn is None:
-            raise Exception("Connection is not established")
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        return await self._conn.execute(query, *args)
+        return await self._call(query, args, "execute")
 
     async def execute_insert(self, query: str, *args):
         """Run an ``INSERT ... RETURNING`` and return the generated PK value.
@@ -74,20 +426,16 @@ class PostgresDatabase(BaseDatabase):
         Postgres supports ``RETURNING``, so the caller is expected to append a
         ``RETURNING`` clause; the first returned column is the new primary key.
         """
-        if self._conn is None:
-            raise Exception("Connection is not established")
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
-        row = await self._conn.fetchrow(query, *args)
+        row = await self._call(query, args, "fetchrow")
         return next(iter(row.values())) if row else None
 
     async def execute_returning_rowcount(self, query: str, *args) -> int:
-        if self._conn is None:
-            raise Exception("Connection is not established")
         if self._debug:
             logger.debug(f"SQL: {query} - {args}")
         # asyncpg returns a status string like "DELETE 3" or "UPDATE 2"
-        status: str = await self._conn.execute(query, *args)
+        status: str = await self._call(query, args, "execute")
         try:
             return int(status.split()[-1])
         except (ValueError, IndexError):
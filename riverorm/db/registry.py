@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
 from riverorm.db import BaseDatabase
+from riverorm.db.lanes import current_lane
+from riverorm.db.routing import ReplicaPolicy, RoundRobinPolicy
+from riverorm.db.sharding import ShardMap
+from riverorm.db.url import parse_url
+
+if TYPE_CHECKING:
+    from riverorm.batch import Batch
+
+
+logger = logging.getLogger(__name__)
 
 
 class DatabaseRegistryError(Exception):
@@ -11,21 +27,106 @@ class DatabaseRegistryError(Exception):
 
 class DatabaseRegistry:
     _connections: dict[str, BaseDatabase] = {}
+    _replicas: dict[str, list[BaseDatabase]] = {}
+    _policies: dict[str, ReplicaPolicy] = {}
+    _lanes: dict[str, dict[str, BaseDatabase]] = {}
+    _shards: dict[str, ShardMap] = {}
     _default: str | None = None
 
     @classmethod
-    def register(cls, alias: str, db_instance: BaseDatabase):
+    def register(
+        cls,
+        alias: str,
+        db_instance: BaseDatabase,
+        *,
+        replicas: Sequence[BaseDatabase] = (),
+        policy: ReplicaPolicy | None = None,
+        lanes: Mapping[str, BaseDatabase] | None = None,
+    ):
         """
         Register a database instance with a given alias.
 
+        ``db_instance`` is the primary. Optional ``replicas`` serve reads for
+        the alias, balanced by ``policy`` (round-robin by default); writes always
+        go to the primary. Optional ``lanes`` map lane names to backends with
+        their own pools, used inside :func:`~riverorm.db.lanes.lane` scopes
+        (see :meth:`register_lane`).
+
         The first registered instance becomes the default if no default is set.
         """
         if alias in cls._connections:
             raise DatabaseRegistryError(f"DB alias '{alias}' is already registered.")
         cls._connections[alias] = db_instance
+        if replicas:
+            cls._replicas[alias] = list(replicas)
+            cls._policies[alias] = policy or RoundRobinPolicy()
+        for name, db in (lanes or {}).items():
+            cls.register_lane(alias, name, db)
         if cls._default is None:
             cls._default = alias
 
+    @classmethod
+    def register_lane(cls, alias: str, name: str, db_instance: BaseDatabase):
+        """
+        Serve every statement for ``alias`` issued inside ``lane(name)`` with ``db_instance``.
+
+        ``db_instance`` should point at the same database as the alias' primary;
+        its pool size caps how many connections work in that lane can hold.
+        """
+        if alias not in cls._connections:
+            raise DatabaseRegistryError(f"DB alias '{alias}' is not registered.")
+        if not name:
+            raise DatabaseRegistryError("Lane name must be a non-empty string.")
+        lanes = cls._lanes.setdefault(alias, {})
+        if name in lanes:
+            raise DatabaseRegistryError(f"Lane '{name}' is already registered for '{alias}'.")
+        lanes[name] = db_instance
+
+    @classmethod
+    def lanes(cls, alias: str | None = None) -> dict[str, BaseDatabase]:
+        """Return the lanes registered for ``alias`` (or the default), by name."""
+        if alias is None:
+            alias = cls._default
+        return dict(cls._lanes.get(alias, {})) if alias is not None else {}
+
+    @classmethod
+    def from_url(cls, url: str, alias: str | None = None, **kwargs: Any) -> BaseDatabase:
+        """
+        Build the backend described by ``url``, registering it as ``alias`` if given.
+
+        The scheme selects the backend and the query string carries pool,
+        timeout and driver options, e.g.
+        ``postgresql+pool://db/app?min_size=5&max_size=50&statement_cache=500&timeout=2``
+        (see :mod:`riverorm.db.url` for every option). Unknown options raise
+        ``ValueError``. ``kwargs`` are passed to the backend's constructor and
+        win over options from the URL (e.g. ``codecs=`` or ``retry=``).
+        """
+        backend, dsn, options = parse_url(url)
+        db = backend(dsn, **{**options, **kwargs})
+        if alias is not None:
+            cls.register(alias, db)
+        return db
+
+    @classmethod
+    def register_shards(cls, alias: str, shard_map: ShardMap):
+        """
+        Register a shard group: ``alias`` names a set of already (or later)
+        registered connections, and ``shard_map`` routes shard-key values to them.
+
+        Models select the group with ``Meta.db_alias = alias`` plus
+        ``Meta.shard_key``.
+        """
+        if alias in cls._connections or alias in cls._shards:
+            raise DatabaseRegistryError(f"DB alias '{alias}' is already registered.")
+        cls._shards[alias] = shard_map
+
+    @classmethod
+    def shard_map(cls, alias: str | None) -> ShardMap:
+        """Return the :class:`ShardMap` registered as ``alias``."""
+        if alias is None or alias not in cls._shards:
+            raise DatabaseRegistryError(f"No shard group registered for alias '{alias}'.")
+        return cls._shards[alias]
+
     @classmethod
     def set_default(cls, alias: str):
         """Set the default database connection by its alias."""
@@ -34,32 +135,123 @@ class DatabaseRegistry:
         cls._default = alias
 
     @classmethod
-    def get(cls, alias: str | None = None) -> BaseDatabase:
-        """Retrieve a database instance by its alias or the default if alias is None."""
+    def get(cls, alias: str | None = None, *, read: bool = False) -> BaseDatabase:
+        """Retrieve a database instance by its alias or the default if alias is None.
+
+        With ``read=True`` a replica chosen by the alias' policy is returned when
+        the alias has replicas; otherwise (and always for writes) the primary.
+        Inside a :func:`~riverorm.db.lanes.lane` scope naming one of the alias'
+        lanes, that lane's backend is returned for reads and writes alike.
+        """
         if not cls._connections:
             raise DatabaseRegistryError("No database connections registered.")
         if alias is None:
             alias = cls._default
         if alias is None or alias not in cls._connections:
             raise DatabaseRegistryError(f"No database connection found for alias '{alias}'.")
+        name = current_lane()
+        if name is not None:
+            lane_db = cls._lanes.get(alias, {}).get(name)
+            if lane_db is not None:
+                return lane_db
+        if read:
+            replicas = cls._replicas.get(alias)
+            if replicas:
+                return cls._policies[alias].choose(replicas)
         return cls._connections[alias]
 
+    @classmethod
+    def pipeline(cls, alias: str | None = None) -> Batch:
+        """Start a :class:`~riverorm.batch.Batch` pinned to ``alias`` (or the default)."""
+        from riverorm.batch import Batch
+
+        return Batch(alias if alias is not None else cls._default)
+
+    @classmethod
+    def replicas(cls, alias: str | None = None) -> list[BaseDatabase]:
+        """Return the read replicas registered for ``alias`` (or the default)."""
+        if alias is None:
+            alias = cls._default
+        return list(cls._replicas.get(alias, ())) if alias is not None else []
+
     @classmethod
     def clear(cls):
         """Clear all registered database connections and reset the default."""
         cls._connections.clear()
+        cls._replicas.clear()
+        cls._policies.clear()
+        cls._lanes.clear()
+        cls._shards.clear()
         cls._default = None
 
     @classmethod
-    async def connect(cls):
-        """Connect all registered database instances."""
-        for db in cls._connections.values():
-            if not db.is_connected:
-                await db.connect()
+    def _databases(cls) -> dict[str, BaseDatabase]:
+        """Every registered primary and replica, each once, keyed by a display label.
+
+        Primaries are labelled by alias, replicas as ``"<alias>.replica<n>"`` and
+        lanes as ``"<alias>.lane.<name>"``.
+        """
+        labelled: dict[str, BaseDatabase] = {}
+        seen: set[int] = set()
+        for alias, primary in cls._connections.items():
+            replicas = cls._replicas.get(alias, ())
+            entries = [
+                (alias, primary),
+                *((f"{alias}.replica{i}", r) for i, r in enumerate(replicas)),
+                *((f"{alias}.lane.{name}", db) for name, db in cls._lanes.get(alias, {}).items()),
+            ]
+            for label, db in entries:
+                if id(db) not in seen:
+                    seen.add(id(db))
+                    labelled[label] = db
+        return labelled
+
+    @classmethod
+    async def _run_all(
+        cls, step: Callable[[BaseDatabase], Awaitable[None]], targets: dict[str, BaseDatabase]
+    ) -> dict[str, float]:
+        """Run ``step`` on every target concurrently and time each one.
+
+        All steps run to completion; the first failure is then re-raised.
+        """
+
+        async def timed(db: BaseDatabase) -> float:
+            started = time.perf_counter()
+            await step(db)
+            return time.perf_counter() - started
+
+        results = await asyncio.gather(
+            *(timed(db) for db in targets.values()), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return dict(zip(targets, results))  # type: ignore[arg-type]
+
+    @classmethod
+    async def connect(cls, *, warm_up: bool = False) -> dict[str, float]:
+        """Connect all registered database instances (primaries and replicas) concurrently.
+
+        With ``warm_up=True`` each backend also runs
+        :meth:`~riverorm.db.base.BaseDatabase.warm_up` once connected. Returns
+        the seconds each newly connected database took (connect plus warm-up),
+        keyed by alias (replicas as ``"<alias>.replica<n>"``, lanes as
+        ``"<alias>.lane.<name>"``).
+        """
+
+        async def open_db(db: BaseDatabase) -> None:
+            await db.connect()
+            if warm_up:
+                await db.warm_up()
+
+        pending = {label: db for label, db in cls._databases().items() if not db.is_connected}
+        latencies = await cls._run_all(open_db, pending)
+        for label, seconds in latencies.items():
+            logger.info("Connected database '%s' in %.1f ms", label, seconds * 1000)
+        return latencies
 
     @classmethod
     async def close(cls):
-        """Close all registered database connections."""
-        for db in cls._connections.values():
-            if db.is_connected:
-                await db.close()
+        """Close all registered database connections (primaries and replicas) concurrently."""
+        connected = {label: db for label, db in cls._databases().items() if db.is_connected}
+        await cls._run_all(lambda db: db.close(), connected)
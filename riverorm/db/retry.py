@@ -0,0 +1,109 @@
+"""Transient-error retries with exponential backoff for the database layer.
+
+Failovers, deadlocks, serialization failures and dropped connections are worth
+one more try: the statement usually succeeds on a fresh connection a moment
+later. :class:`RetryPolicy` decides *which* errors are transient (by SQLSTATE for
+Postgres, by error code for MySQL) and *how long* to back off between attempts;
+:class:`RetryStats` counts what happened so retries can be alerted on.
+
+Only ``SELECT`` statements are retried by default. A write may have been applied
+before the error surfaced, so writes are retried only inside
+:func:`retry_writes`, where the caller vouches that they are idempotent::
+
+    with retry_writes():
+        await Order.objects.filter(id=order_id).update(status="paid")
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+#: Postgres SQLSTATEs treated as transient: connection exceptions (class 08),
+#: serialization failure, deadlock, and server shutdown / not-yet-accepting.
+TRANSIENT_SQLSTATES: frozenset[str] = frozenset(
+    {"08000", "08001", "08003", "08004", "08006", "40001", "40P01", "57P01", "57P03"}
+)
+
+#: MySQL error codes treated as transient: deadlock, lock wait timeout, and
+#: "server has gone away" / "lost connection" client errors.
+TRANSIENT_MYSQL_ERRORS: frozenset[int] = frozenset({1205, 1213, 2006, 2013})
+
+_retry_writes: ContextVar[bool] = ContextVar("riverorm_retry_writes", default=False)
+
+
+@contextmanager
+def retry_writes() -> Iterator[None]:
+    """Allow transient-error retries of writes issued inside the block."""
+    token = _retry_writes.set(True)
+    try:
+        yield
+    finally:
+        _retry_writes.reset(token)
+
+
+def writes_retryable() -> bool:
+    """Whether the current context opted writes into retries."""
+    return _retry_writes.get()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently to retry transient database errors.
+
+    Attempt ``n`` (1-based) that fails transiently is followed by a sleep of up
+    to ``base_delay * 2 ** (n - 1)`` seconds, capped at ``max_delay``. With
+    ``jitter`` the sleep is drawn uniformly from ``[0, cap]`` ("full jitter"),
+    so clients recovering from the same failover do not retry in lockstep.
+    ``max_attempts=1`` disables retries.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    jitter: bool = True
+    sqlstates: frozenset[str] = TRANSIENT_SQLSTATES
+    mysql_errors: frozenset[int] = TRANSIENT_MYSQL_ERRORS
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("RetryPolicy.max_attempts must be >= 1")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("RetryPolicy delays must be >= 0")
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def classify(self, exc: BaseException) -> str | None:
+        """Return a short reason (SQLSTATE / error code) if ``exc`` is transient, else ``None``."""
+        if isinstance(exc, ConnectionError):
+            return type(exc).__name__
+        sqlstate = getattr(exc, "sqlstate", None)
+        if isinstance(sqlstate, str):
+            return sqlstate if sqlstate in self.sqlstates else None
+        code = exc.args[0] if exc.args else None
+        if isinstance(code, int) and not isinstance(code, bool):
+            return str(code) if code in self.mysql_errors else None
+        return None
+
+
+@dataclass
+class RetryStats:
+    """Cumulative retry counters for one backend.
+
+    ``retries`` counts extra attempts made, ``recovered`` statements that
+    succeeded after at least one retry, and ``exhausted`` statements that still
+    failed transiently after ``max_attempts``. ``reasons`` tallies retries by
+    SQLSTATE / error code.
+    """
+
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    reasons: Counter[str] = field(default_factory=Counter)
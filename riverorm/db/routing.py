@@ -0,0 +1,59 @@
+"""Read-replica balancing policies for :class:`~riverorm.db.registry.DatabaseRegistry`.
+
+An alias may be registered as one primary plus any number of read replicas.
+``QuerySet`` reads are sent to a replica picked by the alias' policy, while
+writes always go to the primary. Policies are small stateful objects, so custom
+ones only need to implement :meth:`ReplicaPolicy.choose`.
+"""
+
+from __future__ import annotations
+
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from .base import BaseDatabase
+
+
+class ReplicaPolicy(ABC):
+    """Strategy choosing which replica serves the next read."""
+
+    @abstractmethod
+    def choose(self, replicas: Sequence[BaseDatabase]) -> BaseDatabase:
+        """Return one of ``replicas`` (never empty) for the next read."""
+        ...
+
+
+class RoundRobinPolicy(ReplicaPolicy):
+    """Cycle through the replicas in registration order."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, replicas: Sequence[BaseDatabase]) -> BaseDatabase:
+        return replicas[next(self._counter) % len(replicas)]
+
+
+class LeastOutstandingPolicy(ReplicaPolicy):
+    """Pick the replica with the fewest in-flight statements.
+
+    Outstanding work is read from each backend's
+    :attr:`~riverorm.db.base.BaseDatabase.pool_stats` (checked-out plus waiting
+    acquisitions). Ties rotate so idle replicas share the load evenly.
+    """
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def choose(self, replicas: Sequence[BaseDatabase]) -> BaseDatabase:
+        start = next(self._counter) % len(replicas)
+        ordered = [*replicas[start:], *replicas[:start]]
+        return min(ordered, key=self.outstanding)
+
+    @staticmethod
+    def outstanding(db: BaseDatabase) -> int:
+        """Statements currently running on, or queued for, ``db``'s pool."""
+        stats = getattr(db, "pool_stats", None)
+        if stats is None:
+            return 0
+        return int(stats.in_use + stats.waiting)
@@ -0,0 +1,90 @@
+"""Shard maps for horizontally partitioned models.
+
+A model opts in with ``Meta.shard_key`` and a ``Meta.db_alias`` naming a shard
+group registered through :meth:`~riverorm.db.registry.DatabaseRegistry.register_shards`.
+The group's :class:`ShardMap` turns a shard-key value into the alias of the
+connection holding that row; each shard alias is an ordinary registered
+connection (and may have its own read replicas).
+"""
+
+from __future__ import annotations
+
+import bisect
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+
+class ShardMap(ABC):
+    """Maps shard-key values to connection aliases."""
+
+    @property
+    @abstractmethod
+    def aliases(self) -> tuple[str, ...]:
+        """Every shard alias, in a stable order (used for fan-out queries)."""
+        ...
+
+    @abstractmethod
+    def alias_for(self, key: Any) -> str:
+        """Return the alias of the shard holding rows whose shard key is ``key``."""
+        ...
+
+
+class HashShardMap(ShardMap):
+    """Spread keys evenly over ``aliases`` by a stable CRC32 of the key.
+
+    The hash depends only on ``str(key)``, so it is identical across processes
+    and Python versions (unlike the built-in, randomized ``hash()``). Adding a
+    shard remaps most keys; use :class:`RangeShardMap` when shards must grow
+    without moving rows.
+    """
+
+    def __init__(self, aliases: Sequence[str]) -> None:
+        if not aliases:
+            raise ValueError("HashShardMap needs at least one shard alias")
+        self._aliases = tuple(aliases)
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        return self._aliases
+
+    def alias_for(self, key: Any) -> str:
+        if key is None:
+            raise ValueError("Cannot route a None shard key")
+        return self._aliases[zlib.crc32(str(key).encode()) % len(self._aliases)]
+
+
+class RangeShardMap(ShardMap):
+    """Route keys by ordered, half-open ranges.
+
+    ``ranges`` is a sequence of ``(upper_bound, alias)`` pairs sorted by bound;
+    a key goes to the first shard whose (exclusive) upper bound exceeds it. The
+    last bound may be ``None`` to catch every larger key::
+
+        RangeShardMap([(1_000_000, "s0"), (2_000_000, "s1"), (None, "s2")])
+    """
+
+    def __init__(self, ranges: Sequence[tuple[Any, str]]) -> None:
+        if not ranges:
+            raise ValueError("RangeShardMap needs at least one range")
+        bounds = [bound for bound, _ in ranges]
+        self._unbounded = bounds[-1] is None
+        self._bounds = bounds[:-1] if self._unbounded else bounds
+        if None in self._bounds:
+            raise ValueError("Only the last RangeShardMap bound may be None")
+        if self._bounds != sorted(self._bounds):
+            raise ValueError("RangeShardMap bounds must be sorted ascending")
+        self._aliases = tuple(alias for _, alias in ranges)
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(self._aliases))
+
+    def alias_for(self, key: Any) -> str:
+        if key is None:
+            raise ValueError("Cannot route a None shard key")
+        index = bisect.bisect_right(self._bounds, key)
+        if index == len(self._aliases):
+            raise ValueError(f"Shard key {key!r} is beyond the last RangeShardMap bound")
+        return self._aliases[index]
@@ -0,0 +1,353 @@
+"""Embedded SQLite backend: no server, one connection, one worker thread.
+
+The stdlib :mod:`sqlite3` module is blocking, so every call runs on a dedicated
+single-thread executor that owns the connection; the event loop only awaits
+the result. One thread also serializes access the way SQLite wants it, so no
+connection pool is needed (``PoolConfig`` sizing is ignored; ``session_init``
+still runs once on connect).
+
+Values SQLite cannot bind natively are adapted on the way in (datetimes and
+dates to ISO-8601 text, UUIDs and decimals to text, lists and dicts to JSON)
+and ``JSON`` columns are decoded on the way out, so models round-trip
+unchanged. File databases use WAL journaling by default, letting readers
+proceed while a write is in progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, ClassVar
+from uuid import UUID
+
+from riverorm import constants
+from riverorm.sql import Dialect, SQLiteDialect
+
+from .base import BaseDatabase, BatchKind, R, is_read
+from .breaker import BreakerPolicy, CircuitBreaker
+from .codecs import json_functions
+from .pool import PoolConfig, PoolStats
+from .retry import RetryPolicy, RetryStats
+from .url import SERVER_OPTIONS, Options, boolean
+
+logger = logging.getLogger(__name__)
+
+_dumps, _loads = json_functions()
+
+
+def _json_text(value: Any) -> str:
+    return _dumps(value).decode()
+
+
+#: Converters for parameter types :mod:`sqlite3` cannot bind (or only through
+#: its deprecated default adapters), looked up by exact type.
+_ADAPTERS: dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    UUID: str,
+    Decimal: str,
+    list: _json_text,
+    dict: _json_text,
+}
+
+
+def _adapt(args: Sequence[Any]) -> tuple[Any, ...]:
+    return tuple(
+        value if (adapter := _ADAPTERS.get(type(value))) is None else adapter(value)
+        for value in args
+    )
+
+
+def _dicts(cursor: sqlite3.Cursor, rows: list[tuple[Any, ...]]) -> list[dict[str, Any]]:
+    names = [column[0] for column in cursor.description or ()]
+    return [dict(zip(names, row)) for row in rows]
+
+
+class SQLiteDatabase(BaseDatabase):
+    _conn: sqlite3.Connection | None
+    _executor: ThreadPoolExecutor | None
+    _debug: bool
+    _dialect: Dialect = SQLiteDialect()
+    url_options: ClassVar[Options] = {
+        **SERVER_OPTIONS,
+        "wal": ("wal", boolean),
+        "busy_timeout": ("busy_timeout", float),
+    }
+    atomic_batches: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        dsn: str,
+        debug: bool = False,
+        pool: PoolConfig | None = None,
+        retry: RetryPolicy | None = None,
+        statement_timeout: float | None = None,
+        *,
+        wal: bool = True,
+        busy_timeout: float = 5.0,
+        breaker: BreakerPolicy | None = None,
+    ):
+        if statement_timeout is not None and statement_timeout <= 0:
+            raise ValueError("statement_timeout must be positive or None")
+        self._path = self.dsn_to_path(dsn)
+        self._conn = None
+        self._executor = None
+        self._debug = debug
+        self.pool_config = pool or PoolConfig()
+        # One connection, used by one thread.
+        self.pool_stats = PoolStats(max_size=1)
+        self.retry_policy = retry or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.statement_timeout = statement_timeout
+        self.breaker = CircuitBreaker(breaker) if breaker is not None else None
+        #: Use the write-ahead log for file databases (ignored for ``:memory:``).
+        self.wal = wal
+        #: Seconds a statement waits for another connection's lock before failing.
+        self.busy_timeout = busy_timeout
+        if debug:
+            logger.setLevel(logging.DEBUG)
+        else:
+            logger.setLevel(logging.INFO)
+
+    @property
+    def dialect(self) -> Dialect:
+        return self._dialect
+
+    @staticmethod
+    def dsn_to_path(dsn: str) -> str:
+        """Convert a ``sqlite://`` DSN to a database path for :func:`sqlite3.connect`.
+
+        ``sqlite:///app.db`` is relative to the working directory,
+        ``sqlite:////var/lib/app.db`` absolute, and ``sqlite://`` or
+        ``sqlite:///:memory:`` an in-memory database.
+        """
+        scheme = "sqlite://"
+        if not dsn.startswith(scheme):
+            raise ValueError(f"Unsupported DSN scheme: {dsn.partition(':')[0]}")
+        path = dsn[len(scheme) :]
+        if path in ("", "/", ":memory:", "/:memory:"):
+            return ":memory:"
+        return path[1:] if path.startswith("/") else path
+
+    async def connect(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="riverorm-sqlite")
+        self._conn = await self._submit(self._open)
+        self.is_connected = True
+
+    async def close(self) -> None:
+        if self._conn is None or self._executor is None:
+            raise Exception("Connection is already closed")
+        await self._submit(self._conn.close)
+        self._executor.shutdown(wait=False)
+        self._conn = None
+        self._executor = None
+        self.is_connected = False
+
+    async def warm_up(self) -> None:
+        """Nothing to pre-open: :meth:`connect` already opened the only connection."""
+
+    def _open(self) -> sqlite3.Connection:
+        # ``isolation_level=None`` is autocommit, matching the other backends.
+        # ``PARSE_DECLTYPES`` applies the ``JSON`` column converter.
+        sqlite3.converters.setdefault("JSON", _loads)
+        conn = sqlite3.connect(
+            self._path, isolation_level=None, detect_types=sqlite3.PARSE_DECLTYPES
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+        if self.wal and self._path != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+        for statement in self.pool_config.session_init:
+            conn.execute(statement)
+        return conn
+
+    async def _submit(self, fn: Callable[..., R], *args: Any) -> R:
+        """Run ``fn(*args)`` on the worker thread and await its result.
+
+        If the caller is cancelled (e.g. by a statement timeout) while ``fn``
+        runs, the connection is interrupted so the thread is freed promptly.
+        """
+        if self._executor is None:
+            raise Exception("Connection is not established")
+        future = self._executor.submit(fn, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.running() and self._conn is not None:
+                self._conn.interrupt()
+            raise
+
+    def _run(self, query: str, args: Sequence[Any], read: Callable[[sqlite3.Cursor], R]) -> R:
+        """Run one statement on the worker thread and ``read`` its result off the cursor."""
+        if self._conn is None:
+            raise Exception("Connection is not established")
+        cursor = self._conn.execute(query, _adapt(args))
+        try:
+            return read(cursor)
+        finally:
+            cursor.close()
+
+    async def _call(
+        self, query: str, args: tuple[Any, ...], read: Callable[[sqlite3.Cursor], R]
+    ) -> R:
+        """Run one statement on the worker thread, with timeout and retries."""
+        if self._debug:
+            logger.debug(f"SQL: {query} - {args}")
+        timeout = self._timeout()
+
+        async def attempt() -> R:
+            return await self._bounded(timeout, lambda: self._submit(self._run, query, args, read))
+
+        return await self._retrying(attempt, read=is_read(query))
+
+    async def execute(self, query: str, *args):
+        return await self._call(query, args, _rowcount)
+
+    async def fetch(self, query: str, *args):
+        return await self._call(query, args, _fetchall)
+
+    async def fetchrow(self, query: str, *args):
+        return await self._call(query, args, _fetchone)
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        return await self._call(query, args, _columns_and_rows)
+
+    async def update(self, query: str, *args):
+        return await self._call(query, args, _rowcount)
+
+    async def execute_insert(self, query: str, *args):
+        """Run an ``INSERT`` and return the new row's ``lastrowid``.
+
+        Only used when the SQLite library predates ``RETURNING`` (3.35).
+        """
+        return await self._call(query, args, _lastrowid)
+
+    async def execute_returning_rowcount(self, query: str, *args) -> int:
+        return await self._call(query, args, _rowcount)
+
+    async def run_batch(
+        self, statements: Sequence[tuple[str, tuple[Any, ...], BatchKind]]
+    ) -> list[Any]:
+        """Run every statement in one hop to the worker thread."""
+        if self._debug:
+            for query, args, _ in statements:
+                logger.debug(f"SQL: {query} - {args}")
+        timeout = self._timeout()
+        budget = None if timeout is None else timeout * max(len(statements), 1)
+
+        def run_all() -> list[Any]:
+            try:
+                return [self._run(query, args, _READERS[kind]) for query, args, kind in statements]
+            except Exception:
+                # A batch that opened a transaction must not leave it (and the
+                # write lock) behind on the shared connection.
+                if self._conn is not None and self._conn.in_transaction:
+                    self._conn.rollback()
+                raise
+
+        async def attempt() -> list[Any]:
+            return await self._bounded(budget, lambda: self._submit(run_all))
+
+        return await self._retrying(attempt, read=all(is_read(q) for q, _, _ in statements))
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = constants.DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        """Yield rows in chunks of ``fetchmany``, one worker hop per chunk.
+
+        :meth:`_timeout` bounds each chunk, not the whole stream.
+        """
+        if self._debug:
+            logger.debug(f"SQL: {query} - {args}")
+        if self._conn is None:
+            raise Exception("Connection is not established")
+        conn = self._conn
+        timeout = self._timeout()
+        cursor = await self._bounded(
+            timeout, lambda: self._submit(conn.execute, query, _adapt(args))
+        )
+        try:
+            while rows := await self._bounded(
+                timeout, lambda: self._submit(cursor.fetchmany, chunk_size)
+            ):
+                yield _dicts(cursor, rows)
+        finally:
+            await self._submit(cursor.close)
+
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: AsyncIterable[tuple[Any, ...]],
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Bulk-load ``records`` with ``executemany``, one transaction per batch.
+
+        ``executemany`` reuses one prepared ``INSERT`` for the whole batch, so
+        unlike the multi-row ``INSERT`` fallback it is not bound by
+        ``max_params``. Committing per batch rather than per row avoids a
+        journal sync for every record.
+        """
+        quoted = ", ".join(self.dialect.quote(c) for c in columns)
+        marks = ", ".join("?" for _ in columns)
+        sql = f"INSERT INTO {self.dialect.quote(table)} ({quoted}) VALUES ({marks})"
+        if self._debug:
+            logger.debug(f"COPY {table} ({', '.join(columns)})")
+        total = 0
+        batch: list[tuple[Any, ...]] = []
+        async for record in records:
+            batch.append(_adapt(record))
+            if len(batch) >= batch_size:
+                total += await self._submit(self._insert_many, sql, batch)
+                batch = []
+        if batch:
+            total += await self._submit(self._insert_many, sql, batch)
+        return total
+
+    def _insert_many(self, sql: str, rows: list[tuple[Any, ...]]) -> int:
+        if self._conn is None:
+            raise Exception("Connection is not established")
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(sql, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return len(rows)
+
+
+def _rowcount(cursor: sqlite3.Cursor) -> int:
+    return cursor.rowcount
+
+
+def _lastrowid(cursor: sqlite3.Cursor) -> int | None:
+    return cursor.lastrowid
+
+
+def _fetchall(cursor: sqlite3.Cursor) -> list[dict[str, Any]]:
+    return _dicts(cursor, cursor.fetchall())
+
+
+def _fetchone(cursor: sqlite3.Cursor) -> dict[str, Any] | None:
+    row = cursor.fetchone()
+    return None if row is None else _dicts(cursor, [row])[0]
+
+
+def _columns_and_rows(cursor: sqlite3.Cursor) -> tuple[list[str], Sequence[Sequence[Any]]]:
+    return [column[0] for column in cursor.description or ()], cursor.fetchall()
+
+
+#: How :meth:`SQLiteDatabase.run_batch` reads each :data:`BatchKind`.
+_READERS: dict[str, Callable[[sqlite3.Cursor], Any]] = {
+    "fetch": _fetchall,
+    "fetchrow": _fetchone,
+    "execute": _rowcount,
+}
@@ -0,0 +1,55 @@
+"""Per-statement time limits for the database layer.
+
+A backend's ``statement_timeout`` (seconds, ``None`` for no limit) applies to
+every statement it runs; :meth:`QuerySet.timeout() <riverorm.queryset.QuerySet.timeout>`
+or :func:`statement_timeout` override it for the statements issued inside a
+scope::
+
+    with statement_timeout(0.5):
+        rows = await db.fetch("SELECT ...")
+
+The limit is enforced twice. The server aborts the statement on its own
+(``statement_timeout`` on Postgres, a ``MAX_EXECUTION_TIME`` hint on MySQL
+``SELECT``s), and the client wraps the call in :func:`asyncio.timeout` so a
+stalled network cannot hang the caller either. Either way the caller sees
+:class:`QueryTimeoutError`, which is never retried.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_statement_timeout: ContextVar[float | None] = ContextVar(
+    "riverorm_statement_timeout", default=None
+)
+
+
+class QueryTimeoutError(TimeoutError):
+    """Raised when a statement ran past its time limit and was cancelled."""
+
+
+@contextmanager
+def statement_timeout(seconds: float | None) -> Iterator[None]:
+    """Limit statements issued inside the block to ``seconds`` each.
+
+    ``None`` leaves the surrounding limit (or the backend default) in place.
+    """
+    if seconds is not None and seconds <= 0:
+        raise ValueError("statement timeout must be positive")
+    token = _statement_timeout.set(seconds if seconds is not None else _statement_timeout.get())
+    try:
+        yield
+    finally:
+        _statement_timeout.reset(token)
+
+
+def current_timeout() -> float | None:
+    """The limit set by the innermost :func:`statement_timeout` scope, if any."""
+    return _statement_timeout.get()
+
+
+def milliseconds(seconds: float) -> int:
+    """``seconds`` as whole milliseconds for server settings (at least ``1``; ``0`` means off)."""
+    return max(1, round(seconds * 1000))
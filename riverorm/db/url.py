@@ -0,0 +1,137 @@
+"""Build a backend from one URL carrying its pool and driver options.
+
+``DatabaseRegistry.from_url`` turns deployment config such as::
+
+    postgresql+pool://app:secret@db/app?min_size=5&max_size=50&statement_cache=500&timeout=2
+
+into a configured backend. The scheme picks the backend (a ``+suffix`` is
+allowed and ignored) and each query-string option is one of three kinds:
+
+* pool options, shared by every backend (:data:`POOL_OPTIONS`), become its
+  :class:`~riverorm.db.pool.PoolConfig` (``debug=true`` is accepted too);
+* backend options (the backend's ``url_options``, e.g. ``timeout`` or
+  ``statement_cache``) become constructor arguments;
+* driver options (the backend's ``driver_options``, e.g. ``sslmode``) stay
+  in the DSN for the driver to read.
+
+Anything else is rejected, so a typo fails at startup instead of being
+silently ignored.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from .backends import backend_class
+from .base import BaseDatabase
+from .pool import PoolConfig
+from .retry import RetryPolicy
+
+#: ``option -> (constructor argument, converter)``.
+Options = dict[str, tuple[str, Callable[[str], Any]]]
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+
+def boolean(value: str) -> bool:
+    """Parse ``1/true/yes/on`` or ``0/false/no/off`` (case-insensitive)."""
+    if value.lower() in _TRUE:
+        return True
+    if value.lower() in _FALSE:
+        return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def seconds(value: str) -> float | None:
+    """Parse a duration in seconds; ``none`` disables the limit."""
+    return None if value.lower() == "none" else float(value)
+
+
+def retries(value: str) -> RetryPolicy:
+    """A default :class:`RetryPolicy` making at most ``value`` attempts."""
+    return RetryPolicy(max_attempts=int(value))
+
+
+#: Options every backend accepts, collected into its :class:`PoolConfig`.
+POOL_OPTIONS: Options = {
+    "min_size": ("min_size", int),
+    "max_size": ("max_size", int),
+    "acquire_timeout": ("acquire_timeout", seconds),
+    "max_idle_time": ("max_idle_time", seconds),
+    "max_lifetime": ("max_lifetime", seconds),
+    "max_queries": ("max_queries", int),
+}
+
+#: Backend options shared by the server backends (timeouts and retries).
+SERVER_OPTIONS: Options = {
+    "timeout": ("statement_timeout", seconds),
+    "statement_timeout": ("statement_timeout", seconds),
+    "retries": ("retry", retries),
+}
+
+
+def _claim(setters: dict[str, str], target: str, key: str) -> None:
+    """Record that option ``key`` sets ``target``; raise if another option already did."""
+    other = setters.setdefault(target, key)
+    if other != key:
+        raise ValueError(
+            f"Options {other!r} and {key!r} set the same setting; give only one of them"
+        )
+
+
+def parse_url(url: str) -> tuple[type[BaseDatabase], str, dict[str, Any]]:
+    """Split ``url`` into ``(backend class, driver DSN, constructor kwargs)``.
+
+    Raises ``ValueError`` for an unknown scheme, an unknown or repeated
+    option (including two aliases of one setting), or a value that does not
+    parse.
+    """
+    backend = backend_class(url)
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        raise ValueError(f"Not a database URL: {url!r}")
+    rest, _, query = rest.partition("?")
+    pool: dict[str, Any] = {}
+    kwargs: dict[str, Any] = {}
+    driver: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    # Option that set each PoolConfig field / constructor argument, so aliases
+    # such as ``timeout`` and ``statement_timeout`` cannot both be given.
+    setters: dict[str, str] = {}
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key in seen:
+            raise ValueError(f"Option {key!r} given more than once in the database URL")
+        seen.add(key)
+        if key == "debug":
+            kwargs["debug"] = _convert(key, boolean, value)
+        elif key in POOL_OPTIONS:
+            name, convert = POOL_OPTIONS[key]
+            _claim(setters, f"pool.{name}", key)
+            pool[name] = _convert(key, convert, value)
+        elif key in backend.url_options:
+            name, convert = backend.url_options[key]
+            _claim(setters, name, key)
+            kwargs[name] = _convert(key, convert, value)
+        elif key in backend.driver_options:
+            driver.append((key, value))
+        else:
+            known = sorted({"debug", *POOL_OPTIONS, *backend.url_options, *backend.driver_options})
+            raise ValueError(
+                f"Unknown option {key!r} for {backend.__name__}; supported: {', '.join(known)}"
+            )
+    if pool:
+        kwargs["pool"] = PoolConfig(**pool)
+    dsn = f"{scheme.partition('+')[0]}://{rest}"
+    if driver:
+        dsn += f"?{urlencode(driver)}"
+    return backend, dsn, kwargs
+
+
+def _convert(key: str, convert: Callable[[str], Any], value: str) -> Any:
+    try:
+        return convert(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid value {value!r} for option {key!r}: {exc}") from None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import datetime
 from typing import Any, ClassVar, Self, TypeVar, get_args, get_origin
 
@@ -11,7 +11,8 @@ from pydantic.fields import FieldInfo
 
 from riverorm import constants
 from riverorm.fields import Field, FieldMeta, FieldRef, field_meta
-from riverorm.db import BaseDatabase, DatabaseRegistry
+from riverorm.db import BaseDatabase, DatabaseRegistry, ShardMap
+from riverorm.db.registry import DatabaseRegistryError
 from riverorm.queryset import (
     DoesNotExist,
     ManagerDescriptor,
@@ -187,12 +188,56 @@ class Model(BaseModel):
         table_name: str
         primary_key: str = constants.DEFAULT_PRIMARY_KEY
         db_alias: str | None = None  # If None, use default connection
+        shard_key: str | None = None  # If set, db_alias names a shard group
 
     @classmethod
-    def db(cls) -> BaseDatabase:
-        """Get the database instance associated with this model."""
+    def db(cls, *, read: bool = False) -> BaseDatabase:
+        """Get the database instance associated with this model.
+
+        ``read=True`` may return one of the alias' read replicas; writes and
+        DDL always use the primary (the default). Sharded models have no single
+        database: use :meth:`db_for_shard` or :meth:`databases` instead.
+        """
+        key = cls.shard_key()
+        if key is not None:
+            raise DatabaseRegistryError(
+                f"{cls.__name__} is sharded by '{key}'; use db_for_shard() or databases()."
+            )
         alias = getattr(cls.Meta, "db_alias", None)
-        return DatabaseRegistry.get(alias)
+        return DatabaseRegistry.get(alias, read=read)
+
+    @classmethod
+    def shard_key(cls) -> str | None:
+        """Name of the field rows are sharded by (``Meta.shard_key``), if any."""
+        return getattr(cls.Meta, "shard_key", None)
+
+    @classmethod
+    def _shard_map(cls) -> ShardMap:
+        return DatabaseRegistry.shard_map(getattr(cls.Meta, "db_alias", None))
+
+    @classmethod
+    def db_for_shard(cls, value: Any, *, read: bool = False) -> BaseDatabase:
+        """Return the database of the shard holding rows whose shard key is ``value``."""
+        return DatabaseRegistry.get(cls._shard_map().alias_for(value), read=read)
+
+    @classmethod
+    def databases(cls, *, read: bool = False) -> list[BaseDatabase]:
+        """Every database holding rows of this model: each shard, or just :meth:`db`."""
+        if cls.shard_key() is None:
+            return [cls.db(read=read)]
+        return [DatabaseRegistry.get(alias, read=read) for alias in cls._shard_map().aliases]
+
+    def _instance_db(self) -> BaseDatabase:
+        """The database this instance is written to (its shard, for sharded models)."""
+        key = self.shard_key()
+        if key is None:
+            return self.db()
+        value = getattr(self, key, None)
+        if value is None:
+            raise ValueError(
+                f"{type(self).__name__} is sharded by '{key}', which must be set before writing."
+            )
+        return self.db_for_shard(value)
 
     @classmethod
     def table_name(cls) -> str:
@@ -322,7 +367,7 @@ class Model(BaseModel):
         are never overwritten with their Python defaults; pass ``update_fields``
         to write a different subset.
         """
-        db = self.db()
+        db = self._instance_db()
         compiler = db.compiler
         fields = list(self.__class__.model_real_fields().keys())
         pk_name = self.primary_key()
@@ -402,7 +447,7 @@ class Model(BaseModel):
     async def delete(self) -> None:
         pk_name = self.primary_key()
         pk_value = getattr(self, pk_name)
-        db = self.db()
+        db = self._instance_db()
         delete = DeleteQuery(
             table=self.table_name(),
             where=(Condition(Column(pk_name), Operator.EQ, pk_value),),
@@ -504,15 +549,40 @@ class Model(BaseModel):
         cls: type[T], row: Any, rel_map: dict[str, tuple[str, type[Model]]]
     ) -> T:
         """Build an instance from a joined row, attaching the related objects."""
-        base_data: dict[str, Any] = {}
-        related_objs: dict[str, dict[str, Any]] = {}
-        for k, v in dict(row).items():
-            if "__" in k:
-                rel, col = k.split("__", 1)
-                related_objs.setdefault(rel, {})[col] = v
-            else:
-                base_data[k] = v
-        obj = cls._from_row(base_data)
+        data = dict(row)
+        return cls._select_related_reader(list(data), rel_map)(tuple(data.values()))
+
+    @classmethod
+    def _select_related_reader(
+        cls: type[T], columns: Sequence[str], rel_map: dict[str, tuple[str, type[Model]]]
+    ) -> Callable[[Sequence[Any]], T]:
+        """Return a function building instances from positional joined rows.
+
+        ``columns`` names the row's values; ``"rel__col"`` columns belong to the
+        related object ``rel``. The split is worked out once per result, not
+        once per row.
+        """
+        layout = [tuple(c.split("__", 1)) if "__" in c else (None, c) for c in columns]
+
+        def read(row: Sequence[Any]) -> T:
+            base_data: dict[str, Any] = {}
+            related_objs: dict[str, dict[str, Any]] = {}
+            for (rel, col), value in zip(layout, row):
+                if rel is None:
+                    base_data[col] = value
+                else:
+                    related_objs.setdefault(rel, {})[col] = value
+            return cls._attach_related(cls._from_row(base_data), related_objs, rel_map)
+
+        return read
+
+    @staticmethod
+    def _attach_related(
+        obj: T,
+        related_objs: dict[str, dict[str, Any]],
+        rel_map: dict[str, tuple[str, type[Model]]],
+    ) -> T:
+        """Set each ``select_related`` relation on ``obj`` from its column values."""
         for rel, (_fk_field, related_model) in rel_map.items():
             rel_data = related_objs.get(rel)
             rel_pk = related_model.primary_key()
@@ -573,8 +643,14 @@ class Model(BaseModel):
         return cls.objects.defer(*fields)
 
     @classmethod
-    async def _prefetch_related(cls, objects: Sequence[Model], specs: list[str]) -> None:
-        """Populate the relations named in ``specs`` on ``objects`` with batched queries."""
+    async def _prefetch_related(
+        cls, objects: Sequence[Model], specs: list[str], primary: bool = False
+    ) -> None:
+        """Populate the relations named in ``specs`` on ``objects`` with batched queries.
+
+        ``primary=True`` reads the related rows from the primary instead of a
+        replica (propagated from :meth:`~riverorm.queryset.QuerySet.primary`).
+        """
         if not objects or not specs:
             return
         _ensure_model_complete(cls)
@@ -595,21 +671,26 @@ class Model(BaseModel):
                 raise ValueError(f"'{root}' is not a relation on {cls.__name__}")
 
             if is_collection:
-                children = await cls._prefetch_reverse(objects, root, related_model)
+                children = await cls._prefetch_reverse(objects, root, related_model, primary)
             else:
-                children = await cls._prefetch_forward(objects, root, related_model)
+                children = await cls._prefetch_forward(objects, root, related_model, primary)
 
             if nested:
-                await related_model._prefetch_related(children, nested)
+                await related_model._prefetch_related(children, nested, primary)
 
     @classmethod
     async def _prefetch_forward(
-        cls, objects: Sequence[Model], root: str, related_model: type[Model]
+        cls,
+        objects: Sequence[Model],
+        root: str,
+        related_model: type[Model],
+        primary: bool = False,
     ) -> list[Model]:
         """Load a forward FK relation (``cls`` has ``<root>_id``) and attach single objects."""
         fk = f"{root}_id"
         ids = {getattr(obj, fk) for obj in objects if getattr(obj, fk, None) is not None}
-        related = await related_model.filter(id__in=list(ids)) if ids else []
+        qs = related_model.objects.primary() if primary else related_model.objects.get_queryset()
+        related = await qs.filter(id__in=list(ids)) if ids else []
         by_pk = {getattr(r, related_model.primary_key()): r for r in related}
         for obj in objects:
             obj.__dict__[root] = by_pk.get(getattr(obj, fk, None))
@@ -617,13 +698,18 @@ class Model(BaseModel):
 
     @classmethod
     async def _prefetch_reverse(
-        cls, objects: Sequence[Model], root: str, related_model: type[Model]
+        cls,
+        objects: Sequence[Model],
+        root: str,
+        related_model: type[Model],
+        primary: bool = False,
     ) -> list[Model]:
         """Load a reverse relation (related rows point back via ``<cls>_id``) as lists."""
         back_fk = f"{_camel_to_snake(cls.__name__)}_id"
         pk = cls.primary_key()
         ids = [getattr(obj, pk) for obj in objects if getattr(obj, pk, None) is not None]
-        related = await related_model.filter(**{f"{back_fk}__in": ids}) if ids else []
+        qs = related_model.objects.primary() if primary else related_model.objects.get_queryset()
+        related = await qs.filter(**{f"{back_fk}__in": ids}) if ids else []
         grouped: dict[Any, list[Model]] = {}
         for row in related:
             grouped.setdefault(getattr(row, back_fk), []).append(row)
@@ -666,7 +752,11 @@ class Model(BaseModel):
 
             mod = sys.modules.get(cls.__module__)
             cls.model_rebuild(raise_errors=False, _types_namespace=vars(mod) if mod else None)
-        db = cls.db()
+        for db in cls.databases():
+            await cls._create_table_on(db)
+
+    @classmethod
+    async def _create_table_on(cls, db: BaseDatabase) -> None:
         dialect = db.dialect
         parts = []
         index_columns: list[str] = []
@@ -717,9 +807,8 @@ class Model(BaseModel):
 
     @classmethod
     async def drop_table(cls: type[T]):
-        dialect = cls.db().dialect
-        sql = f"DROP TABLE IF EXISTS {dialect.quote(cls.table_name())};"
-        return await cls.db().execute(sql)
+        for db in cls.databases():
+            await db.execute(f"DROP TABLE IF EXISTS {db.dialect.quote(cls.table_name())};")
 
 
 class TimestampedModel(Model):
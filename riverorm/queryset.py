@@ -7,8 +7,13 @@ the model's compiler. Every chaining method returns a brand-new ``QuerySet`` so
 instances are immutable and freely reusable.
 
 Execution is lazy. A ``QuerySet`` runs only when awaited (``await qs``), iterated
-(``async for``), or when a terminal method (``all``/``get``/``first``/``count``/
-``exists``) is awaited.
+(``async for``, which streams rows chunk by chunk), or when a terminal method
+(``all``/``get``/``first``/``count``/``exists``) is awaited.
+
+Queries over a sharded model (``Meta.shard_key``) go to a single shard when the
+filters pin the shard key, and otherwise fan out concurrently to every shard.
+Per-shard results are k-way merged on ``order_by`` and sliced by
+``limit``/``offset``, so each shard returns at most ``offset + limit`` rows.
 
 The :class:`Manager`, reached through ``Model.objects``, is a stateless factory
 that hands out fresh ``QuerySet`` objects bound to its model.
@@ -16,12 +21,43 @@ that hands out fresh ``QuerySet`` objects bound to its model.
 
 from __future__ import annotations
 
+import asyncio
 import dataclasses
-from collections.abc import AsyncIterator, Generator
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
-
+import heapq
+import itertools
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from contextlib import AsyncExitStack, aclosing, contextmanager
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, overload
+
+from riverorm import constants
+from riverorm.db import BaseDatabase, DatabaseRegistry, statement_timeout
+from riverorm.db import lane as lane_scope
 from riverorm.fields import FieldRef
-from riverorm.sql import Column, Condition, DeleteQuery, OrderBy, SelectQuery, UpdateQuery
+from riverorm.sql import (
+    Aggregate,
+    AggregateFunction,
+    BulkUpdateQuery,
+    Column,
+    Condition,
+    DeleteQuery,
+    Dialect,
+    InsertQuery,
+    OnConflict,
+    Operator,
+    OrderBy,
+    SelectQuery,
+    UpdateQuery,
+)
 
 if TYPE_CHECKING:
     from riverorm.models import Model
@@ -38,6 +74,86 @@ class MultipleObjectsReturned(Exception):
     """Raised by :meth:`QuerySet.get` when more than one row matches."""
 
 
+class IntegrityError(Exception):
+    """Raised when a write collides with a unique key other than the one it targeted."""
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkCopyResult:
+    """Outcome of :meth:`Manager.bulk_copy`: rows written and elapsed seconds."""
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Load throughput over the whole call (``0.0`` if nothing was timed)."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+async def _iterate(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncGenerator[Any, None]:
+    """Walk a sync or async iterable with ``async for``, one item at a time."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _default_alias(aggregate: Aggregate) -> str:
+    """``<field>__<function>`` (``count`` for ``COUNT(*)``), as Django names them."""
+    if aggregate.column is None:
+        return "count"
+    return f"{aggregate.column.name}__{aggregate.function.value.lower()}"
+
+
+def _sql_type(dialect: Dialect, annotation: Any) -> str:
+    """The column type ``dialect`` maps ``annotation`` to, or ``""`` if it has none."""
+    try:
+        return dialect.python_to_sql_type(annotation)
+    except TypeError:
+        return ""
+
+
+class _SortValue:
+    """One ``ORDER BY`` value, compared the way the database would sort it."""
+
+    __slots__ = ("descending", "nulls_first", "value")
+
+    def __init__(self, value: Any, descending: bool, nulls_first: bool) -> None:
+        self.value = value
+        self.descending = descending
+        self.nulls_first = nulls_first
+
+    def _ascending_lt(self, a: Any, b: Any) -> bool:
+        if a is None:
+            return b is not None and self.nulls_first
+        if b is None:
+            return not self.nulls_first
+        return bool(a < b)
+
+    def __lt__(self, other: _SortValue) -> bool:
+        if self.descending:
+            return self._ascending_lt(other.value, self.value)
+        return self._ascending_lt(self.value, other.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SortValue) and self.value == other.value
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+_EXHAUSTED = object()
+
+#: Prefix of the result names riverorm adds to aggregate queries itself (the
+#: per-shard ``COUNT`` behind a combined ``Avg``); user names may not use it.
+_INTERNAL_ALIAS = "_riverorm_"
+
+#: Name of the ``RETURNING`` flag telling an upsert's inserted row from an updated one.
+_INSERTED = f"{_INTERNAL_ALIAS}inserted"
+
+
 @dataclasses.dataclass(frozen=True)
 class QuerySet(Generic[T]):
     """An immutable, lazily-evaluated description of a ``SELECT`` over ``model``.
@@ -57,6 +173,10 @@ class QuerySet(Generic[T]):
     load_related_fields: tuple[str, ...] = ()
     only_fields: tuple[str, ...] = ()
     defer_fields: tuple[str, ...] = ()
+    using_alias: str | None = None
+    use_primary: bool = False
+    timeout_value: float | None = None
+    lane_name: str | None = None
 
     # -- chaining (all return a fresh QuerySet) -----------------------------
 
@@ -140,6 +260,67 @@ class QuerySet(Generic[T]):
         names = self._validate_field_refs(fields, "defer")
         return dataclasses.replace(self, defer_fields=names, only_fields=())
 
+    def values(self, *fields: str | FieldRef) -> ValuesQuerySet:
+        """Return a query yielding rows as dicts of ``fields`` (every column if none).
+
+        Chain :meth:`ValuesQuerySet.annotate` to group by ``fields`` and
+        compute aggregates per group in the database::
+
+            await Order.objects.values("status").annotate(n=Count(), revenue=Sum("total_price"))
+        """
+        names = self._validate_field_refs(fields, "values") if fields else ()
+        return ValuesQuerySet(self, names)
+
+    def using(self, alias: str) -> QuerySet[T]:
+        """Return a new ``QuerySet`` that runs against the connection ``alias``.
+
+        Overrides the model's ``Meta.db_alias``; reads are still balanced over
+        that alias' replicas unless :meth:`primary` is also applied.
+        """
+        return dataclasses.replace(self, using_alias=alias)
+
+    def primary(self) -> QuerySet[T]:
+        """Return a new ``QuerySet`` whose reads go to the primary, not a replica.
+
+        Use it for read-after-write paths where replication lag would return
+        stale rows::
+
+            await user.save()
+            fresh = await User.objects.primary().get(id=user.id)
+        """
+        return dataclasses.replace(self, use_primary=True)
+
+    def timeout(self, seconds: float) -> QuerySet[T]:
+        """Return a new ``QuerySet`` whose statements may run for at most ``seconds``.
+
+        Overrides the backend's ``statement_timeout`` for this query (including
+        ``load_related`` prefetches; each chunk of an :meth:`iterator`). Raises
+        :class:`~riverorm.db.QueryTimeoutError` when the limit is hit::
+
+            recent = await Order.objects.filter(status="paid").timeout(0.5)
+        """
+        if seconds <= 0:
+            raise ValueError("timeout() seconds must be positive")
+        return dataclasses.replace(self, timeout_value=seconds)
+
+    def lane(self, name: str) -> QuerySet[T]:
+        """Return a new ``QuerySet`` that runs on the connection pool of lane ``name``.
+
+        Equivalent to issuing it inside ``with riverorm.lane(name):`` (see
+        :mod:`riverorm.db.lanes`), including ``load_related`` prefetches::
+
+            report = await Order.objects.filter(status="paid").lane("bulk")
+        """
+        if not name:
+            raise ValueError("lane() name must be a non-empty string")
+        return dataclasses.replace(self, lane_name=name)
+
+    @contextmanager
+    def _scope(self) -> Iterator[None]:
+        """Apply this query's :meth:`timeout` and :meth:`lane` to the statements inside."""
+        with statement_timeout(self.timeout_value), lane_scope(self.lane_name):
+            yield
+
     def _validate_field_refs(
         self, fields: tuple[str | FieldRef, ...], method: str
     ) -> tuple[str, ...]:
@@ -156,6 +337,44 @@ class QuerySet(Generic[T]):
             )
         return names
 
+    def _db(self, *, write: bool = False) -> BaseDatabase:
+        """Resolve the backend for this query: a replica for reads, else the primary."""
+        read = not (write or self.use_primary)
+        with lane_scope(self.lane_name):
+            if self.using_alias is None:
+                return self.model.db(read=read)
+            return DatabaseRegistry.get(self.using_alias, read=read)
+
+    def _targets(self, *, write: bool = False) -> list[BaseDatabase]:
+        """Resolve every backend this query must run on.
+
+        Non-sharded models (and :meth:`using`) resolve to one backend. For a
+        sharded model, ``=`` and ``__in`` filters on the shard key narrow the
+        shards; without them the query fans out to all of them. An empty
+        ``__in`` matches nothing, so no backend is needed at all.
+        """
+        if any(c.operator is Operator.IN and not c.negated and not c.value for c in self.where):
+            return []
+        key = self.model.shard_key()
+        if key is None or self.using_alias is not None:
+            return [self._db(write=write)]
+        shard_map = self.model._shard_map()
+        aliases = list(shard_map.aliases)
+        for condition in self.where:
+            if condition.column.name != key or condition.negated:
+                continue
+            if condition.operator is Operator.EQ:
+                values = [condition.value]
+            elif condition.operator is Operator.IN:
+                values = list(condition.value)
+            else:
+                continue
+            wanted = {shard_map.alias_for(v) for v in values}
+            aliases = [a for a in aliases if a in wanted]
+        read = not (write or self.use_primary)
+        with lane_scope(self.lane_name):
+            return [DatabaseRegistry.get(alias, read=read) for alias in aliases]
+
     # -- terminals ----------------------------------------------------------
 
     async def all(self) -> list[T]:
@@ -174,7 +393,10 @@ class QuerySet(Generic[T]):
         :class:`MultipleObjectsReturned` if more than one row matches.
         """
         qs = self.filter(**lookups) if lookups else self
-        rows = await qs.limit(2)._execute()
+        return self._single(await qs.limit(2)._execute())
+
+    def _single(self, rows: list[T]) -> T:
+        """Return the only element of ``rows``, raising as :meth:`get` documents."""
         if not rows:
             raise self.model.DoesNotExist(f"{self.model.__name__} matching query does not exist")
         if len(rows) > 1:
@@ -184,48 +406,301 @@ class QuerySet(Generic[T]):
         return rows[0]
 
     async def count(self) -> int:
-        """Return the number of matching rows via ``SELECT COUNT(*)``."""
-        db = self.model.db()
-        query = SelectQuery(table=self.model.table_name(), where=self.where, count=True)
-        sql, params = db.compiler.compile_select(query)
-        row = await db.fetchrow(sql, *params)
+        """Return the number of matching rows via ``SELECT COUNT(*)``.
+
+        For a sharded model the per-shard counts are run concurrently and summed.
+        """
+        query = self._count_query()
+
+        async def count_on(db: BaseDatabase) -> int:
+            sql, params = db.compiler.compile_select(query)
+            return self._count_from_row(await db.fetchrow(sql, *params))
+
+        with self._scope():
+            return sum(await asyncio.gather(*(count_on(db) for db in self._targets())))
+
+    async def exists(self) -> bool:
+        """Return ``True`` if at least one row matches."""
+        return await self.limit(1).count() > 0
+
+    def _count_query(self) -> SelectQuery:
+        return SelectQuery(table=self.model.table_name(), where=self.where, count=True)
+
+    @staticmethod
+    def _count_from_row(row: Any) -> int:
         if row is None:
             return 0
         values = list(dict(row).values())
         return int(values[0])
 
-    async def exists(self) -> bool:
-        """Return ``True`` if at least one row matches."""
-        return await self.limit(1).count() > 0
+    async def aggregate(self, *aggregates: Aggregate, **named: Aggregate) -> dict[str, Any]:
+        """Compute aggregates over the matching rows in the database, keyed by name.
+
+        Positional aggregates are named ``<field>__<function>`` (``count`` for
+        ``Count()``). Ordering is ignored; ``limit()`` / ``offset()`` are not
+        supported. Values come back as the driver returns them (e.g.
+        ``Decimal`` for a Postgres ``AVG``), and ``None`` for ``Sum`` / ``Avg``
+        / ``Min`` / ``Max`` over no rows.
+
+        For a sharded model every shard computes its part concurrently and the
+        parts are combined (``Avg`` from per-shard sums and counts); distinct
+        aggregates cannot be combined and need filters pinning one shard.
+
+        Example::
+
+            stats = await Order.objects.filter(status="paid").aggregate(
+                revenue=Sum("total_price"), orders=Count()
+            )
+        """
+        if self.limit_value is not None or self.offset_value is not None:
+            raise ValueError("aggregate() cannot be combined with limit() / offset()")
+        wanted = self._named_aggregates(aggregates, named, "aggregate")
+        if not wanted:
+            raise ValueError("aggregate() needs at least one aggregate")
+        with self._scope():
+            targets = self._targets()
+            if not targets:
+                # An empty ``__in`` filter matches no rows anywhere.
+                empty: dict[str, Any] = {}
+                for aggregate in wanted:
+                    assert aggregate.alias is not None
+                    empty[aggregate.alias] = (
+                        0 if aggregate.function is AggregateFunction.COUNT else None
+                    )
+                return empty
+            if len(targets) == 1:
+                query = SelectQuery(
+                    table=self.model.table_name(), aggregates=wanted, where=self.where
+                )
+                sql, params = targets[0].compiler.compile_select(query)
+                return dict(await targets[0].fetchrow(sql, *params))
+            return await self._aggregate_shards(wanted, targets)
+
+    async def _aggregate_shards(
+        self, wanted: tuple[Aggregate, ...], targets: list[BaseDatabase]
+    ) -> dict[str, Any]:
+        """Run ``wanted`` on every shard (``AVG`` as ``SUM`` + ``COUNT``) and combine."""
+        per_shard: list[Aggregate] = []
+        for aggregate in wanted:
+            if aggregate.distinct:
+                raise ValueError(
+                    "Distinct aggregates over several shards cannot be combined; "
+                    "filter on the shard key to pin one shard"
+                )
+            if aggregate.function is AggregateFunction.AVG:
+                per_shard.append(dataclasses.replace(aggregate, function=AggregateFunction.SUM))
+                per_shard.append(
+                    dataclasses.replace(
+                        aggregate,
+                        function=AggregateFunction.COUNT,
+                        alias=f"{_INTERNAL_ALIAS}{aggregate.alias}__n",
+                    )
+                )
+            else:
+                per_shard.append(aggregate)
+        query = SelectQuery(
+            table=self.model.table_name(), aggregates=tuple(per_shard), where=self.where
+        )
 
-    async def update(self, **kwargs: Any) -> int:
+        async def aggregate_on(db: BaseDatabase) -> dict[str, Any]:
+            sql, params = db.compiler.compile_select(query)
+            return dict(await db.fetchrow(sql, *params))
+
+        parts = await asyncio.gather(*(aggregate_on(db) for db in targets))
+        result: dict[str, Any] = {}
+        for aggregate in wanted:
+            name = aggregate.alias
+            assert name is not None
+            values = [part[name] for part in parts if part[name] is not None]
+            function = aggregate.function
+            if function is AggregateFunction.COUNT:
+                result[name] = sum(values)
+            elif not values:
+                result[name] = None
+            elif function is AggregateFunction.SUM:
+                result[name] = sum(values)
+            elif function is AggregateFunction.MIN:
+                result[name] = min(values)
+            elif function is AggregateFunction.MAX:
+                result[name] = max(values)
+            else:
+                count = sum(part[f"{_INTERNAL_ALIAS}{name}__n"] for part in parts)
+                result[name] = sum(values) / count
+        return result
+
+    def _named_aggregates(
+        self, aggregates: tuple[Aggregate, ...], named: dict[str, Aggregate], method: str
+    ) -> tuple[Aggregate, ...]:
+        """Give every aggregate its result name and validate its field."""
+        pairs = [(_default_alias(a), a) for a in aggregates] + list(named.items())
+        names = [name for name, _ in pairs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"{method}() result names must be unique: {names}")
+        reserved = [name for name in names if name.startswith(_INTERNAL_ALIAS)]
+        if reserved:
+            raise ValueError(
+                f"{method}() result names must not start with {_INTERNAL_ALIAS!r}: {reserved}"
+            )
+        for _, aggregate in pairs:
+            if aggregate.column is not None:
+                self._validate_field_refs((aggregate.column.name,), method)
+        return tuple(dataclasses.replace(a, alias=name) for name, a in pairs)
+
+    def iterator(self, chunk_size: int = constants.DEFAULT_CHUNK_SIZE) -> AsyncIterator[T]:
+        """Stream matching instances, holding at most ``chunk_size`` rows in memory.
+
+        Rows come from a server-side cursor (see
+        :meth:`~riverorm.db.base.BaseDatabase.stream`), so arbitrarily large
+        results can be walked without materializing them. ``async for obj in qs``
+        uses this with the default chunk size::
+
+            async for user in User.objects.filter(is_active=True).iterator(chunk_size=5000):
+                ...
+
+        The cursor keeps one pooled connection checked out until iteration
+        ends; ``load_related`` prefetches run once per chunk on another one.
+        """
+        if chunk_size < 1:
+            raise ValueError("iterator() chunk_size must be >= 1")
+        return self._stream(chunk_size)
+
+    @overload
+    async def update(self, *, returning: Literal[False] = False, **kwargs: Any) -> int: ...
+
+    @overload
+    async def update(
+        self, *, returning: Literal[True] | Sequence[str], **kwargs: Any
+    ) -> list[T]: ...
+
+    @overload
+    async def update(self, *, returning: bool | Sequence[str], **kwargs: Any) -> int | list[T]: ...
+
+    async def update(
+        self, *, returning: bool | Sequence[str] = False, **kwargs: Any
+    ) -> int | list[T]:
         """Bulk-update all matching rows and return the number of rows affected.
 
+        With ``returning`` the updated rows are returned instead, as instances
+        holding their new values: ``True`` for full instances, or a list of
+        field names for partial ones, as from ``only()``. They are read in the
+        same round trip via ``RETURNING``. On MySQL, which lacks it, the rows
+        are locked with ``SELECT ... FOR UPDATE`` and then written, in one
+        transaction.
+
         Example::
 
             count = await Order.objects.filter(status="pending").update(status="cancelled")
+            paid = await Order.objects.filter(id__in=ids).update(status="paid", returning=True)
         """
-        db = self.model.db()
         query = UpdateQuery(
             table=self.model.table_name(),
             columns=tuple(kwargs.keys()),
             values=tuple(kwargs.values()),
             where=self.where,
         )
-        sql, params = db.compiler.compile_update(query)
-        return await db.execute_returning_rowcount(sql, *params)
+        if returning is not False:
+            return await self._write_returning(query, returning, kwargs)
+
+        async def update_on(db: BaseDatabase) -> int:
+            sql, params = db.compiler.compile_update(query)
+            return await db.execute_returning_rowcount(sql, *params)
+
+        with self._scope():
+            targets = self._targets(write=True)
+            return sum(await asyncio.gather(*(update_on(db) for db in targets)))
 
-    async def delete(self) -> int:
+    @overload
+    async def delete(self, *, returning: Literal[False] = False) -> int: ...
+
+    @overload
+    async def delete(self, *, returning: Literal[True] | Sequence[str]) -> list[T]: ...
+
+    @overload
+    async def delete(self, *, returning: bool | Sequence[str]) -> int | list[T]: ...
+
+    async def delete(self, *, returning: bool | Sequence[str] = False) -> int | list[T]:
         """Bulk-delete all matching rows and return the number of rows deleted.
 
+        ``returning`` returns the deleted rows as instances instead, as for
+        :meth:`update`. They are no longer marked persisted, so ``save()``
+        inserts them again.
+
         Example::
 
             count = await User.objects.filter(is_active=False).delete()
+            expired = await Session.objects.filter(expires__lt=now).delete(returning=["user_id"])
         """
-        db = self.model.db()
         query = DeleteQuery(table=self.model.table_name(), where=self.where)
-        sql, params = db.compiler.compile_delete(query)
-        return await db.execute_returning_rowcount(sql, *params)
+        if returning is not False:
+            deleted = await self._write_returning(query, returning, {})
+            for obj in deleted:
+                obj._persisted = False
+            return deleted
+
+        async def delete_on(db: BaseDatabase) -> int:
+            sql, params = db.compiler.compile_delete(query)
+            return await db.execute_returning_rowcount(sql, *params)
+
+        with self._scope():
+            targets = self._targets(write=True)
+            return sum(await asyncio.gather(*(delete_on(db) for db in targets)))
+
+    async def _write_returning(
+        self,
+        query: UpdateQuery | DeleteQuery,
+        returning: Literal[True] | Sequence[str],
+        assigned: dict[str, Any],
+    ) -> list[T]:
+        """Run ``query`` on every target and hydrate the rows it wrote.
+
+        ``assigned`` holds the new values of an update; without ``RETURNING``
+        they are applied to the rows read before the write.
+        """
+        method = "update" if isinstance(query, UpdateQuery) else "delete"
+        if returning is True:
+            names = tuple(self.model.model_real_fields())
+            build = self.model._from_row
+        else:
+            if isinstance(returning, str) or not returning:
+                raise ValueError(f"{method}() returning must be True or a list of field names")
+            fields = self._validate_field_refs(tuple(returning), method)
+            pk = self.model.primary_key()
+            names = fields if pk in fields else (pk, *fields)
+            build = self.model._from_partial_row
+
+        def compile_write(
+            db: BaseDatabase, write: UpdateQuery | DeleteQuery
+        ) -> tuple[str, list[Any]]:
+            if isinstance(write, UpdateQuery):
+                return db.compiler.compile_update(write)
+            return db.compiler.compile_delete(write)
+
+        async def write_on(db: BaseDatabase) -> list[T]:
+            dialect = db.dialect
+            if dialect.delete_returning if method == "delete" else dialect.supports_returning:
+                sql, params = compile_write(db, dataclasses.replace(query, returning=names))
+                columns, rows = await db.fetch_tuples(sql, *params)
+                return [build(dict(zip(columns, row))) for row in rows]
+            # No RETURNING: lock the rows, read them, then write, in one
+            # transaction.
+            select = SelectQuery(
+                table=self.model.table_name(),
+                columns=tuple(Column(n) for n in names),
+                where=self.where,
+                for_update=True,
+            )
+            select_sql, select_params = db.compiler.compile_select(select)
+            sql, params = compile_write(db, query)
+            rows, _ = await db.run_transaction(
+                [(select_sql, tuple(select_params), "fetch"), (sql, tuple(params), "execute")]
+            )
+            written = {name: value for name, value in assigned.items() if name in names}
+            return [build({**row, **written}) for row in rows]
+
+        with self._scope():
+            targets = self._targets(write=True)
+            results = await asyncio.gather(*(write_on(db) for db in targets))
+        return [obj for objects in results for obj in objects]
 
     # -- execution ----------------------------------------------------------
 
@@ -250,28 +725,21 @@ class QuerySet(Generic[T]):
             offset=self.offset_value,
         )
 
-    async def _execute(self) -> list[T]:
+    def _plan(self) -> tuple[SelectQuery, Callable[[Any], T]]:
+        """Return the ``SELECT`` to run and the function turning a row into an instance."""
         if self.select_related_fields:
             if self.only_fields or self.defer_fields:
                 raise ValueError(
                     "only() / defer() cannot be combined with select_related(); "
                     "the JOIN builds its own column list. Drop one of them."
                 )
-            return await self._execute_select_related()
-        db = self.model.db()
-        sql, params = db.compiler.compile_select(self._build_query())
-        rows = await db.fetch(sql, *params)
+            return self._plan_select_related()
         if self.only_fields or self.defer_fields:
-            objects = [self.model._from_partial_row(dict(row)) for row in rows]
-        else:
-            objects = [self.model._from_row(dict(row)) for row in rows]
-        if self.load_related_fields:
-            await self.model._prefetch_related(objects, list(self.load_related_fields))
-        return objects
+            return self._build_query(), lambda row: self.model._from_partial_row(dict(row))
+        return self._build_query(), lambda row: self.model._from_row(dict(row))
 
-    async def _execute_select_related(self) -> list[T]:
-        """Run a JOIN-based select_related query, reusing the Model helper."""
-        db = self.model.db()
+    def _plan_select_related(self) -> tuple[SelectQuery, Callable[[Any], T]]:
+        """Plan a JOIN-based select_related query, reusing the Model helpers."""
         rel_map = self.model._build_rel_map(self.select_related_fields)
         columns, joins = self.model._select_related_columns_and_joins(rel_map)
         base = self.model.table_name()
@@ -282,31 +750,296 @@ class QuerySet(Generic[T]):
             else c
             for c in self.where
         )
+        # ORDER BY too: SQLite rejects a bare name both joined tables share.
+        order = tuple(
+            dataclasses.replace(o, column=dataclasses.replace(o.column, table=base))
+            if o.column.table is None
+            else o
+            for o in self.order
+        )
         query = SelectQuery(
             table=base,
             table_alias=base,
             columns=columns,
             joins=joins,
             where=where,
-            order_by=self.order,
+            order_by=order,
             limit=self.limit_value,
             offset=self.offset_value,
         )
-        sql, params = db.compiler.compile_select(query)
-        rows = await db.fetch(sql, *params)
-        objects = [self.model._hydrate_select_related(row, rel_map) for row in rows]
+        return query, lambda row: self.model._hydrate_select_related(row, rel_map)
+
+    def _reader(self, columns: Sequence[str]) -> Callable[[Sequence[Any]], T]:
+        """Like the hydrator from :meth:`_plan`, but for positional rows named by ``columns``."""
+        if self.select_related_fields:
+            rel_map = self.model._build_rel_map(self.select_related_fields)
+            return self.model._select_related_reader(columns, rel_map)
+        build = (
+            self.model._from_partial_row
+            if self.only_fields or self.defer_fields
+            else self.model._from_row
+        )
+        return lambda row: build(dict(zip(columns, row)))
+
+    async def _execute(self) -> list[T]:
+        query, _ = self._plan()
+        targets = self._targets()
+        with self._scope():
+            if len(targets) == 1:
+                db = targets[0]
+                sql, params = db.compiler.compile_select(query)
+                columns, rows = await db.fetch_tuples(sql, *params)
+            else:
+                columns, rows = await self._fetch_shards(query, targets)
+            return await self._hydrate(rows, self._reader(columns))
+
+    async def _hydrate(self, rows: Iterable[Any], hydrate: Callable[[Any], T]) -> list[T]:
+        """Turn fetched rows into instances and run any ``load_related`` prefetches."""
+        objects = [hydrate(row) for row in rows]
         if self.load_related_fields:
-            await self.model._prefetch_related(objects, list(self.load_related_fields))
+            await self.model._prefetch_related(
+                objects, list(self.load_related_fields), self.use_primary
+            )
         return objects
 
+    async def _stream(self, chunk_size: int) -> AsyncGenerator[T, None]:
+        query, hydrate = self._plan()
+        targets = self._targets()
+        if len(targets) == 1:
+            db = targets[0]
+            sql, params = db.compiler.compile_select(query)
+            source = db.stream(sql, *params, chunk_size=chunk_size)
+        else:
+            source = self._stream_shards(query, targets, chunk_size)
+        async with aclosing(source) as chunks:
+            while True:
+                # Scope the limit to each step only: a context variable set
+                # across ``yield`` would leak into the consumer's code.
+                with self._scope():
+                    rows = await anext(chunks, None)
+                    if rows is None:
+                        break
+                    objects = await self._hydrate(rows, hydrate)
+                for obj in objects:
+                    yield obj
+
+    # -- sharded execution --------------------------------------------------
+
+    @staticmethod
+    def _per_shard(query: SelectQuery) -> tuple[SelectQuery, int, int | None]:
+        """Split ``query`` into the per-shard query and the global ``[start, stop)`` slice.
+
+        Each shard must return its first ``offset + limit`` rows; the offset is
+        applied once, after merging.
+        """
+        start = query.offset or 0
+        stop = None if query.limit is None else start + query.limit
+        return dataclasses.replace(query, limit=stop, offset=None), start, stop
+
+    def _sort_key(
+        self, nulls_first: bool, columns: Sequence[str] | None = None
+    ) -> Callable[[Any], tuple[_SortValue, ...]]:
+        """Build the merge key reproducing this query's ``ORDER BY`` on fetched rows.
+
+        Rows are mappings, or positional rows named by ``columns``.
+        """
+        keys: list[Any] = [term.column.name for term in self.order]
+        if columns is not None:
+            missing = [name for name in keys if name not in columns]
+            if missing:
+                raise self._unmergeable(missing[0])
+            keys = [columns.index(name) for name in keys]
+        terms = list(zip(keys, self.order))
+
+        def key(row: Any) -> tuple[_SortValue, ...]:
+            try:
+                return tuple(_SortValue(row[k], term.descending, nulls_first) for k, term in terms)
+            except KeyError as exc:
+                raise self._unmergeable(exc.args[0]) from None
+
+        return key
+
+    def _unmergeable(self, name: str) -> ValueError:
+        return ValueError(
+            f"Cannot merge shards of {self.model.__name__} on {name!r}: "
+            "order_by() fields must be selected."
+        )
+
+    async def _fetch_shards(
+        self, query: SelectQuery, targets: list[BaseDatabase]
+    ) -> tuple[list[str], list[Any]]:
+        """Run ``query`` on every shard concurrently and merge the positional rows."""
+        per_shard, start, stop = self._per_shard(query)
+
+        async def fetch_on(db: BaseDatabase) -> tuple[list[str], Sequence[Any]]:
+            sql, params = db.compiler.compile_select(per_shard)
+            return await db.fetch_tuples(sql, *params)
+
+        results = await asyncio.gather(*(fetch_on(db) for db in targets))
+        columns = next((names for names, rows in results if rows), [])
+        shards = [rows for _, rows in results if rows]
+        merged: Iterator[Any]
+        if self.order and shards:
+            key = self._sort_key(targets[0].dialect.nulls_first, columns)
+            merged = heapq.merge(*shards, key=key)
+        else:
+            merged = itertools.chain.from_iterable(shards)
+        return columns, list(itertools.islice(merged, start, stop))
+
+    async def _stream_shards(
+        self, query: SelectQuery, targets: list[BaseDatabase], chunk_size: int
+    ) -> AsyncGenerator[list[Any], None]:
+        """Stream every shard through its own cursor and k-way merge the rows.
+
+        At most one chunk per shard is buffered. Unordered queries drain the
+        shards one after another instead.
+        """
+        if not targets:
+            return
+        per_shard, start, stop = self._per_shard(query)
+        sort_key = self._sort_key(targets[0].dialect.nulls_first)
+
+        async def rows_on(db: BaseDatabase) -> AsyncGenerator[Any, None]:
+            sql, params = db.compiler.compile_select(per_shard)
+            async with aclosing(db.stream(sql, *params, chunk_size=chunk_size)) as chunks:
+                async for chunk in chunks:
+                    for row in chunk:
+                        yield row
+
+        async def merged(streams: list[AsyncGenerator[Any, None]]) -> AsyncGenerator[Any, None]:
+            if not self.order:
+                for stream in streams:
+                    async for row in stream:
+                        yield row
+                return
+            heads = await asyncio.gather(*(anext(s, _EXHAUSTED) for s in streams))
+            heap = [(sort_key(row), i, row) for i, row in enumerate(heads) if row is not _EXHAUSTED]
+            heapq.heapify(heap)
+            while heap:
+                _, i, row = heap[0]
+                yield row
+                nxt = await anext(streams[i], _EXHAUSTED)
+                if nxt is _EXHAUSTED:
+                    heapq.heappop(heap)
+                else:
+                    heapq.heapreplace(heap, (sort_key(nxt), i, nxt))
+
+        async with AsyncExitStack() as stack:
+            streams = [await stack.enter_async_context(aclosing(rows_on(db))) for db in targets]
+            chunk: list[Any] = []
+            position = 0
+            async with aclosing(merged(streams)) as rows:
+                async for row in rows:
+                    if stop is not None and position >= stop:
+                        break
+                    if position >= start:
+                        chunk.append(row)
+                        if len(chunk) >= chunk_size:
+                            yield chunk
+                            chunk = []
+                    position += 1
+            if chunk:
+                yield chunk
+
     # -- laziness -----------------------------------------------------------
 
     def __await__(self) -> Generator[Any, None, list[T]]:
         return self._execute().__await__()
 
-    async def __aiter__(self) -> AsyncIterator[T]:
-        for obj in await self._execute():
-            yield obj
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.iterator()
+
+
+@dataclasses.dataclass(frozen=True)
+class ValuesQuerySet:
+    """Rows as dicts, optionally grouped and aggregated: ``QuerySet.values(...)``.
+
+    Built by :meth:`QuerySet.values`; ``queryset`` supplies the model, filters,
+    ordering and slicing. With :meth:`annotate` the rows are grouped by
+    ``fields`` and each carries its aggregates; without, every matching row
+    is returned. Awaiting it (or :meth:`all`) runs one ``SELECT``.
+    """
+
+    queryset: QuerySet[Any]
+    fields: tuple[str, ...]
+    annotations: tuple[Aggregate, ...] = ()
+    having: tuple[Condition, ...] = ()
+
+    def annotate(self, *aggregates: Aggregate, **named: Aggregate) -> ValuesQuerySet:
+        """Group by :attr:`fields` and add aggregates computed per group.
+
+        Positional aggregates are named as in :meth:`QuerySet.aggregate`.
+        """
+        added = self.queryset._named_aggregates(aggregates, named, "annotate")
+        taken = {*self.fields, *(a.alias for a in self.annotations if a.alias)}
+        clashes = sorted(taken.intersection(a.alias for a in added if a.alias))
+        if clashes:
+            raise ValueError(f"annotate() names already in use: {clashes}")
+        return dataclasses.replace(self, annotations=self.annotations + added)
+
+    def filter(self, **lookups: Any) -> ValuesQuerySet:
+        """Filter rows, or groups (``HAVING``) for lookups on an annotation name."""
+        qs = self.queryset
+        aliases = {a.alias for a in self.annotations}
+        conditions = qs.model._conditions_from_kwargs(lookups)
+        having = tuple(c for c in conditions if c.column.name in aliases)
+        where = tuple(c for c in conditions if c.column.name not in aliases)
+        return dataclasses.replace(
+            self,
+            queryset=dataclasses.replace(qs, where=qs.where + where),
+            having=self.having + having,
+        )
+
+    def order_by(self, *fields: str) -> ValuesQuerySet:
+        """Order by fields or annotation names (leading ``-`` = DESC)."""
+        return dataclasses.replace(self, queryset=self.queryset.order_by(*fields))
+
+    def limit(self, n: int) -> ValuesQuerySet:
+        return dataclasses.replace(self, queryset=self.queryset.limit(n))
+
+    def offset(self, n: int) -> ValuesQuerySet:
+        return dataclasses.replace(self, queryset=self.queryset.offset(n))
+
+    def _query(self) -> SelectQuery:
+        qs = self.queryset
+        names = self.fields
+        if not names and not self.annotations:
+            names = tuple(qs.model.model_real_fields())
+        return SelectQuery(
+            table=qs.model.table_name(),
+            columns=tuple(Column(f) for f in names),
+            aggregates=self.annotations,
+            where=qs.where,
+            group_by=tuple(Column(f) for f in names) if self.annotations else (),
+            having=self.having,
+            order_by=qs.order,
+            limit=qs.limit_value,
+            offset=qs.offset_value,
+        )
+
+    async def all(self) -> list[dict[str, Any]]:
+        """Run the query and return its rows as dicts."""
+        qs = self.queryset
+        query = self._query()
+        with qs._scope():
+            targets = qs._targets()
+            if not targets:
+                # An empty ``__in`` filter matches no rows anywhere.
+                return []
+            if len(targets) == 1:
+                sql, params = targets[0].compiler.compile_select(query)
+                columns, rows = await targets[0].fetch_tuples(sql, *params)
+            elif self.annotations:
+                raise ValueError(
+                    "values().annotate() over several shards cannot merge the groups; "
+                    "filter on the shard key to pin one shard"
+                )
+            else:
+                columns, rows = await qs._fetch_shards(query, targets)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def __await__(self) -> Generator[Any, None, list[dict[str, Any]]]:
+        return self.all().__await__()
 
 
 class Manager(Generic[T]):
@@ -351,6 +1084,21 @@ class Manager(Generic[T]):
     def defer(self, *fields: str | FieldRef) -> QuerySet[T]:
         return self.get_queryset().defer(*fields)
 
+    def using(self, alias: str) -> QuerySet[T]:
+        return self.get_queryset().using(alias)
+
+    def primary(self) -> QuerySet[T]:
+        return self.get_queryset().primary()
+
+    def timeout(self, seconds: float) -> QuerySet[T]:
+        return self.get_queryset().timeout(seconds)
+
+    def lane(self, name: str) -> QuerySet[T]:
+        return self.get_queryset().lane(name)
+
+    def iterator(self, chunk_size: int = constants.DEFAULT_CHUNK_SIZE) -> AsyncIterator[T]:
+        return self.get_queryset().iterator(chunk_size)
+
     async def all(self) -> list[T]:
         return await self.get_queryset().all()
 
@@ -366,6 +1114,12 @@ class Manager(Generic[T]):
     async def exists(self) -> bool:
         return await self.get_queryset().exists()
 
+    async def aggregate(self, *aggregates: Aggregate, **named: Aggregate) -> dict[str, Any]:
+        return await self.get_queryset().aggregate(*aggregates, **named)
+
+    def values(self, *fields: str | FieldRef) -> ValuesQuerySet:
+        return self.get_queryset().values(*fields)
+
     async def create(self, **kwargs: Any) -> T:
         """Create, persist, and return a new instance.
 
@@ -385,12 +1139,20 @@ class Manager(Generic[T]):
     ) -> tuple[T, bool]:
         """Return ``(instance, created)``.
 
-        Tries to fetch a row matching ``lookups``; if none exists, creates one
-        with ``{**lookups, **defaults}``. The second tuple element is ``True``
-        when a new row was inserted.
+        Fetches the row matching ``lookups``; if none exists, creates one with
+        ``{**lookups, **defaults}``. The second tuple element is ``True`` when
+        a new row was inserted.
+
+        When a lookup is the primary key or a ``unique`` field, this is a
+        single ``INSERT ... ON CONFLICT DO NOTHING`` on that field, so
+        concurrent callers can never create duplicates. The row is read back
+        only if it already existed. Other lookups fall back to a read followed
+        by an insert, which is not atomic.
 
-        Note: this is not atomic. Wrap in a transaction when strict uniqueness
-        under concurrent writes is required.
+        Raises :class:`IntegrityError` when the new row collides on a
+        different unique field than the lookup's. Postgres and SQLite raise
+        their driver's error for that; MySQL skips the insert on any unique
+        key, so the clash is found when the row is read back.
 
         Example::
 
@@ -399,20 +1161,548 @@ class Manager(Generic[T]):
                 defaults={"email": "alice@ex.com", "is_active": True},
             )
         """
+        target = self._conflict_target(lookups)
+        if target is None:
+            try:
+                # Read from the primary: a lagging replica would miss a fresh row.
+                obj = await self.get_queryset().primary().get(**lookups)
+                return obj, False
+            except self.model.DoesNotExist:
+                obj = await self.create(**(lookups | (defaults or {})))
+                return obj, True
+        obj = self.model(**(lookups | (defaults or {})))
+        if await self._insert_unless_conflict(obj, target):
+            return obj, True
         try:
-            obj = await self.get(**lookups)
-            return obj, False
+            return await self.get_queryset().primary().get(**lookups), False
         except self.model.DoesNotExist:
-            obj = await self.create(**(lookups | (defaults or {})))
+            # MySQL skips the insert on a clash with *any* unique key, so the
+            # row that blocked it may not match ``lookups`` at all.
+            raise await self._conflict_error(obj, target) from None
+
+    async def update_or_create(
+        self, defaults: dict[str, Any] | None = None, **lookups: Any
+    ) -> tuple[T, bool]:
+        """Write ``defaults`` to the row matching ``lookups`` and return ``(instance, created)``.
+
+        Creates the row with ``{**lookups, **defaults}`` if it does not exist,
+        otherwise updates its ``defaults`` columns. When a lookup is the
+        primary key or a ``unique`` field, this is one ``INSERT ... ON CONFLICT
+        DO UPDATE`` statement where the dialect reports whether it inserted:
+        Postgres returns the row with an ``xmax = 0`` flag, and MySQL's
+        affected-row count tells the two apart (the row is then read back, as
+        there is no ``RETURNING``). Elsewhere, and for other lookups, it is
+        :meth:`get_or_create` followed by an ``UPDATE``, retried if the row
+        disappears in between.
+
+        Raises :class:`IntegrityError` like :meth:`get_or_create` when the row
+        collides on a different unique field than the lookup's.
+
+        Example::
+
+            user, created = await User.objects.update_or_create(
+                id=user_id, defaults={"email": "new@ex.com"}
+            )
+        """
+        values = defaults or {}
+        target = self._conflict_target(lookups)
+        if target is None or not values:
+            return await self._update_or_create_in_steps(values, lookups)
+        obj = self.model(**(lookups | values))
+        db = obj._instance_db()
+        outcome = db.dialect.upsert_outcome
+        if outcome is None:
+            return await self._update_or_create_in_steps(values, lookups)
+        pk_name = self.model.primary_key()
+        fields = tuple(self.model.model_real_fields())
+        columns = tuple(f for f in fields if f != pk_name or getattr(obj, pk_name) is not None)
+        query = InsertQuery(
+            table=self.model.table_name(),
+            columns=columns,
+            values=tuple(getattr(obj, c) for c in columns),
+            on_conflict=OnConflict(target, tuple(values), strict=True),
+        )
+        if outcome == "returning":
+            query = dataclasses.replace(query, returning=fields, returning_inserted=_INSERTED)
+            sql, params = db.compiler.compile_insert(query)
+            row = dict(await db.fetchrow(sql, *params))
+            inserted = bool(row.pop(_INSERTED))
+            return self.model._from_row(row), inserted
+        sql, params = db.compiler.compile_insert(query)
+        inserted = await db.execute_returning_rowcount(sql, *params) == 1
+        if inserted and getattr(obj, pk_name) is not None:
+            obj._persisted = True
             return obj, True
+        try:
+            found = await self.get_queryset().primary().get(**lookups)
+        except self.model.DoesNotExist:
+            raise await self._conflict_error(obj, target) from None
+        if not inserted and any(getattr(found, k) != getattr(obj, k) for k in values):
+            # The collision was on another unique key; ``strict`` left that
+            # row alone and the lookup's row was not written either.
+            raise await self._conflict_error(obj, target)
+        return found, inserted
+
+    async def _update_or_create_in_steps(
+        self, values: dict[str, Any], lookups: dict[str, Any]
+    ) -> tuple[T, bool]:
+        """:meth:`get_or_create`, then ``UPDATE`` an existing row by primary key."""
+        pk_name = self.model.primary_key()
+        while True:
+            obj, created = await self.get_or_create(values, **lookups)
+            if created or not values:
+                return obj, created
+            pk = getattr(obj, pk_name)
+            if await self.get_queryset().filter(**{pk_name: pk}).update(**values):
+                for name, value in values.items():
+                    setattr(obj, name, value)
+                return obj, False
+            # Deleted since it was read: look it up (or create it) again.
+
+    def _conflict_target(self, lookups: dict[str, Any]) -> tuple[str, ...] | None:
+        """The first equality lookup on the primary key or a ``unique`` field, if any."""
+        pk_name = self.model.primary_key()
+        for name in lookups:
+            if name in self.model.model_real_fields() and (
+                name == pk_name or self.model._field_meta(name).unique
+            ):
+                return (name,)
+        return None
+
+    async def _conflict_error(self, obj: T, target: tuple[str, ...]) -> IntegrityError:
+        """Describe the unique field(s) other than ``target`` on which ``obj`` collided."""
+        pk_name = self.model.primary_key()
+        clashes = []
+        for name in self.model.model_real_fields():
+            value = getattr(obj, name)
+            if (
+                name not in target
+                and value is not None
+                and (name == pk_name or self.model._field_meta(name).unique)
+                and await self.get_queryset().primary().filter(**{name: value}).exists()
+            ):
+                clashes.append(name)
+        where = f"unique field(s) {clashes}" if clashes else "another unique key"
+        return IntegrityError(
+            f"{self.model.__name__} row not inserted: it collides with an existing row "
+            f"on {where}, not on {list(target)}"
+        )
+
+    async def _insert_unless_conflict(self, obj: T, target: tuple[str, ...]) -> bool:
+        """Insert ``obj`` unless a row collides on ``target``; return whether it was inserted."""
+        db = obj._instance_db()
+        pk_name = self.model.primary_key()
+        with_pk = getattr(obj, pk_name, None) is not None
+        columns = tuple(f for f in self.model.model_real_fields() if with_pk or f != pk_name)
+        query = InsertQuery(
+            table=self.model.table_name(),
+            columns=columns,
+            values=tuple(getattr(obj, c) for c in columns),
+            returning=pk_name if db.dialect.supports_returning else None,
+            on_conflict=OnConflict(target),
+        )
+        sql, params = db.compiler.compile_insert(query)
+        if query.returning:
+            row = await db.fetchrow(sql, *params)
+            if row is None:
+                return False
+            if not with_pk:
+                setattr(obj, pk_name, row[pk_name])
+        elif await db.execute_returning_rowcount(sql, *params) == 0:
+            return False
+        elif not with_pk:
+            # No RETURNING: read the generated key back by the conflict target.
+            lookup = {name: getattr(obj, name) for name in target}
+            found = await self.get_queryset().primary().get(**lookup)
+            setattr(obj, pk_name, getattr(found, pk_name))
+        obj._persisted = True
+        return True
+
+    async def bulk_create(
+        self, objs: Iterable[T | dict[str, Any]], batch_size: int | None = None
+    ) -> list[T]:
+        """Insert ``objs`` with multi-row ``INSERT`` statements and return the instances.
+
+        ``objs`` may be model instances or dicts (validated through the model).
+        Each statement carries at most ``batch_size`` rows, and never more
+        than the dialect's parameter limit allows. Generated primary keys are
+        written back: from ``RETURNING`` where the dialect supports it, else
+        from the consecutive keys ending (SQLite) or starting (MySQL) at the
+        driver's ``lastrowid``. The instances are marked persisted, so a later
+        ``save()`` updates them. Objects of a sharded model are grouped per
+        shard.
+
+        The primary key must be set on every object or on none. Batches are
+        separate statements, so a failure part-way leaves the earlier batches
+        inserted.
+
+        Example::
+
+            users = await User.objects.bulk_create(
+                [User(username=f"user{n}") for n in range(10_000)], batch_size=2_000
+            )
+        """
+        return await self._bulk_insert("bulk_create()", objs, batch_size)
+
+    async def upsert(
+        self,
+        obj: T | dict[str, Any],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+    ) -> T:
+        """Insert ``obj``, or update the row it collides with on ``conflict_fields``.
+
+        A single-row :meth:`bulk_upsert`.
+        """
+        return (await self.bulk_upsert([obj], conflict_fields, update_fields))[0]
+
+    async def bulk_upsert(
+        self,
+        objs: Iterable[T | dict[str, Any]],
+        conflict_fields: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+        batch_size: int | None = None,
+    ) -> list[T]:
+        """Insert ``objs``, updating rows that collide on ``conflict_fields``, in bulk.
+
+        ``conflict_fields`` must be the primary key or a unique key.
+        ``update_fields`` are overwritten with the incoming values on a
+        collision. By default that is every column except the primary key and
+        the conflict fields; ``[]`` leaves colliding rows untouched. Each batch
+        is one ``INSERT ... ON CONFLICT (...) DO UPDATE`` statement (``ON
+        DUPLICATE KEY UPDATE`` on MySQL), batched as in :meth:`bulk_create`.
+
+        Instances without a primary key get the key of the row they inserted
+        or collided with. ``RETURNING`` provides these keys where available,
+        and one ``SELECT`` per batch on the first conflict field fetches any
+        that are missing (on MySQL, or for rows left untouched). Conflict
+        values must not repeat within one call: a statement cannot update the
+        same row twice.
+
+        Example::
+
+            await Product.objects.bulk_upsert(feed, conflict_fields=["sku"])
+        """
+        fields = self.model.model_real_fields()
+        pk_name = self.model.primary_key()
+        unknown = {*conflict_fields, *(update_fields or ())} - set(fields)
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.model.__name__}: {sorted(unknown)}")
+        if update_fields is None:
+            update_fields = [f for f in fields if f != pk_name and f not in conflict_fields]
+        on_conflict = OnConflict(tuple(conflict_fields), tuple(update_fields))
+        return await self._bulk_insert("bulk_upsert()", objs, batch_size, on_conflict)
+
+    async def _bulk_insert(
+        self,
+        name: str,
+        objs: Iterable[T | dict[str, Any]],
+        batch_size: int | None,
+        on_conflict: OnConflict | None = None,
+    ) -> list[T]:
+        """Shared body of :meth:`bulk_create` and :meth:`bulk_upsert` (``name`` is for errors)."""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"{name} batch_size must be >= 1")
+        instances = [self._coerce(obj) for obj in objs]
+        if not instances:
+            return []
+        pk_name = self.model.primary_key()
+        with_pk = getattr(instances[0], pk_name, None) is not None
+        if any((getattr(obj, pk_name, None) is not None) != with_pk for obj in instances):
+            raise ValueError(
+                f"{name} objects must either all set the primary key or all leave it unset"
+            )
+        columns = tuple(f for f in self.model.model_real_fields() if with_pk or f != pk_name)
+        groups: dict[BaseDatabase, list[T]] = {}
+        if self.model.shard_key() is None:
+            groups[self.model.db()] = instances
+        else:
+            for obj in instances:
+                groups.setdefault(obj._instance_db(), []).append(obj)
+        for db, group in groups.items():
+            per_batch = max(1, db.dialect.max_params // len(columns))
+            if batch_size is not None:
+                per_batch = min(per_batch, batch_size)
+            for start in range(0, len(group), per_batch):
+                batch = group[start : start + per_batch]
+                await self._insert_batch(db, columns, batch, with_pk, on_conflict)
+        for obj in instances:
+            obj._persisted = True
+        return instances
+
+    async def _insert_batch(
+        self,
+        db: BaseDatabase,
+        columns: tuple[str, ...],
+        batch: list[T],
+        with_pk: bool,
+        on_conflict: OnConflict | None,
+    ) -> None:
+        """Insert ``batch`` with one statement, backfilling generated primary keys."""
+        pk_name = self.model.primary_key()
+        dialect = db.dialect
+        returning: str | tuple[str, ...] | None = None
+        if not with_pk and dialect.supports_returning:
+            returning = pk_name if on_conflict is None else (pk_name, *on_conflict.columns)
+        query = InsertQuery(
+            table=self.model.table_name(),
+            columns=columns,
+            rows=tuple(tuple(getattr(obj, c) for c in columns) for obj in batch),
+            returning=returning,
+            on_conflict=on_conflict,
+        )
+        sql, params = db.compiler.compile_insert(query)
+        if with_pk:
+            await db.execute(sql, *params)
+        elif on_conflict is not None:
+            await self._upsert_keys(db, sql, params, batch, on_conflict.columns)
+        elif query.returning:
+            rows = await db.fetch(sql, *params)
+            for obj, row in zip(batch, rows, strict=True):
+                setattr(obj, pk_name, row[pk_name])
+        else:
+            key = await db.execute_insert(sql, *params)
+            if key is None:
+                return
+            first = key - len(batch) + 1 if dialect.bulk_lastrowid == "last" else key
+            for offset, obj in enumerate(batch):
+                setattr(obj, pk_name, first + offset)
+
+    async def _upsert_keys(
+        self,
+        db: BaseDatabase,
+        sql: str,
+        params: list[Any],
+        batch: list[T],
+        target: tuple[str, ...],
+    ) -> None:
+        """Run an upsert and give each object in ``batch`` the key of its row.
+
+        Rows are matched on their ``target`` values: from ``RETURNING`` where
+        the dialect has it, then by selecting the rows still unaccounted for.
+        """
+        pk_name = self.model.primary_key()
+        keys: dict[tuple[Any, ...], Any] = {}
+        if db.dialect.supports_returning:
+            for row in await db.fetch(sql, *params):
+                keys[tuple(row[c] for c in target)] = row[pk_name]
+        else:
+            await db.execute(sql, *params)
+        missing = {
+            getattr(obj, target[0])
+            for obj in batch
+            if tuple(getattr(obj, c) for c in target) not in keys
+        }
+        if missing:
+            query = SelectQuery(
+                table=self.model.table_name(),
+                columns=(Column(pk_name), *(Column(c) for c in target)),
+                where=(Condition(Column(target[0]), Operator.IN, list(missing)),),
+            )
+            select, select_params = db.compiler.compile_select(query)
+            _, rows = await db.fetch_tuples(select, *select_params)
+            for row in rows:
+                keys[tuple(row[1:])] = row[0]
+        for obj in batch:
+            key = keys.get(tuple(getattr(obj, c) for c in target))
+            if key is not None:
+                setattr(obj, pk_name, key)
+
+    async def bulk_update(
+        self, objs: Iterable[T], fields: Sequence[str], batch_size: int | None = None
+    ) -> int:
+        """Write ``fields`` of the saved instances ``objs`` in one statement per batch.
+
+        Rather than one ``UPDATE ... WHERE pk = ?`` round trip per instance,
+        each batch is a single ``UPDATE`` that matches rows on the primary key
+        and gives each its own values: ``UPDATE ... FROM (VALUES ...)`` on
+        Postgres, a ``JOIN`` on a derived table on MySQL, and ``CASE pk WHEN
+        ...`` expressions on SQLite. Batches hold at most ``batch_size`` rows
+        and stay under the dialect's parameter limit. Returns the number of
+        rows updated.
+
+        Like ``save()``, a partially-loaded instance (``only()`` / ``defer()``)
+        only writes the listed fields it actually fetched, so un-fetched
+        columns are never clobbered; such instances are batched by the subset
+        they write. Every instance needs its primary key, each at most once.
+        Objects of a sharded model are grouped per shard.
+
+        Example::
 
-    async def update(self, **kwargs: Any) -> int:
-        """Bulk-update all rows for this model and return the number affected."""
-        return await self.get_queryset().update(**kwargs)
+            for product in products:
+                product.price = reprice(product)
+            await Product.objects.bulk_update(products, ["price"], batch_size=1_000)
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("bulk_update() batch_size must be >= 1")
+        model_fields = self.model.model_real_fields()
+        pk_name = self.model.primary_key()
+        if not fields:
+            raise ValueError("bulk_update() needs at least one field to update")
+        unknown = set(fields) - set(model_fields)
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.model.__name__}: {sorted(unknown)}")
+        if pk_name in fields:
+            raise ValueError("bulk_update() cannot update the primary key")
+        groups: dict[tuple[BaseDatabase, tuple[str, ...]], list[T]] = {}
+        seen: set[Any] = set()
+        for obj in objs:
+            pk = getattr(obj, pk_name, None)
+            if pk is None:
+                raise ValueError("bulk_update() objects must have their primary key set")
+            if pk in seen:
+                raise ValueError(f"bulk_update() got primary key {pk!r} more than once")
+            seen.add(pk)
+            loaded = obj._loaded_fields
+            columns = tuple(f for f in fields if loaded is None or f in loaded)
+            if columns:
+                groups.setdefault((obj._instance_db(), columns), []).append(obj)
+        count = 0
+        for (db, columns), group in groups.items():
+            dialect = db.dialect
+            types = tuple(
+                _sql_type(dialect, model_fields[name].annotation) for name in (pk_name, *columns)
+            )
+            per_batch = max(1, dialect.max_params // dialect.bulk_update_params(len(columns)))
+            if batch_size is not None:
+                per_batch = min(per_batch, batch_size)
+            for start in range(0, len(group), per_batch):
+                batch = group[start : start + per_batch]
+                query = BulkUpdateQuery(
+                    table=self.model.table_name(),
+                    key=pk_name,
+                    columns=columns,
+                    rows=tuple(
+                        (getattr(obj, pk_name), *(getattr(obj, c) for c in columns))
+                        for obj in batch
+                    ),
+                    types=types,
+                )
+                sql, params = db.compiler.compile_bulk_update(query)
+                count += await db.execute_returning_rowcount(sql, *params)
+        return count
+
+    async def bulk_copy(
+        self,
+        objs: Iterable[T | dict[str, Any]] | AsyncIterable[T | dict[str, Any]],
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> BulkCopyResult:
+        """Bulk-load rows through the backend's fastest path and report throughput.
+
+        ``objs`` may be model instances or dicts (validated through the model)
+        from a sync or async iterable; it is consumed incrementally, so memory
+        stays bounded. Postgres streams the rows with ``COPY``; other backends
+        send multi-row ``INSERT`` batches of up to ``batch_size`` rows. Columns
+        follow :meth:`~riverorm.models.Model.model_real_fields` order, and the
+        primary key column is written only if the first record sets it. Records
+        of a sharded model are grouped per shard and flushed in batches.
+
+        Unlike ``save()``, instances are not updated: generated primary keys are
+        not read back and ``_persisted`` is left untouched.
+
+        Example::
 
-    async def delete(self) -> int:
-        """Bulk-delete all rows for this model and return the number deleted."""
-        return await self.get_queryset().delete()
+            result = await Event.objects.bulk_copy(read_events())
+            print(f"{result.rows} rows at {result.rows_per_second:.0f} rows/s")
+        """
+        pk_name = self.model.primary_key()
+        started = time.perf_counter()
+        records = _iterate(objs)
+        first = await anext(records, None)
+        if first is None:
+            return BulkCopyResult(rows=0, seconds=time.perf_counter() - started)
+        first_obj = self._coerce(first)
+        with_pk = getattr(first_obj, pk_name, None) is not None
+        columns = [f for f in self.model.model_real_fields() if with_pk or f != pk_name]
+
+        async def rows() -> AsyncGenerator[tuple[Any, ...], None]:
+            yield tuple(getattr(first_obj, c) for c in columns)
+            async for item in records:
+                obj = self._coerce(item)
+                if (getattr(obj, pk_name, None) is not None) != with_pk:
+                    raise ValueError(
+                        "bulk_copy() records must either all set the primary key or all leave "
+                        "it unset"
+                    )
+                yield tuple(getattr(obj, c) for c in columns)
+
+        if self.model.shard_key() is None:
+            db = self.model.db()
+            count = await db.copy_records(self.model.table_name(), columns, rows(), batch_size)
+        else:
+            count = await self._copy_sharded(columns, rows(), batch_size)
+        return BulkCopyResult(rows=count, seconds=time.perf_counter() - started)
+
+    async def _copy_sharded(
+        self,
+        columns: list[str],
+        records: AsyncIterable[tuple[Any, ...]],
+        batch_size: int,
+    ) -> int:
+        """Route each record to its shard, copying up to ``batch_size`` rows at a time."""
+        key = self.model.shard_key()
+        if key not in columns:
+            raise ValueError(f"bulk_copy() records of {self.model.__name__} must set '{key}'")
+        key_index = columns.index(key)
+        shard_map = self.model._shard_map()
+        table = self.model.table_name()
+        batches: dict[str, list[tuple[Any, ...]]] = {}
+        count = 0
+
+        async def flush(alias: str) -> int:
+            batch = batches.pop(alias)
+            db = DatabaseRegistry.get(alias)
+            return await db.copy_records(table, columns, _iterate(batch), batch_size)
+
+        async for row in records:
+            alias = shard_map.alias_for(row[key_index])
+            batch = batches.setdefault(alias, [])
+            batch.append(row)
+            if len(batch) >= batch_size:
+                count += await flush(alias)
+        for alias in list(batches):
+            count += await flush(alias)
+        return count
+
+    def _coerce(self, item: T | dict[str, Any]) -> T:
+        """Return ``item`` as an instance of the model, validating dicts."""
+        if isinstance(item, dict):
+            return self.model(**item)
+        if not isinstance(item, self.model):
+            raise TypeError(
+                f"Expected {self.model.__name__} instances or dicts, got {type(item).__name__}"
+            )
+        return item
+
+    @overload
+    async def update(self, *, returning: Literal[False] = False, **kwargs: Any) -> int: ...
+
+    @overload
+    async def update(
+        self, *, returning: Literal[True] | Sequence[str], **kwargs: Any
+    ) -> list[T]: ...
+
+    async def update(
+        self, *, returning: bool | Sequence[str] = False, **kwargs: Any
+    ) -> int | list[T]:
+        """Bulk-update all rows for this model and return the number affected.
+
+        See :meth:`QuerySet.update` for ``returning``.
+        """
+        return await self.get_queryset().update(returning=returning, **kwargs)
+
+    @overload
+    async def delete(self, *, returning: Literal[False] = False) -> int: ...
+
+    @overload
+    async def delete(self, *, returning: Literal[True] | Sequence[str]) -> list[T]: ...
+
+    async def delete(self, *, returning: bool | Sequence[str] = False) -> int | list[T]:
+        """Bulk-delete all rows for this model and return the number deleted.
+
+        See :meth:`QuerySet.delete` for ``returning``.
+        """
+        return await self.get_queryset().delete(returning=returning)
 
 
 class ManagerDescriptor:
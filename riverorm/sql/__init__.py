@@ -5,20 +5,29 @@ dataclasses in :mod:`riverorm.sql.query`) and *rendering* it to a concrete SQL
 string for a particular database (:class:`~riverorm.sql.dialect.Dialect` plus
 :class:`~riverorm.sql.compiler.Compiler`).
 
-It is intentionally pure: no database connections, no I/O.
+It is intentionally pure: no database connections, no I/O. Rendered SQL is
+cached by query shape in :data:`~riverorm.sql.cache.shared_cache`.
 """
 
 from __future__ import annotations
 
+from .cache import SQLCache as SQLCache
+from .cache import SQLCacheStats as SQLCacheStats
+from .cache import shared_cache as shared_cache
 from .compiler import Compiler as Compiler
 from .dialect import Dialect as Dialect
 from .dialect import MySQLDialect as MySQLDialect
 from .dialect import PostgresDialect as PostgresDialect
+from .dialect import SQLiteDialect as SQLiteDialect
+from .query import Aggregate as Aggregate
+from .query import AggregateFunction as AggregateFunction
+from .query import BulkUpdateQuery as BulkUpdateQuery
 from .query import Column as Column
 from .query import Condition as Condition
 from .query import DeleteQuery as DeleteQuery
 from .query import InsertQuery as InsertQuery
 from .query import Join as Join
+from .query import OnConflict as OnConflict
 from .query import Operator as Operator
 from .query import OrderBy as OrderBy
 from .query import SelectQuery as SelectQuery
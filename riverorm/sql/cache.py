@@ -0,0 +1,76 @@
+"""A bounded LRU cache of rendered SQL, keyed by query *shape*.
+
+Hot code paths issue the same few statements over and over with different
+values. The :class:`~riverorm.sql.compiler.Compiler` therefore keys each
+query by its structure with the parameter values stripped out (tables,
+columns, joins, operators, ordering, ``LIMIT``/``OFFSET``, and the length of
+each ``IN`` list) plus the dialect's :attr:`~riverorm.sql.dialect.Dialect.cache_key`.
+On a hit only the parameter list is rebuilt; the SQL string is reused.
+
+Compilers share :data:`shared_cache` by default, so the short-lived
+``Compiler`` each ``BaseDatabase.compiler`` access creates still hits it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+#: Default number of statement shapes kept by :data:`shared_cache`.
+DEFAULT_SQL_CACHE_SIZE = 1024
+
+
+@dataclass
+class SQLCacheStats:
+    """Cumulative counters for one :class:`SQLCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (``0.0`` before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SQLCache:
+    """Least-recently-used map of query shape -> rendered SQL, holding at most ``max_size``."""
+
+    def __init__(self, max_size: int = DEFAULT_SQL_CACHE_SIZE) -> None:
+        if max_size < 1:
+            raise ValueError("SQLCache.max_size must be >= 1")
+        self.max_size = max_size
+        self.stats = SQLCacheStats()
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> str | None:
+        """Return the SQL cached for ``key`` (marking it recently used), else ``None``."""
+        sql = self._entries.get(key)
+        if sql is None:
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return sql
+
+    def put(self, key: Hashable, sql: str) -> None:
+        """Cache ``sql`` for ``key``, evicting the least recently used shape if full."""
+        self._entries[key] = sql
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached statement (the counters are kept)."""
+        self._entries.clear()
+
+
+#: The cache every :class:`~riverorm.sql.compiler.Compiler` uses unless given another.
+shared_cache = SQLCache()
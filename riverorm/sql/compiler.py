@@ -2,16 +2,25 @@
 
 The :class:`Compiler` is dialect-agnostic: every identifier passes through
 ``dialect.quote()`` and every value becomes a positional parameter rendered via
-``dialect.placeholder(i)``. Swapping the :class:`~riverorm.sql.dialect.Dialect`
-is the only thing needed to target a different database.
+``dialect.placeholder(i)`` (an ``IN`` list becomes one array parameter on
+dialects with ``array_params``; an empty one renders as a constant). Swapping
+the :class:`~riverorm.sql.dialect.Dialect` is the only thing needed to target
+a different database.
+
+Rendered SQL is cached by query shape (see :mod:`riverorm.sql.cache`): a
+repeated shape only rebuilds its parameter list.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from typing import Any
 
+from .cache import SQLCache, shared_cache
 from .dialect import Dialect
 from .query import (
+    Aggregate,
+    BulkUpdateQuery,
     Column,
     Condition,
     DeleteQuery,
@@ -25,17 +34,129 @@ from .query import (
 class Compiler:
     """Compile query dataclasses into SQL strings + positional params."""
 
-    def __init__(self, dialect: Dialect) -> None:
+    def __init__(self, dialect: Dialect, cache: SQLCache | None = shared_cache) -> None:
+        """``cache=None`` renders every query from scratch."""
         self.dialect = dialect
+        self.cache = cache
 
     # -- public API ---------------------------------------------------------
 
     def compile_select(self, query: SelectQuery) -> tuple[str, list[Any]]:
+        key = (
+            "select",
+            query.table,
+            query.columns,
+            query.table_alias,
+            query.joins,
+            _where_shape(query.where, self.dialect.array_params),
+            query.order_by,
+            query.limit,
+            query.offset,
+            query.count,
+            query.for_update,
+            query.aggregates,
+            query.group_by,
+            _where_shape(query.having, self.dialect.array_params),
+        )
+        array_params = self.dialect.array_params
+        return self._cached(
+            key,
+            lambda: self._compile_select(query),
+            lambda: _where_params(
+                query.having, array_params, _where_params(query.where, array_params, [])
+            ),
+        )
+
+    def compile_insert(self, query: InsertQuery) -> tuple[str, list[Any]]:
+        rows = query.rows or (query.values,)
+        key = (
+            "insert",
+            query.table,
+            query.columns,
+            query.returning,
+            query.on_conflict,
+            query.returning_inserted,
+            tuple(map(len, rows)),
+        )
+        return self._cached(
+            key,
+            lambda: self._compile_insert(query),
+            lambda: [value for row in rows for value in row],
+        )
+
+    def compile_update(self, query: UpdateQuery) -> tuple[str, list[Any]]:
+        key = (
+            "update",
+            query.table,
+            query.columns,
+            _where_shape(query.where, self.dialect.array_params),
+            query.returning,
+        )
+        return self._cached(
+            key,
+            lambda: self._compile_update(query),
+            lambda: _where_params(query.where, self.dialect.array_params, list(query.values)),
+        )
+
+    def compile_bulk_update(self, query: BulkUpdateQuery) -> tuple[str, list[Any]]:
+        key = (
+            "bulk_update",
+            query.table,
+            query.key,
+            query.columns,
+            query.types,
+            len(query.rows),
+        )
+        return self._cached(
+            key,
+            lambda: self._compile_bulk_update(query),
+            lambda: _bulk_update_params(query, self.dialect),
+        )
+
+    def compile_delete(self, query: DeleteQuery) -> tuple[str, list[Any]]:
+        key = (
+            "delete",
+            query.table,
+            _where_shape(query.where, self.dialect.array_params),
+            query.returning,
+        )
+        return self._cached(
+            key,
+            lambda: self._compile_delete(query),
+            lambda: _where_params(query.where, self.dialect.array_params, []),
+        )
+
+    # -- rendering ----------------------------------------------------------
+
+    def _cached(
+        self,
+        key: tuple[Hashable, ...],
+        render: Callable[[], tuple[str, list[Any]]],
+        params: Callable[[], list[Any]],
+    ) -> tuple[str, list[Any]]:
+        """Return the cached SQL for ``key`` with fresh ``params()``, else ``render()`` it."""
+        cache = self.cache
+        if cache is None:
+            return render()
+        key = (self.dialect.cache_key, *key)
+        sql = cache.get(key)
+        if sql is not None:
+            return sql, params()
+        sql, values = render()
+        cache.put(key, sql)
+        return sql, values
+
+    def _compile_select(self, query: SelectQuery) -> tuple[str, list[Any]]:
         params: list[Any] = []
         if query.count:
             columns = "COUNT(*)"
-        elif query.columns:
-            columns = ", ".join(self._render_column(c, projection=True) for c in query.columns)
+        elif query.columns or query.aggregates:
+            columns = ", ".join(
+                [
+                    *(self._render_column(c, projection=True) for c in query.columns),
+                    *(self._render_aggregate(a, projection=True) for a in query.aggregates),
+                ]
+            )
         else:
             columns = "*"
         table = self.dialect.quote(query.table)
@@ -53,6 +174,19 @@ class Compiler:
             )
 
         sql += self._render_where(query.where, params)
+        if query.group_by:
+            sql += f" GROUP BY {', '.join(self._render_column(c) for c in query.group_by)}"
+        if query.having:
+            aggregates = {a.alias: a for a in query.aggregates if a.alias}
+            clauses = []
+            for condition in query.having:
+                aggregate = aggregates.get(condition.column.name)
+                if aggregate is None:
+                    raise ValueError(f"HAVING names unknown aggregate {condition.column.name!r}")
+                clauses.append(
+                    self._render_condition(condition, params, self._render_aggregate(aggregate))
+                )
+            sql += " HAVING " + " AND ".join(clauses)
 
         if query.order_by:
             terms = ", ".join(
@@ -60,25 +194,32 @@ class Compiler:
                 for o in query.order_by
             )
             sql += f" ORDER BY {terms}"
-        if query.limit is not None:
-            sql += f" LIMIT {query.limit}"
-        if query.offset is not None:
-            sql += f" OFFSET {query.offset}"
+        sql += self.dialect.render_limit(query.limit, query.offset)
+        if query.for_update and self.dialect.row_locks:
+            sql += " FOR UPDATE"
 
         return sql, params
 
-    def compile_insert(self, query: InsertQuery) -> tuple[str, list[Any]]:
-        params: list[Any] = list(query.values)
+    def _compile_insert(self, query: InsertQuery) -> tuple[str, list[Any]]:
+        rows = query.rows or (query.values,)
+        params: list[Any] = [value for row in rows for value in row]
         cols = ", ".join(self.dialect.quote(c) for c in query.columns)
-        placeholders = ", ".join(self.dialect.placeholder(i + 1) for i in range(len(query.values)))
-        sql = f"INSERT INTO {self.dialect.quote(query.table)} ({cols}) VALUES ({placeholders})"
-        if query.returning:
-            clause = self.dialect.render_returning(query.returning)
-            if clause:
-                sql += f" {clause}"
+        width = len(query.columns)
+        groups = ", ".join(
+            "("
+            + ", ".join(self.dialect.placeholder(r * width + i + 1) for i in range(len(row)))
+            + ")"
+            for r, row in enumerate(rows)
+        )
+        sql = f"INSERT INTO {self.dialect.quote(query.table)} ({cols}) VALUES {groups}"
+        if query.on_conflict:
+            sql += f" {self.dialect.render_on_conflict(query.on_conflict)}"
+        sql += self._render_returning(query.returning)
+        if query.returning_inserted:
+            sql += f", {self.dialect.render_inserted_flag(query.returning_inserted)}"
         return sql, params
 
-    def compile_update(self, query: UpdateQuery) -> tuple[str, list[Any]]:
+    def _compile_update(self, query: UpdateQuery) -> tuple[str, list[Any]]:
         params: list[Any] = list(query.values)
         assignments = ", ".join(
             f"{self.dialect.quote(col)} = {self.dialect.placeholder(i + 1)}"
@@ -86,13 +227,80 @@ class Compiler:
         )
         sql = f"UPDATE {self.dialect.quote(query.table)} SET {assignments}"
         sql += self._render_where(query.where, params)
+        return sql + self._render_returning(query.returning), params
+
+    def _compile_bulk_update(self, query: BulkUpdateQuery) -> tuple[str, list[Any]]:
+        q = self.dialect.quote
+        table = q(query.table)
+        style = self.dialect.bulk_update_style
+        if style == "case":
+            params: list[Any] = []
+            cases = []
+            for i, col in enumerate(query.columns):
+                branches = []
+                for row in query.rows:
+                    params.extend((row[0], row[i + 1]))
+                    branches.append(
+                        f"WHEN {self.dialect.placeholder(len(params) - 1)}"
+                        f" THEN {self.dialect.placeholder(len(params))}"
+                    )
+                cases.append(f"{q(col)} = CASE {q(query.key)} {' '.join(branches)} END")
+            sql = f"UPDATE {table} SET {', '.join(cases)}"
+            keys = [row[0] for row in query.rows]
+            return sql + self._render_where(
+                (Condition(Column(query.key), Operator.IN, keys),), params
+            ), params
+
+        params = [value for row in query.rows for value in row]
+        names = (query.key, *query.columns)
+        width = len(names)
+        alias = q("_v")
+        if style == "values":
+            # Parameters in a VALUES list have no column to take a type from;
+            # casting the first row's types the rest (and the derived columns).
+            types = query.types or ("",) * width
+            first = ", ".join(
+                f"CAST({self.dialect.placeholder(i + 1)} AS {t})"
+                if t
+                else self.dialect.placeholder(i + 1)
+                for i, t in enumerate(types)
+            )
+            rest = (
+                "("
+                + ", ".join(self.dialect.placeholder(r * width + i + 1) for i in range(width))
+                + ")"
+                for r in range(1, len(query.rows))
+            )
+            values = ", ".join((f"({first})", *rest))
+            assignments = ", ".join(f"{q(c)} = {alias}.{q(c)}" for c in query.columns)
+            sql = (
+                f"UPDATE {table} SET {assignments}"
+                f" FROM (VALUES {values}) AS {alias} ({', '.join(map(q, names))})"
+                f" WHERE {table}.{q(query.key)} = {alias}.{q(query.key)}"
+            )
+            return sql, params
+
+        selects = [
+            "SELECT "
+            + ", ".join(
+                f"{self.dialect.placeholder(r * width + i + 1)}"
+                + (f" AS {q(name)}" if r == 0 else "")
+                for i, name in enumerate(names)
+            )
+            for r in range(len(query.rows))
+        ]
+        assignments = ", ".join(f"{table}.{q(c)} = {alias}.{q(c)}" for c in query.columns)
+        sql = (
+            f"UPDATE {table} JOIN ({' UNION ALL '.join(selects)}) AS {alias}"
+            f" ON {table}.{q(query.key)} = {alias}.{q(query.key)} SET {assignments}"
+        )
         return sql, params
 
-    def compile_delete(self, query: DeleteQuery) -> tuple[str, list[Any]]:
+    def _compile_delete(self, query: DeleteQuery) -> tuple[str, list[Any]]:
         params: list[Any] = []
         sql = f"DELETE FROM {self.dialect.quote(query.table)}"
         sql += self._render_where(query.where, params)
-        return sql, params
+        return sql + self._render_returning(query.returning, delete=True), params
 
     # -- helpers ------------------------------------------------------------
 
@@ -104,16 +312,47 @@ class Compiler:
             ref = f"{ref} AS {self.dialect.quote(column.output_name)}"
         return ref
 
+    def _render_returning(
+        self, returning: str | tuple[str, ...] | None, *, delete: bool = False
+    ) -> str:
+        """Render `` RETURNING ...`` (empty without ``returning`` or dialect support)."""
+        if not returning:
+            return ""
+        clause = self.dialect.render_returning(returning, delete=delete)
+        return f" {clause}" if clause else ""
+
+    def _render_aggregate(self, aggregate: Aggregate, projection: bool = False) -> str:
+        argument = "*" if aggregate.column is None else self._render_column(aggregate.column)
+        if aggregate.distinct:
+            argument = f"DISTINCT {argument}"
+        sql = f"{aggregate.function.value}({argument})"
+        if projection and aggregate.alias:
+            sql = f"{sql} AS {self.dialect.quote(aggregate.alias)}"
+        return sql
+
     def _render_where(self, where: tuple[Condition, ...], params: list[Any]) -> str:
         if not where:
             return ""
         clauses = [self._render_condition(c, params) for c in where]
         return " WHERE " + " AND ".join(clauses)
 
-    def _render_condition(self, condition: Condition, params: list[Any]) -> str:
-        col = self._render_column(condition.column)
+    def _render_condition(
+        self, condition: Condition, params: list[Any], col: str | None = None
+    ) -> str:
+        """Render ``condition``; ``col`` replaces its rendered column (a ``HAVING`` aggregate)."""
+        if col is None:
+            col = self._render_column(condition.column)
         if condition.operator is Operator.IN:
             values = list(condition.value)
+            if not values:
+                # ``IN ()`` is a syntax error; an empty list matches no row.
+                return self.dialect.boolean_literal(condition.negated)
+            if self.dialect.array_params:
+                params.append(values)
+                placeholder = self.dialect.placeholder(len(params))
+                if condition.negated:
+                    return f"{col} <> ALL({placeholder})"
+                return f"{col} = ANY({placeholder})"
             placeholders = ", ".join(
                 self.dialect.placeholder(len(params) + i + 1) for i in range(len(values))
             )
@@ -125,3 +364,49 @@ class Compiler:
         if condition.negated:
             return f"NOT ({clause})"
         return clause
+
+
+def _where_shape(where: tuple[Condition, ...], array_params: bool) -> tuple[Hashable, ...]:
+    """``where`` without its values.
+
+    An ``IN`` keeps its length (one placeholder per value), or with
+    ``array_params`` just whether it is empty.
+    """
+    return tuple(
+        (c.column, c.operator, c.negated, _in_shape(c.value, array_params))
+        if c.operator is Operator.IN
+        else (c.column, c.operator, c.negated)
+        for c in where
+    )
+
+
+def _in_shape(values: Any, array_params: bool) -> int:
+    return min(len(values), 1) if array_params else len(values)
+
+
+def _bulk_update_params(query: BulkUpdateQuery, dialect: Dialect) -> list[Any]:
+    """``query``'s values in the order ``_compile_bulk_update`` binds them."""
+    if dialect.bulk_update_style != "case":
+        return [value for row in query.rows for value in row]
+    params = [
+        value
+        for i in range(len(query.columns))
+        for row in query.rows
+        for value in (row[0], row[i + 1])
+    ]
+    keys = [row[0] for row in query.rows]
+    return _where_params(
+        (Condition(Column(query.key), Operator.IN, keys),), dialect.array_params, params
+    )
+
+
+def _where_params(where: tuple[Condition, ...], array_params: bool, params: list[Any]) -> list[Any]:
+    """Append ``where``'s values to ``params`` in the order ``_render_where`` binds them."""
+    for c in where:
+        if c.operator is not Operator.IN:
+            params.append(c.value)
+        elif not array_params:
+            params.extend(c.value)
+        elif c.value:
+            params.append(list(c.value))
+    return params
@@ -8,9 +8,14 @@ and how new-row primary keys are returned on insert.
 
 from __future__ import annotations
 
+import re
 import types
 import typing
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Sequence
+
+if typing.TYPE_CHECKING:
+    from .query import OnConflict
 
 
 class Dialect(ABC):
@@ -19,6 +24,54 @@ class Dialect(ABC):
     #: Whether ``INSERT ... RETURNING <pk>`` is supported to fetch generated PKs.
     supports_returning: bool = False
 
+    #: Most bind parameters a single statement may carry.
+    max_params: int = 32767
+
+    #: Whether ``NULL`` sorts before every value in an ascending ``ORDER BY``.
+    nulls_first: bool = False
+
+    #: Which generated key the driver's ``lastrowid`` reports after a
+    #: multi-row ``INSERT`` (the keys themselves are consecutive).
+    bulk_lastrowid: typing.Literal["first", "last"] = "first"
+
+    #: Whether ``IN`` lists bind as one array parameter (``col = ANY($n)``)
+    #: rather than one placeholder per value.
+    array_params: bool = False
+
+    #: How ``Manager.bulk_update()`` matches rows to their new values: a
+    #: ``CASE <key> WHEN ...`` per column (portable), ``UPDATE ... FROM
+    #: (VALUES ...)`` (Postgres) or a ``JOIN`` on a derived table (MySQL).
+    bulk_update_style: typing.Literal["case", "values", "join"] = "case"
+
+    #: Whether ``SELECT ... FOR UPDATE`` locks the selected rows.
+    row_locks: bool = True
+
+    #: Statement opening an explicit transaction.
+    begin_transaction: str = "BEGIN"
+
+    #: How a single-row upsert tells an insert from an update: a flag in its
+    #: ``RETURNING`` row (see :meth:`render_inserted_flag`), the affected-row
+    #: count (1 for an insert), or not at all.
+    upsert_outcome: typing.Literal["returning", "rowcount"] | None = None
+
+    @property
+    def cache_key(self) -> Hashable:
+        """Identifies this dialect's rendering in compiled-SQL cache keys.
+
+        Dialects with equal keys must render every query identically;
+        subclasses whose output depends on more instance state extend it.
+        """
+        return (type(self), self.supports_returning)
+
+    @property
+    def delete_returning(self) -> bool:
+        """Whether ``DELETE ... RETURNING`` is supported.
+
+        Follows :attr:`supports_returning` unless a dialect has it for
+        ``DELETE`` alone (MariaDB).
+        """
+        return self.supports_returning
+
     @abstractmethod
     def quote(self, identifier: str) -> str:
         """Quote an identifier (table/column/alias), escaping embedded quotes."""
@@ -56,29 +109,78 @@ class Dialect(ABC):
             f"ON {self.quote(table)} ({self.quote(column)});"
         )
 
-    def render_returning(self, column: str) -> str:
-        """Render a ``RETURNING <column>`` clause for an insert.
+    def render_returning(self, column: str | Sequence[str], *, delete: bool = False) -> str:
+        """Render a ``RETURNING <column>[, ...]`` clause for an insert or update,
+        or for a delete when ``delete`` is set.
 
-        Dialects without ``RETURNING`` support return an empty string.
+        Dialects without ``RETURNING`` support for the statement return an
+        empty string.
         """
-        if not self.supports_returning:
+        if not (self.delete_returning if delete else self.supports_returning):
             return ""
-        return f"RETURNING {self.quote(column)}"
+        columns = (column,) if isinstance(column, str) else column
+        return f"RETURNING {', '.join(self.quote(c) for c in columns)}"
+
+    def render_on_conflict(self, on_conflict: OnConflict) -> str:
+        """Render the upsert clause of an insert: ``ON CONFLICT (...) DO UPDATE/NOTHING``.
+
+        Colliding rows take the incoming values of ``on_conflict.update``
+        (the ``EXCLUDED`` row). Postgres and SQLite share this form.
+        """
+        target = ", ".join(self.quote(c) for c in on_conflict.columns)
+        if not on_conflict.update:
+            return f"ON CONFLICT ({target}) DO NOTHING"
+        assignments = ", ".join(
+            f"{self.quote(c)} = EXCLUDED.{self.quote(c)}" for c in on_conflict.update
+        )
+        return f"ON CONFLICT ({target}) DO UPDATE SET {assignments}"
+
+    def render_inserted_flag(self, alias: str) -> str:
+        """Render a ``RETURNING`` item named ``alias``, true where an upsert inserted its row."""
+        raise NotImplementedError(f"{type(self).__name__} cannot flag inserted rows")
+
+    def bulk_update_params(self, columns: int) -> int:
+        """Bind parameters one row of a bulk ``UPDATE`` of ``columns`` columns takes."""
+        if self.bulk_update_style == "case":
+            # The key repeats in every column's CASE, and once more in the IN list.
+            return 2 * columns + 1
+        return columns + 1
 
     def boolean_literal(self, value: bool) -> str:
         """Render a boolean literal (used when inlining, not for params)."""
         return "TRUE" if value else "FALSE"
 
+    def render_limit(self, limit: int | None, offset: int | None) -> str:
+        """Render the ``LIMIT`` / ``OFFSET`` tail of a ``SELECT`` (empty if neither is set)."""
+        sql = ""
+        if limit is not None:
+            sql += f" LIMIT {limit}"
+        if offset is not None:
+            sql += f" OFFSET {offset}"
+        return sql
+
 
 class PostgresDialect(Dialect):
-    """PostgreSQL syntax: ``"id"`` quoting and ``$1`` placeholders."""
+    """PostgreSQL syntax: ``"id"`` quoting, ``$1`` placeholders and ``= ANY($1)`` IN lists."""
 
     supports_returning = True
+    # The wire protocol counts parameters in a 16-bit signed integer.
+    max_params = 32767
+    # One array parameter per IN list: a single statement shape for every list
+    # length, and no parameter-limit ceiling on the list size.
+    array_params = True
+    bulk_update_style = "values"
+    upsert_outcome = "returning"
 
     def quote(self, identifier: str) -> str:
         escaped = identifier.replace('"', '""')
         return f'"{escaped}"'
 
+    def render_inserted_flag(self, alias: str) -> str:
+        # A row version written by this very statement has no deleting
+        # transaction yet; an updated one carries the updater's xid in xmax.
+        return f"(xmax = 0) AS {self.quote(alias)}"
+
     def placeholder(self, index: int) -> str:
         if index < 1:
             raise ValueError("placeholder index is 1-based and must be >= 1")
@@ -147,14 +249,83 @@ class MySQLDialect(Dialect):
     is rendered as ``%s`` regardless of its index. There is no ``RETURNING``
     clause; generated primary keys are read from ``cursor.lastrowid`` instead
     (see :meth:`riverorm.db.mysql.MySQLDatabase.execute_insert`).
+
+    ``version`` is the server version and ``mariadb`` whether it is MariaDB;
+    upserts use a row alias (``INSERT ... AS new``) on MySQL 8.0.19+, where
+    the ``VALUES(col)`` function they replace is deprecated. An unknown
+    version keeps ``VALUES(col)``, which every server accepts. MariaDB has
+    ``DELETE ... RETURNING`` (but no ``UPDATE ... RETURNING``).
     """
 
     supports_returning = False
+    max_params = 65535
+    nulls_first = True
+    bulk_update_style = "join"
+    begin_transaction = "START TRANSACTION"
+    # 1 for an inserted row, 2 for an updated one and 0 for a row left as it
+    # was (aiomysql does not set CLIENT.FOUND_ROWS).
+    upsert_outcome = "rowcount"
+    #: Alias of the incoming row in ``INSERT ... AS _new ON DUPLICATE KEY UPDATE``.
+    row_alias_name = "_new"
+
+    def __init__(self, version: tuple[int, ...] | None = None, mariadb: bool = False) -> None:
+        self.mariadb = mariadb
+        self.row_alias = version is not None and not mariadb and version >= (8, 0, 19)
+
+    @classmethod
+    def for_server(cls, server_info: str) -> MySQLDialect:
+        """The dialect for a server reporting ``server_info`` (e.g. ``8.0.36``,
+        ``5.5.5-10.11.6-MariaDB``)."""
+        mariadb = "mariadb" in server_info.lower()
+        # MariaDB may prefix its real version with "5.5.5-" for old clients.
+        info = server_info.removeprefix("5.5.5-") if mariadb else server_info
+        match = re.match(r"(\d+)\.(\d+)\.(\d+)", info)
+        version = tuple(int(part) for part in match.groups()) if match else None
+        return cls(version, mariadb)
+
+    @property
+    def cache_key(self) -> Hashable:
+        return (super().cache_key, self.row_alias, self.mariadb)
+
+    @property
+    def delete_returning(self) -> bool:
+        return self.mariadb
 
     def quote(self, identifier: str) -> str:
         escaped = identifier.replace("`", "``")
         return f"`{escaped}`"
 
+    def render_on_conflict(self, on_conflict: OnConflict) -> str:
+        # MySQL upserts on whichever unique key collides, so the target is not
+        # rendered. "Do nothing" is a self-assignment rather than INSERT IGNORE,
+        # which would also swallow unrelated errors (bad values, NOT NULL).
+        columns = on_conflict.update or on_conflict.columns[:1]
+        if not on_conflict.update:
+            return f"ON DUPLICATE KEY UPDATE {self.quote(columns[0])} = {self.quote(columns[0])}"
+        if self.row_alias:
+            # The alias follows the VALUES groups, right where this clause goes.
+            prefix = f"AS {self.quote(self.row_alias_name)} "
+
+            def new(column: str) -> str:
+                return f"{self.quote(self.row_alias_name)}.{self.quote(column)}"
+        else:
+            prefix = ""
+
+            def new(column: str) -> str:
+                return f"VALUES({self.quote(column)})"
+
+        if not on_conflict.strict:
+            assignments = ", ".join(f"{self.quote(c)} = {new(c)}" for c in columns)
+            return f"{prefix}ON DUPLICATE KEY UPDATE {assignments}"
+        # Only touch a row that matches on the target. Assignments run left to
+        # right and see earlier ones, so target columns are assigned last.
+        matches = " AND ".join(f"{self.quote(c)} <=> {new(c)}" for c in on_conflict.columns)
+        ordered = sorted(columns, key=lambda c: c in on_conflict.columns)
+        assignments = ", ".join(
+            f"{self.quote(c)} = IF({matches}, {new(c)}, {self.quote(c)})" for c in ordered
+        )
+        return f"{prefix}ON DUPLICATE KEY UPDATE {assignments}"
+
     def placeholder(self, index: int) -> str:
         # aiomysql's paramstyle is ``format``; placeholders are positional by
         # order, not by index, so the index is intentionally ignored.
@@ -207,3 +378,100 @@ class MySQLDialect(Dialect):
 
     def auto_increment_pk(self, column: str) -> str:
         return f"{self.quote(column)} INT AUTO_INCREMENT PRIMARY KEY"
+
+
+class SQLiteDialect(Dialect):
+    """SQLite syntax: ``"id"`` quoting and ``?`` placeholders.
+
+    ``RETURNING`` exists since SQLite 3.35; older libraries fall back to
+    ``cursor.lastrowid`` like MySQL. Column types only set affinity, so the
+    mapping mostly documents intent: booleans are stored as ``0``/``1``,
+    dates and datetimes as ISO-8601 text, UUIDs as text and lists as JSON
+    text (see :mod:`riverorm.db.sqlite` for the value adapters and the
+    ``JSON`` converter).
+    """
+
+    nulls_first = True
+    bulk_lastrowid = "last"
+    # No row locks: an IMMEDIATE transaction takes the database write lock up
+    # front instead, so the rows read cannot change before the write.
+    row_locks = False
+    begin_transaction = "BEGIN IMMEDIATE"
+
+    def __init__(self, version: tuple[int, ...] | None = None) -> None:
+        """``version`` defaults to the SQLite library linked into :mod:`sqlite3`."""
+        if version is None:
+            # Imported here so only SQLite users pay for loading the module.
+            import sqlite3
+
+            version = sqlite3.sqlite_version_info
+        self.supports_returning = version >= (3, 35, 0)
+        # SQLITE_MAX_VARIABLE_NUMBER defaults to 32766 since 3.32 (999 before).
+        self.max_params = 32766 if version >= (3, 32, 0) else 999
+
+    def quote(self, identifier: str) -> str:
+        escaped = identifier.replace('"', '""')
+        return f'"{escaped}"'
+
+    def placeholder(self, index: int) -> str:
+        # sqlite3's ``qmark`` paramstyle binds by order, like MySQL's ``%s``.
+        return "?"
+
+    @staticmethod
+    def python_to_sql_type(annotation: type) -> str:
+        py_type: typing.Any = annotation
+
+        # Unwrap Union/Optional (``int | None``) to the first non-None member,
+        # mirroring :meth:`PostgresDialect.python_to_sql_type`.
+        union_types = (
+            getattr(typing, "Union", None),
+            getattr(types, "UnionType", None),
+        )
+        if (hasattr(py_type, "__origin__") and py_type.__origin__ in union_types) or (
+            hasattr(types, "UnionType") and isinstance(py_type, types.UnionType)
+        ):
+            args = getattr(py_type, "__args__", None)
+            if (
+                args is None
+                and hasattr(py_type, "__origin__")
+                and hasattr(py_type.__origin__, "__args__")
+            ):
+                args = py_type.__origin__.__args__
+            if args:
+                py_type = next(t for t in args if t is not type(None))
+
+        if py_type is bool:
+            return "BOOLEAN"
+        elif py_type is int:
+            return "INTEGER"
+        elif py_type is float:
+            return "REAL"
+        elif py_type is str:
+            return "TEXT"
+        elif hasattr(py_type, "__name__") and py_type.__name__ in ("datetime", "date", "UUID"):
+            # No date/UUID storage classes: ISO-8601 / canonical text that
+            # pydantic parses back. (Avoids sqlite3's deprecated DATE and
+            # TIMESTAMP converters, which the JSON converter would enable.)
+            return "TEXT"
+        elif py_type is list or (hasattr(py_type, "__origin__") and py_type.__origin__ is list):
+            return "JSON"
+        else:
+            raise TypeError(f"Unsupported Python type for SQL: {py_type}")
+
+    def auto_increment_pk(self, column: str) -> str:
+        # An INTEGER PRIMARY KEY aliases the rowid: generated without the
+        # bookkeeping table that AUTOINCREMENT would add.
+        return f"{self.quote(column)} INTEGER PRIMARY KEY"
+
+    def create_index(self, table: str, column: str, *, name: str, unique: bool = False) -> str:
+        unique_kw = "UNIQUE " if unique else ""
+        return (
+            f"CREATE {unique_kw}INDEX IF NOT EXISTS {self.quote(name)} "
+            f"ON {self.quote(table)} ({self.quote(column)});"
+        )
+
+    def render_limit(self, limit: int | None, offset: int | None) -> str:
+        # SQLite only accepts OFFSET after a LIMIT; -1 means "no limit".
+        if offset is not None and limit is None:
+            limit = -1
+        return super().render_limit(limit, offset)
@@ -42,6 +42,37 @@ class Column:
     output_name: str | None = None
 
 
+class AggregateFunction(str, Enum):
+    """SQL aggregate functions supported in an :class:`Aggregate`."""
+
+    COUNT = "COUNT"
+    SUM = "SUM"
+    AVG = "AVG"
+    MIN = "MIN"
+    MAX = "MAX"
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """An aggregate over the matching rows: ``function(column)``.
+
+    ``column=None`` renders ``COUNT(*)``; ``distinct`` renders
+    ``function(DISTINCT column)``. ``alias`` names the result in a ``SELECT``
+    projection, and ``ORDER BY`` can refer to it as ``Column(alias)``.
+    """
+
+    function: AggregateFunction
+    column: Column | None = None
+    distinct: bool = False
+    alias: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.column is None and self.function is not AggregateFunction.COUNT:
+            raise ValueError(f"{self.function.value}() needs a column")
+        if self.column is None and self.distinct:
+            raise ValueError("COUNT(DISTINCT ...) needs a column")
+
+
 @dataclass(frozen=True)
 class Condition:
     """A single ``WHERE`` predicate: ``column <operator> value(s)``.
@@ -81,7 +112,13 @@ class Join:
 
 @dataclass(frozen=True)
 class SelectQuery:
-    """A ``SELECT`` statement."""
+    """A ``SELECT`` statement.
+
+    ``aggregates`` are projected after ``columns``; with ``group_by`` they are
+    computed per group. ``having`` filters the groups: each condition's column
+    names an aggregate by its alias. ``for_update`` locks the selected rows
+    (``FOR UPDATE``) on dialects with row locks.
+    """
 
     table: str
     columns: tuple[Column, ...] = ()
@@ -92,6 +129,30 @@ class SelectQuery:
     limit: int | None = None
     offset: int | None = None
     count: bool = False
+    for_update: bool = False
+    aggregates: tuple[Aggregate, ...] = ()
+    group_by: tuple[Column, ...] = ()
+    having: tuple[Condition, ...] = ()
+
+
+@dataclass(frozen=True)
+class OnConflict:
+    """What an ``INSERT`` does with a row that collides on a unique key.
+
+    ``columns`` is the conflict target: the unique key (or primary key) the
+    collision is detected on. ``update`` names the columns overwritten with the
+    incoming row's values; empty means the colliding row is left untouched
+    (``DO NOTHING``). MySQL upserts on whichever unique key collides; with
+    ``strict`` it only updates a row that also matches on ``columns``.
+    """
+
+    columns: tuple[str, ...]
+    update: tuple[str, ...] = ()
+    strict: bool = False
+
+    def __post_init__(self) -> None:
+        if not self.columns:
+            raise ValueError("OnConflict needs at least one conflict column")
 
 
 @dataclass(frozen=True)
@@ -99,32 +160,64 @@ class InsertQuery:
     """An ``INSERT`` statement.
 
     ``columns`` and ``values`` are positionally paired. ``returning`` names a
-    column to render in a ``RETURNING`` clause (Postgres-style) when supported by
-    the dialect.
+    column (or a tuple of columns) to render in a ``RETURNING`` clause
+    (Postgres-style) when supported by the dialect. For a multi-row insert pass
+    ``rows`` instead of ``values``; each row is a tuple paired with ``columns``
+    and renders its own ``VALUES (...)`` group. ``on_conflict`` turns the
+    insert into an upsert; ``returning_inserted`` then names an extra
+    ``RETURNING`` item telling inserted rows from updated ones (see
+    :meth:`~riverorm.sql.dialect.Dialect.render_inserted_flag`).
     """
 
     table: str
     columns: tuple[str, ...]
-    values: tuple[Any, ...]
-    returning: str | None = None
+    values: tuple[Any, ...] = ()
+    returning: str | tuple[str, ...] | None = None
+    rows: tuple[tuple[Any, ...], ...] = ()
+    on_conflict: OnConflict | None = None
+    returning_inserted: str | None = None
 
 
 @dataclass(frozen=True)
 class UpdateQuery:
     """An ``UPDATE`` statement.
 
-    ``assignments`` are positionally paired ``column``/``value`` tuples.
+    ``columns`` and ``values`` are positionally paired. ``returning`` names the
+    column(s) of the updated rows to render in a ``RETURNING`` clause.
     """
 
     table: str
     columns: tuple[str, ...]
     values: tuple[Any, ...]
     where: tuple[Condition, ...] = field(default=())
+    returning: str | tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class BulkUpdateQuery:
+    """One ``UPDATE`` writing different values to each row, matched on ``key``.
+
+    Each of ``rows`` is ``(key_value, *values)`` with ``values`` paired with
+    ``columns``. ``types`` optionally gives the SQL type of the key and of each
+    column (``""`` for unknown); dialects that bind the rows as a derived
+    table cast the parameters to them.
+    """
+
+    table: str
+    key: str
+    columns: tuple[str, ...]
+    rows: tuple[tuple[Any, ...], ...]
+    types: tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
 class DeleteQuery:
-    """A ``DELETE`` statement."""
+    """A ``DELETE`` statement.
+
+    ``returning`` names the column(s) of the deleted rows to render in a
+    ``RETURNING`` clause.
+    """
 
     table: str
     where: tuple[Condition, ...] = field(default=())
+    returning: str | tuple[str, ...] | None = None
@@ -1,28 +1,54 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 import pytest_asyncio
 
 from riverorm import Model, constants
-from riverorm.config import config
-from riverorm.db import DatabaseRegistry, MySQLDatabase, PostgresDatabase
+from riverorm.config import config, load_env
+from riverorm.db import DatabaseRegistry, MySQLDatabase, PostgresDatabase, SQLiteDatabase
 from tests.models import Order, Product, User
 
+load_env()
+
 
-@pytest.fixture(scope="session", params=[constants.POSTGRES, constants.MYSQL])
+@pytest.fixture(scope="session", params=[constants.POSTGRES, constants.MYSQL, constants.SQLITE])
 def db_type(request: pytest.FixtureRequest) -> str:
     return str(request.param)
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_db_registry(db_type: str):
-    # Register both Postgres and MySQL connections for tests
+    # Register Postgres, MySQL and SQLite connections for tests
     DatabaseRegistry.clear()
     DatabaseRegistry.register("postgres", PostgresDatabase(config.POSTGRES_DSN, config.DEBUG))
     DatabaseRegistry.register("mysql", MySQLDatabase(config.MYSQL_DSN, config.DEBUG))
+    DatabaseRegistry.register("sqlite", SQLiteDatabase(config.SQLITE_DSN, config.DEBUG))
     DatabaseRegistry.set_default(db_type)
 
 
+@pytest.fixture
+def isolated_registry() -> Iterator[None]:
+    """Snapshot the global registry, give the test a clean slate, then restore."""
+    saved_connections = dict(DatabaseRegistry._connections)
+    saved_replicas = dict(DatabaseRegistry._replicas)
+    saved_policies = dict(DatabaseRegistry._policies)
+    saved_lanes = dict(DatabaseRegistry._lanes)
+    saved_shards = dict(DatabaseRegistry._shards)
+    saved_default = DatabaseRegistry._default
+    DatabaseRegistry.clear()
+    try:
+        yield
+    finally:
+        DatabaseRegistry._connections = saved_connections
+        DatabaseRegistry._replicas = saved_replicas
+        DatabaseRegistry._policies = saved_policies
+        DatabaseRegistry._lanes = saved_lanes
+        DatabaseRegistry._shards = saved_shards
+        DatabaseRegistry._default = saved_default
+
+
 @pytest.fixture
 def db_models() -> list[type[Model]]:
     return [Order, Product, User]
@@ -0,0 +1,253 @@
+"""Batched query tests (``riverorm.batch()`` / ``DatabaseRegistry.pipeline()``).
+
+Pure tests use a fake backend that records each ``run_batch`` call, checking
+that entries are compiled up front, sent together and finished in order. The
+DB-backed test sends a mixed batch through the real backends.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from pymysql.err import IntegrityError
+
+import riverorm
+from riverorm.db import DatabaseRegistry, FakeDatabase, MySQLDatabase
+from riverorm.db.base import BatchKind
+from tests.models import Order, User
+
+
+class BatchingDatabase(FakeDatabase):
+    """Backend answering every read with ``rows`` and recording batches."""
+
+    def __init__(self, rows: list[dict[str, Any]] | None = None, dsn: str = "fake://") -> None:
+        super().__init__(dsn)
+        self.rows = rows or []
+        self.batches: list[list[tuple[str, tuple[Any, ...], str]]] = []
+        self.on(r"^SELECT", lambda sql, params: self.rows)
+        self.on(r"^SELECT COUNT", lambda sql, params: [{"count": len(self.rows)}])
+        self.on(r"^UPDATE", lambda sql, params: "UPDATE 1")
+
+    async def run_batch(self, statements: Sequence[tuple[str, tuple[Any, ...], Any]]) -> list[Any]:
+        self.batches.append(list(statements))
+        return await super().run_batch(statements)
+
+
+@pytest.fixture
+def batching_db(isolated_registry: None) -> BatchingDatabase:
+    db = BatchingDatabase([{"id": 1, "username": "alice", "email": None, "is_active": True}])
+    DatabaseRegistry.register("batch", db)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_entries_together_and_returns_in_order(batching_db: BatchingDatabase):
+    users, total, alice, first, exists, raw = await (
+        riverorm.batch()
+        .all(User.objects.filter(is_active=True))
+        .count(User.objects)
+        .get(User.objects, username="alice")
+        .first(User.objects.order_by("id"))
+        .exists(User.objects.filter(id=1))
+        .fetch("SELECT 1")
+        .run()
+    )
+    assert [u.username for u in users] == ["alice"]
+    assert total == 1
+    assert alice.id == 1 and alice._persisted
+    assert first.username == "alice"
+    assert exists is True
+    assert raw == batching_db.rows
+    [statements] = batching_db.batches
+    assert [kind for _, _, kind in statements] == [
+        "fetch",
+        "fetchrow",
+        "fetch",
+        "fetch",
+        "fetchrow",
+        "fetch",
+    ]
+    assert statements[0] == ('SELECT * FROM "user" WHERE "is_active" = $1', (True,), "fetch")
+    assert statements[2][0].endswith("LIMIT 2")
+
+
+@pytest.mark.asyncio
+async def test_batch_get_raises_like_queryset_get(batching_db: BatchingDatabase):
+    batching_db.rows = []
+    with pytest.raises(User.DoesNotExist):
+        await riverorm.batch().get(User.objects, id=99).run()
+
+
+@pytest.mark.asyncio
+async def test_batch_answers_empty_in_entries_without_sending_them(batching_db: BatchingDatabase):
+    empty = Order.objects.filter(id__in=[])
+    total, orders, first, exists = await (
+        riverorm.batch().count(empty).all(empty).first(empty).exists(empty).run()
+    )
+    assert (total, orders, first, exists) == (0, [], None, False)
+    assert batching_db.batches == []
+
+    users, no_orders = await riverorm.batch().all(User.objects).count(empty).run()
+    assert len(users) == 1 and no_orders == 0
+    assert [kind for _, _, kind in batching_db.batches[0]] == ["fetch"]
+    with pytest.raises(Order.DoesNotExist):
+        await riverorm.batch().get(empty).run()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_raw_statements_on_alias(batching_db: BatchingDatabase):
+    pipeline = DatabaseRegistry.pipeline("batch").execute("UPDATE t SET x = $1", 1)
+    assert len(pipeline) == 1
+    assert await pipeline.run() == ["UPDATE 1"]
+    assert await riverorm.batch().run() == []
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_entries_on_different_databases(batching_db: BatchingDatabase):
+    DatabaseRegistry.register("other", BatchingDatabase())
+    with pytest.raises(ValueError, match="share one database"):
+        await riverorm.batch().all(User.objects).all(Order.objects.using("other")).run()
+
+
+@pytest.mark.asyncio
+async def test_batch_reads_use_a_replica_and_writes_the_primary(batching_db: BatchingDatabase):
+    replica = BatchingDatabase(batching_db.rows)
+    DatabaseRegistry.clear()
+    DatabaseRegistry.register("batch", batching_db, replicas=[replica])
+    await riverorm.batch().all(User.objects).count(User.objects).run()
+    assert len(replica.batches) == 1 and not batching_db.batches
+    await riverorm.batch().all(User.objects).execute("UPDATE t SET x = 1").run()
+    assert len(batching_db.batches) == 1
+
+
+# -- run_transaction() ------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_run_transaction_needs_atomic_batches():
+    class SplitBatchDatabase(FakeDatabase):
+        atomic_batches = False
+
+    with pytest.raises(NotImplementedError, match="SplitBatchDatabase"):
+        await SplitBatchDatabase().run_transaction([("SELECT 1", (), "fetch")])
+
+
+class _MySQLConnection:
+    """Stands in for an aiomysql connection; tracks the server's transaction flag."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self.in_transaction = False
+        self.rolled_back = False
+        self.round_trips: list[str] = []
+
+    async def cursor(self, cursor_class: Any) -> _FailingCursor:
+        return _FailingCursor(self)
+
+    def get_transaction_status(self) -> bool:
+        return self.in_transaction
+
+    async def rollback(self) -> None:
+        self.in_transaction = False
+        self.rolled_back = True
+
+
+class _FailingCursor:
+    """Runs single or multi-statements; every ``UPDATE`` is a duplicate key."""
+
+    rowcount = 0
+
+    def __init__(self, conn: _MySQLConnection) -> None:
+        self.conn = conn
+        self.pending: list[str] = []
+
+    async def execute(self, query: str, args: tuple[Any, ...]) -> None:
+        self.conn.round_trips.append(query)
+        first, *self.pending = query.split("; ")
+        self._run(first)
+
+    async def fetchall(self) -> list[dict[str, Any]]:
+        return [{"id": 1}]
+
+    async def nextset(self) -> None:
+        self._run(self.pending.pop(0))
+
+    def _run(self, statement: str) -> None:
+        if statement.startswith("START TRANSACTION"):
+            self.conn.in_transaction = True
+        if statement.startswith("UPDATE"):
+            raise IntegrityError(1062, "Duplicate entry 'alice' for key 'username'")
+
+    async def close(self) -> None: ...
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("multi_statements", [True, False])
+async def test_mysql_failed_transaction_is_rolled_back_before_release(
+    multi_statements: bool,
+) -> None:
+    db = MySQLDatabase("mysql://x", multi_statements=multi_statements)
+    conn = _MySQLConnection()
+    released_in_transaction: list[bool] = []
+
+    async def acquire() -> _MySQLConnection:
+        return conn
+
+    async def release(conn: _MySQLConnection) -> None:
+        released_in_transaction.append(conn.get_transaction_status())
+
+    db._acquire_connection = acquire  # type: ignore[method-assign]
+    db._release_connection = release  # type: ignore[method-assign]
+    with pytest.raises(IntegrityError):
+        await db.run_transaction(
+            [
+                ("SELECT `id` FROM `user` WHERE `id` = %s FOR UPDATE", (1,), "fetch"),
+                ("UPDATE `user` SET `username` = %s WHERE `id` = %s", ("alice", 1), "execute"),
+            ]
+        )
+    assert conn.rolled_back
+    assert released_in_transaction == [False]
+    # One connection either way; without multi-statement mode, one round trip each.
+    assert len(conn.round_trips) == (1 if multi_statements else 3)
+
+
+@pytest.mark.asyncio
+async def test_mysql_batch_without_multi_statements_runs_one_by_one() -> None:
+    db = MySQLDatabase("mysql://x")
+    sent: list[str] = []
+
+    async def execute(query: str, *args: Any) -> int:
+        sent.append(query)
+        return 1
+
+    db.execute = execute  # type: ignore[method-assign]
+    statements: list[tuple[str, tuple[Any, ...], BatchKind]] = [
+        ("UPDATE a SET x = 1", (), "execute"),
+        ("DELETE FROM b", (), "execute"),
+    ]
+    assert await db.run_batch(statements) == [1, 1]
+    assert sent == ["UPDATE a SET x = 1", "DELETE FROM b"]
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_batch_on_real_backend(db_setup_and_teardown):
+    await User.objects.create(username="alice")
+    await User.objects.create(username="bob", is_active=False)
+    users, total, bob, missing = await (
+        riverorm.batch()
+        .all(User.objects.filter(is_active=True))
+        .count(User.objects)
+        .get(User.objects, username="bob")
+        .first(User.objects.filter(username="nobody"))
+        .run()
+    )
+    assert [u.username for u in users] == ["alice"]
+    assert total == 2
+    assert bob.is_active is False
+    assert missing is None
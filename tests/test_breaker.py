@@ -0,0 +1,168 @@
+"""Circuit breaker and load shedding tests (``BreakerPolicy`` / ``CircuitBreaker``).
+
+Pure unit tests: a fake backend runs each statement through
+``BaseDatabase._retrying`` and fails on demand, so the breaker's state
+machine and the in-flight cap can be asserted without servers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from riverorm.db import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    FakeDatabase,
+    LoadShedError,
+    PoolTimeoutError,
+    RetryPolicy,
+    SQLiteDatabase,
+)
+
+
+class FlakyDatabase(FakeDatabase):
+    """FakeDatabase whose reads raise ``error`` (if set) after ``delay`` seconds."""
+
+    def __init__(self, policy: BreakerPolicy, retry: RetryPolicy | None = None) -> None:
+        super().__init__()
+        self.breaker = CircuitBreaker(policy)
+        self.retry_policy = retry or RetryPolicy(max_attempts=1)
+        self.error: Exception | None = None
+        self.delay = 0.0
+        self.attempts = 0
+        self.on(r"^SELECT", [{"id": 1}])
+
+    async def fetch(self, query: str, *args: Any) -> Sequence[Any]:
+        fetch = super().fetch
+
+        async def attempt() -> Sequence[Any]:
+            self.attempts += 1
+            await asyncio.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            return await fetch(query, *args)
+
+        return await self._retrying(attempt, read=True)
+
+
+async def _fail(db: FlakyDatabase, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(ConnectionResetError):
+            await db.fetch("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_opens_on_error_rate_and_fails_fast():
+    db = FlakyDatabase(BreakerPolicy(failure_rate=0.5, window=4, min_calls=4, open_for=60))
+    await db.fetch("SELECT 1")
+    await db.fetch("SELECT 1")
+    db.error = ConnectionResetError("server closed the connection")
+    await _fail(db, 1)
+    assert db.breaker.state == "closed"
+    await _fail(db, 1)
+    assert db.breaker.state == "open"
+    attempts = db.attempts
+    with pytest.raises(CircuitOpenError):
+        await db.fetch("SELECT 1")
+    assert db.attempts == attempts
+    assert (db.breaker.stats.opened, db.breaker.stats.rejected) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_application_errors_do_not_count():
+    db = FlakyDatabase(BreakerPolicy(window=2, min_calls=2))
+    db.error = ValueError("duplicate key value violates unique constraint")
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            await db.fetch("SELECT 1")
+    assert db.breaker.state == "closed"
+    assert db.breaker.stats.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_slow_calls_count_as_failures():
+    db = FlakyDatabase(BreakerPolicy(window=2, min_calls=2, slow_call=0.01, open_for=60))
+    db.delay = 0.02
+    await db.fetch("SELECT 1")
+    db.delay, db.error = 0.0, PoolTimeoutError("no connection")
+    with pytest.raises(PoolTimeoutError):
+        await db.fetch("SELECT 1")
+    assert db.breaker.state == "open"
+    assert (db.breaker.stats.slow_calls, db.breaker.stats.failures) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_retried_statement_is_one_call():
+    db = FlakyDatabase(
+        BreakerPolicy(window=2, min_calls=2),
+        retry=RetryPolicy(max_attempts=3, base_delay=0, jitter=False),
+    )
+    db.error = ConnectionResetError()
+    await _fail(db, 1)
+    assert db.attempts == 3
+    assert db.breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_trials_close_or_reopen():
+    db = FlakyDatabase(BreakerPolicy(window=2, min_calls=2, open_for=0.01, half_open_trials=2))
+    db.error = ConnectionResetError()
+    await _fail(db, 2)
+    await asyncio.sleep(0.02)
+    assert db.breaker.state == "half_open"
+    await _fail(db, 1)  # a failed trial re-opens at once
+    assert db.breaker.state == "open"
+    assert db.breaker.stats.opened == 2
+
+    await asyncio.sleep(0.02)
+    db.error, db.delay = None, 0.01
+    trials = [asyncio.create_task(db.fetch("SELECT 1")) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):  # both trial slots are taken
+        await db.fetch("SELECT 1")
+    await asyncio.gather(*trials)
+    assert db.breaker.state == "closed"
+    await db.fetch("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_sheds_excess_load():
+    db = FlakyDatabase(BreakerPolicy(max_in_flight=2))
+    db.delay = 0.02
+    running = [asyncio.create_task(db.fetch("SELECT 1")) for _ in range(2)]
+    await asyncio.sleep(0)
+    with pytest.raises(LoadShedError):
+        await db.fetch("SELECT 1")
+    await asyncio.gather(*running)
+    assert db.breaker.stats.shed == 1
+    assert db.breaker.in_flight == 0
+    assert db.breaker.state == "closed"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"failure_rate": 0},
+        {"window": 5, "min_calls": 6},
+        {"slow_call": 0},
+        {"half_open_trials": 0},
+        {"max_in_flight": 0},
+    ],
+)
+def test_invalid_policies_are_rejected(kwargs: dict[str, Any]):
+    with pytest.raises(ValueError):
+        BreakerPolicy(**kwargs)
+
+
+def test_backends_build_a_breaker_per_instance():
+    policy = BreakerPolicy(max_in_flight=10)
+    a = SQLiteDatabase("sqlite:///:memory:", breaker=policy)
+    b = SQLiteDatabase("sqlite:///:memory:", breaker=policy)
+    assert a.breaker is not None and a.breaker.policy is policy
+    assert a.breaker is not b.breaker
+    assert SQLiteDatabase("sqlite:///:memory:").breaker is None
@@ -0,0 +1,96 @@
+"""Tests for ``Manager.bulk_copy()``.
+
+Pure tests run the batched multi-row ``INSERT`` fallback against a MySQL-dialect
+:class:`~riverorm.db.FakeDatabase`; the DB-backed tests load through ``COPY``
+(Postgres) and the fallback (MySQL) for real.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from riverorm.db import DatabaseRegistry, FakeDatabase
+from riverorm.sql import MySQLDialect
+from tests.models import User
+
+
+@pytest.fixture
+def recording_db(isolated_registry: None) -> FakeDatabase:
+    """A MySQL-dialect FakeDatabase: no COPY, so bulk_copy takes the INSERT fallback."""
+    db = FakeDatabase(dialect="mysql")
+    DatabaseRegistry.register("recording", db)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_batches_multi_row_inserts(recording_db: FakeDatabase):
+    users = (User(username=f"u{i}") for i in range(5))
+    result = await User.objects.bulk_copy(users, batch_size=2)
+    assert result.rows == 5
+    assert [len(s.params) for s in recording_db.statements] == [6, 6, 3]
+    statement = recording_db.statements[0]
+    sql, args = statement.sql, statement.params
+    assert sql == (
+        "INSERT INTO `user` (`username`, `email`, `is_active`) VALUES (%s, %s, %s), (%s, %s, %s)"
+    )
+    assert args == ("u0", None, True, "u1", None, True)
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_accepts_dicts_from_async_iterable(recording_db: FakeDatabase):
+    async def source() -> AsyncIterator[dict[str, Any]]:
+        for i in range(3):
+            yield {"id": i + 1, "username": f"u{i}"}
+
+    result = await User.objects.bulk_copy(source())
+    assert result.rows == 3
+    assert result.rows_per_second > 0
+    statement = recording_db.statements[0]
+    sql, args = statement.sql, statement.params
+    assert sql.startswith("INSERT INTO `user` (`id`, `username`, `email`, `is_active`)")
+    assert args[:4] == (1, "u0", None, True)
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_batch_respects_parameter_limit(
+    recording_db: FakeDatabase, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(MySQLDialect, "max_params", 7)
+    await User.objects.bulk_copy([User(username=f"u{i}") for i in range(5)], batch_size=100)
+    # 3 columns per row, at most 7 parameters -> 2 rows per statement.
+    assert [len(s.params) for s in recording_db.statements] == [6, 6, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_empty_input(recording_db: FakeDatabase):
+    result = await User.objects.bulk_copy([])
+    assert result.rows == 0
+    assert recording_db.statements == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_rejects_mixed_primary_keys(recording_db: FakeDatabase):
+    with pytest.raises(ValueError, match="primary key"):
+        await User.objects.bulk_copy([User(username="a"), User(id=7, username="b")])
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_rejects_foreign_objects(recording_db: FakeDatabase):
+    with pytest.raises(TypeError, match="Expected User"):
+        await User.objects.bulk_copy([object()])  # type: ignore[list-item]
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_loads_rows(db_setup_and_teardown):
+    result = await User.objects.bulk_copy(
+        ({"username": f"u{i}", "is_active": i % 2 == 0} for i in range(250)), batch_size=100
+    )
+    assert result.rows == 250
+    assert await User.objects.count() == 250
+    assert await User.objects.filter(is_active=True).count() == 125
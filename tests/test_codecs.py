@@ -0,0 +1,77 @@
+"""Type-codec registry tests.
+
+Pure tests check the JSON encoders' wire format and that a registry installs
+its codecs through ``set_type_codec`` on a recording connection. The DB-backed
+test round-trips JSON through a real Postgres connection.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from riverorm.db import CodecRegistry, DatabaseRegistry, PostgresDatabase, TypeCodec
+from riverorm.db.codecs import json_codecs, json_functions
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.codecs: list[dict[str, Any]] = []
+
+    async def set_type_codec(self, typename: str, **kwargs: Any) -> None:
+        self.codecs.append({"typename": typename, **kwargs})
+
+
+@pytest.mark.parametrize("library", ["orjson", "json"])
+def test_json_functions_round_trip_bytes(library: str):
+    dumps, loads = json_functions(library)
+    value = {"tags": ["a", "b"], "n": 1.5, "ok": None}
+    assert isinstance(dumps(value), bytes)
+    assert loads(dumps(value)) == value
+
+
+def test_json_functions_reject_unknown_library():
+    with pytest.raises(ValueError):
+        json_functions("yaml")
+
+
+def test_jsonb_codec_uses_versioned_binary_format():
+    json_codec, jsonb_codec = json_codecs("json")
+    assert (json_codec.typename, json_codec.format) == ("json", "binary")
+    assert jsonb_codec.encoder([1, 2]) == b"\x01[1,2]"
+    assert jsonb_codec.decoder(b'\x01{"a":1}') == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_registry_applies_codecs_and_replaces_by_type():
+    registry = CodecRegistry.default()
+    registry.register(TypeCodec("cents", encoder=str, decoder=int, schema="public"))
+    registry.register(TypeCodec("cents", encoder=repr, decoder=int, schema="public"))
+    assert len(registry) == 3
+    conn = RecordingConnection()
+    await registry.apply(conn)
+    assert [c["typename"] for c in conn.codecs] == ["json", "jsonb", "cents"]
+    assert conn.codecs[2]["encoder"] is repr
+    assert conn.codecs[2]["schema"] == "public"
+    registry.unregister("jsonb")
+    assert [c.typename for c in registry] == ["json", "cents"]
+
+
+def test_postgres_backend_installs_json_codecs_by_default():
+    assert [c.typename for c in PostgresDatabase("postgresql://x").codecs] == ["json", "jsonb"]
+    assert len(PostgresDatabase("postgresql://x", codecs=CodecRegistry()).codecs) == 0
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_json_decoded_by_driver_on_real_postgres(db_setup_and_teardown, db_type):
+    if db_type != "postgres":
+        pytest.skip("type codecs are asyncpg-specific")
+    db = DatabaseRegistry.get("postgres")
+    value = [{"id": 1, "tags": ["a"]}, None]
+    row = await db.fetchrow("SELECT $1::jsonb AS b, $1::json AS j", value)
+    assert row["b"] == value
+    assert row["j"] == value
@@ -0,0 +1,403 @@
+"""FakeDatabase tests: recorded statements and scripted responses.
+
+Pure unit tests: the fake backend is registered as the default connection and
+the ORM runs against it unchanged, for each dialect it can render.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from riverorm import Count, Field, IntegrityError, Model, Sum
+from riverorm.db import DatabaseRegistry, FakeDatabase
+from riverorm.db.fake import Statement
+from riverorm.sql import MySQLDialect, SQLiteDialect
+from tests.models import Order, User
+
+
+class Account(Model):
+    id: int | None = Field(default=None)
+    slug: str = Field(unique=True)
+    email: str = Field(unique=True)
+
+
+@pytest.fixture
+def fake_db(isolated_registry: None) -> FakeDatabase:
+    """Register a FakeDatabase as the only (default) connection."""
+    db = FakeDatabase()
+    DatabaseRegistry.register("fake", db)
+    return db
+
+
+def test_dialect_by_name_or_instance():
+    assert isinstance(FakeDatabase(dialect="mysql").dialect, MySQLDialect)
+    assert FakeDatabase(dialect=MySQLDialect()).dialect.placeholder(1) == "%s"
+    with pytest.raises(ValueError):
+        FakeDatabase(dialect="oracle")
+
+
+@pytest.mark.asyncio
+async def test_queryset_is_recorded_and_hydrated_from_scripted_rows(fake_db: FakeDatabase):
+    fake_db.on(r'FROM "user"', [{"id": 1, "username": "alice", "email": None, "is_active": True}])
+
+    users = await User.objects.filter(username="alice").order_by("-id").limit(5)
+
+    assert [u.username for u in users] == ["alice"]
+    [statement] = fake_db.statements
+    assert statement == Statement(
+        'SELECT * FROM "user" WHERE "username" = $1 ORDER BY "id" DESC LIMIT 5',
+        ("alice",),
+        "fetch_tuples",
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_gets_generated_keys_with_and_without_returning(fake_db: FakeDatabase):
+    first = await User(username="a").save()
+    second = await User(username="b").save()
+    assert (first.id, second.id) == (1, 2)
+    assert fake_db.statements[0].sql.endswith('RETURNING "id"')
+
+    mysql = FakeDatabase(dialect="mysql")
+    DatabaseRegistry.register("mysql", mysql)
+    DatabaseRegistry.set_default("mysql")
+    user = await User(username="c").save()
+    assert user.id == 1
+    assert mysql.statements[0].kind == "execute_insert"
+
+
+@pytest.mark.asyncio
+async def test_generated_rows_drive_load_related(fake_db: FakeDatabase):
+    fake_db.on(
+        r'FROM "user"',
+        [{"id": i, "username": f"u{i}", "email": None, "is_active": True} for i in (1, 2)],
+    )
+    fake_db.on(
+        r'FROM "order"',
+        lambda sql, params: [
+            {
+                "id": 10 * uid + n,
+                "quantity": 1,
+                "total_price": 1.0,
+                "status": "pending",
+                "user_id": uid,
+                "product_id": None,
+            }
+            for uid in params[0]  # user_id = ANY($1): one array of parent ids
+            for n in range(2)
+        ],
+    )
+
+    users = await User.load_related("orders").all()
+
+    assert [[o.id for o in u.orders] for u in users] == [[10, 11], [20, 21]]
+    assert all(isinstance(o, Order) for u in users for o in u.orders)
+    assert len(fake_db.statements) == 2
+    fake_db.reset()
+    assert fake_db.statements == []
+
+
+@pytest.mark.asyncio
+async def test_rowcount_responses(fake_db: FakeDatabase):
+    fake_db.on(r"^DELETE", 3)
+    assert await User.objects.filter(is_active=False).delete() == 3
+    assert await User.objects.update(is_active=True) == 0
+    assert await User.objects.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_in_list_skips_the_database(fake_db: FakeDatabase):
+    assert await User.objects.filter(id__in=[]).all() == []
+    assert await User.objects.filter(id__in=[]).count() == 0
+    assert await User.objects.filter(id__in=()).delete() == 0
+    assert fake_db.statements == []
+    await User.objects.exclude(id__in=[]).all()
+    assert fake_db.statements[0].sql == 'SELECT * FROM "user" WHERE TRUE'
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_splits_batches_and_returns_keys(fake_db: FakeDatabase):
+    users = await User.objects.bulk_create([User(username=f"u{n}") for n in range(5)], batch_size=2)
+    assert [u.id for u in users] == [1, 2, 3, 4, 5]
+    assert all(u._persisted for u in users)
+    assert [s.kind for s in fake_db.statements] == ["fetch"] * 3
+    assert fake_db.statements[0].sql == (
+        'INSERT INTO "user" ("username", "email", "is_active")'
+        ' VALUES ($1, $2, $3), ($4, $5, $6) RETURNING "id"'
+    )
+    assert fake_db.statements[2].params == ("u4", None, True)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_batches_under_the_parameter_limit(fake_db: FakeDatabase):
+    fake_db._dialect = SQLiteDialect(version=(3, 31, 0))  # 999 params, no RETURNING
+    users = await User.objects.bulk_create([User(username=f"u{n}") for n in range(700)])
+    # 3 columns per row -> at most 333 rows per statement.
+    assert [len(s.params) for s in fake_db.statements] == [999, 999, 102]
+    assert {s.kind for s in fake_db.statements} == {"execute_insert"}
+    # lastrowid names the last key of each statement; keys run consecutively.
+    assert [u.id for u in users] == list(range(1, 701))
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_mysql_keys_start_at_lastrowid(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect()
+    fake_db.on(r"^INSERT", [{"id": 41}])
+    users = await User.objects.bulk_create([User(username="a"), User(username="b")])
+    assert [u.id for u in users] == [41, 42]
+    with pytest.raises(ValueError):
+        await User.objects.bulk_create([User(id=1, username="a"), User(username="b")])
+    with pytest.raises(ValueError):
+        await User.objects.bulk_create([User(username="a")], batch_size=0)
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_on_a_unique_lookup_is_one_insert(fake_db: FakeDatabase):
+    user, created = await User.objects.get_or_create(id=7, defaults={"username": "new"})
+    assert created and user._persisted
+    assert [s.kind for s in fake_db.statements] == ["fetchrow"]
+    assert fake_db.statements[0].sql.endswith(' ON CONFLICT ("id") DO NOTHING RETURNING "id"')
+
+
+@pytest.mark.asyncio
+async def test_update_or_create_on_a_unique_lookup_is_one_upsert(fake_db: FakeDatabase):
+    row = {"id": 7, "username": "new", "email": "e@x", "is_active": True}
+    fake_db.on(r"ON CONFLICT", [{**row, "_riverorm_inserted": False}])
+    user, created = await User.objects.update_or_create(id=7, defaults={"username": "new"})
+    assert (created, user.username, user.email, user._persisted) == (False, "new", "e@x", True)
+    [statement] = fake_db.statements
+    assert statement.kind == "fetchrow"
+    assert statement.sql.endswith(
+        ' ON CONFLICT ("id") DO UPDATE SET "username" = EXCLUDED."username"'
+        ' RETURNING "id", "username", "email", "is_active", (xmax = 0) AS "_riverorm_inserted"'
+    )
+
+    fake_db.on(r"ON CONFLICT", [{**row, "_riverorm_inserted": True}])
+    _, created = await User.objects.update_or_create(id=7, defaults={"username": "new"})
+    assert created
+
+
+@pytest.mark.asyncio
+async def test_mysql_update_or_create_reads_the_outcome_from_the_rowcount(
+    fake_db: FakeDatabase,
+):
+    fake_db._dialect = MySQLDialect()
+    fake_db.on(r"^SELECT", [{"id": 3, "slug": "s", "email": "new@x"}])
+    fake_db.on(r"^INSERT", 2)  # updated
+    account, created = await Account.objects.update_or_create(slug="s", defaults={"email": "new@x"})
+    assert (created, account.id, account.email) == (False, 3, "new@x")
+    assert fake_db.statements[0].sql.endswith(
+        " ON DUPLICATE KEY UPDATE `email` = IF(`slug` <=> VALUES(`slug`), VALUES(`email`), `email`)"
+    )
+    assert [s.kind for s in fake_db.statements] == ["execute_returning_rowcount", "fetch_tuples"]
+
+    fake_db.reset()
+    fake_db.on(r"^INSERT", 1)  # inserted with a known key: nothing to read back
+    account, created = await Account.objects.update_or_create(
+        id=9, defaults={"slug": "t", "email": "t@x"}
+    )
+    assert created and account._persisted
+    assert len(fake_db.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_mysql_update_or_create_raises_on_a_clash_with_another_unique_key(
+    fake_db: FakeDatabase,
+):
+    fake_db._dialect = MySQLDialect()
+    # The email belongs to another row, so the strict upsert touched nothing
+    # and the slug's row keeps its old email.
+    fake_db.on(r"^INSERT", 0)
+    fake_db.on(r"^SELECT", [{"id": 3, "slug": "s", "email": "old@x"}])
+    fake_db.on(r"WHERE `email` = ", [{"1": 1}])
+    with pytest.raises(IntegrityError, match=r"\['email'\], not on \['slug'\]"):
+        await Account.objects.update_or_create(slug="s", defaults={"email": "taken@x"})
+
+
+@pytest.mark.asyncio
+async def test_update_or_create_in_steps_retries_a_row_deleted_before_the_update(
+    fake_db: FakeDatabase,
+):
+    fake_db._dialect = SQLiteDialect()
+    existing = [{"id": 7, "username": "old", "email": None, "is_active": True}]
+    inserts = iter([[], [{"id": 7}]])  # exists, then (after the delete) inserted
+    fake_db.on(r"^INSERT", lambda sql, params: next(inserts))
+    fake_db.on(r"^SELECT", existing)
+    fake_db.on(r"^UPDATE", 0)  # the row vanished between the read and the update
+    user, created = await User.objects.update_or_create(id=7, defaults={"username": "new"})
+    assert created and user.username == "new"
+    verbs = [s.sql.split()[0] for s in fake_db.statements]
+    assert verbs == ["INSERT", "SELECT", "UPDATE", "INSERT"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_without_unique_lookup_reads_first(fake_db: FakeDatabase):
+    user, created = await User.objects.get_or_create(username="alice")
+    assert created and user.id == 1
+    assert [s.sql.split()[0] for s in fake_db.statements] == ["SELECT", "INSERT"]
+
+
+@pytest.mark.asyncio
+async def test_mysql_get_or_create_names_a_clash_on_another_unique_key(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect()
+    # ON DUPLICATE KEY fires on the existing email, so no row matches the slug.
+    fake_db.on(r"WHERE `email` = ", [{"1": 1}])
+    with pytest.raises(
+        IntegrityError, match=r"on unique field\(s\) \['email'\], not on \['slug'\]"
+    ):
+        await Account.objects.get_or_create(slug="new", defaults={"email": "a@x"})
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_maps_returned_keys_by_conflict_field(fake_db: FakeDatabase):
+    fake_db.on(
+        r"^INSERT",
+        lambda sql, params: [{"id": 10 + n, "username": params[3 * n]} for n in (1, 0)],
+    )
+    users = await User.objects.bulk_upsert(
+        [User(username="a"), User(username="b")], conflict_fields=["username"]
+    )
+    assert [u.id for u in users] == [10, 11]
+    assert fake_db.statements[0].sql.endswith(
+        ' ON CONFLICT ("username") DO UPDATE SET "email" = EXCLUDED."email",'
+        ' "is_active" = EXCLUDED."is_active" RETURNING "id", "username"'
+    )
+    with pytest.raises(ValueError):
+        await User.objects.bulk_upsert([User(username="a")], conflict_fields=["nope"])
+
+
+@pytest.mark.asyncio
+async def test_mysql_upsert_reads_keys_back(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect()
+    fake_db.on(r"^SELECT", [{"id": 5, "username": "a"}])
+    user = await User.objects.upsert(User(username="a"), ["username"], update_fields=[])
+    assert (user.id, user._persisted) == (5, True)
+    insert, select = fake_db.statements
+    assert insert.sql.endswith(" ON DUPLICATE KEY UPDATE `username` = `username`")
+    assert select.sql == "SELECT `id`, `username` FROM `user` WHERE `username` IN (%s)"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_is_one_statement_per_batch(fake_db: FakeDatabase):
+    fake_db.on(r"^UPDATE", lambda sql, params: len(params) // 3)
+    users = [User(id=n, username=f"u{n}", is_active=False) for n in (1, 2, 3)]
+    assert await User.objects.bulk_update(users, ["username", "is_active"], batch_size=2) == 3
+    assert [s.kind for s in fake_db.statements] == ["execute_returning_rowcount"] * 2
+    first, second = fake_db.statements
+    assert first.sql == (
+        'UPDATE "user" SET "username" = "_v"."username", "is_active" = "_v"."is_active"'
+        " FROM (VALUES (CAST($1 AS INTEGER), CAST($2 AS TEXT), CAST($3 AS BOOLEAN)),"
+        ' ($4, $5, $6)) AS "_v" ("id", "username", "is_active") WHERE "user"."id" = "_v"."id"'
+    )
+    assert second.params == (3, "u3", False)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_respects_loaded_fields(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect()
+    full = User(id=1, username="a", email="a@x")
+    partial = User._from_partial_row({"id": 2, "username": "b"})
+    untouched = User._from_partial_row({"id": 3, "is_active": True})
+    await User.objects.bulk_update([full, partial, untouched], ["username", "email"])
+    # The partial instance never writes the email it did not fetch.
+    assert [s.params for s in fake_db.statements] == [(1, "a", "a@x"), (2, "b")]
+    assert fake_db.statements[1].sql == (
+        "UPDATE `user` JOIN (SELECT %s AS `id`, %s AS `username`) AS `_v`"
+        " ON `user`.`id` = `_v`.`id` SET `user`.`username` = `_v`.`username`"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_rejects_bad_input(fake_db: FakeDatabase):
+    with pytest.raises(ValueError):
+        await User.objects.bulk_update([User(id=1, username="a")], [])
+    with pytest.raises(ValueError):
+        await User.objects.bulk_update([User(id=1, username="a")], ["id"])
+    with pytest.raises(ValueError):
+        await User.objects.bulk_update([User(username="a")], ["username"])
+    with pytest.raises(ValueError):
+        await User.objects.bulk_update([User(id=1, username="a")] * 2, ["username"])
+    assert await User.objects.bulk_update([], ["username"]) == 0
+    assert fake_db.statements == []
+
+
+@pytest.mark.asyncio
+async def test_update_returning_hydrates_in_one_round_trip(fake_db: FakeDatabase):
+    fake_db.on(r"^UPDATE", [{"id": 4, "username": "bob", "email": None, "is_active": False}])
+    [user] = await User.objects.filter(id=4).update(is_active=False, returning=True)
+    assert (user.id, user.is_active, user._persisted) == (4, False, True)
+    [statement] = fake_db.statements
+    assert statement.sql == (
+        'UPDATE "user" SET "is_active" = $1 WHERE "id" = $2'
+        ' RETURNING "id", "username", "email", "is_active"'
+    )
+
+    fake_db.reset()
+    fake_db.on(r"^DELETE", [{"id": 4, "email": "b@x"}])
+    [gone] = await User.objects.filter(id=4).delete(returning=["email"])
+    assert (gone.email, gone._loaded_fields, gone._persisted) == ("b@x", {"id", "email"}, False)
+    assert fake_db.statements[0].sql == 'DELETE FROM "user" WHERE "id" = $1 RETURNING "id", "email"'
+    with pytest.raises(ValueError):
+        await User.objects.delete(returning=["nope"])
+
+
+@pytest.mark.asyncio
+async def test_mysql_update_returning_locks_then_writes(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect()
+    fake_db.on(r"^SELECT", [{"id": 4, "is_active": True}])
+    [user] = await User.objects.filter(id=4).update(is_active=False, returning=["is_active"])
+    assert (user.id, user.is_active) == (4, False)
+    assert [s.sql for s in fake_db.statements] == [
+        "START TRANSACTION",
+        "SELECT `id`, `is_active` FROM `user` WHERE `id` = %s FOR UPDATE",
+        "UPDATE `user` SET `is_active` = %s WHERE `id` = %s",
+        "COMMIT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mariadb_delete_returning_is_one_statement(fake_db: FakeDatabase):
+    fake_db._dialect = MySQLDialect((11, 4, 2), mariadb=True)
+    fake_db.on(r"^DELETE", [{"id": 4, "email": "b@x"}])
+    [gone] = await User.objects.filter(id=4).delete(returning=["email"])
+    assert (gone.id, gone.email, gone._persisted) == (4, "b@x", False)
+    [statement] = fake_db.statements
+    assert statement.sql == "DELETE FROM `user` WHERE `id` = %s RETURNING `id`, `email`"
+
+    # MariaDB has no UPDATE ... RETURNING, so update() still locks and reads.
+    fake_db.reset()
+    fake_db.on(r"^SELECT", [{"id": 4, "is_active": True}])
+    await User.objects.filter(id=4).update(is_active=False, returning=["is_active"])
+    assert [s.sql.split()[0] for s in fake_db.statements] == [
+        "START",
+        "SELECT",
+        "UPDATE",
+        "COMMIT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_values_annotate_groups_in_the_database(fake_db: FakeDatabase):
+    fake_db.on(r"GROUP BY", [{"status": "paid", "n": 2, "total_price__sum": 30.0}])
+    rows = await (
+        Order.objects.filter(quantity__gt=0)
+        .values("status")
+        .annotate(Sum("total_price"), n=Count())
+        .filter(n__gte=2, status__ne="void")
+        .order_by("-n")
+        .limit(10)
+    )
+    assert rows == [{"status": "paid", "n": 2, "total_price__sum": 30.0}]
+    [statement] = fake_db.statements
+    assert statement.sql == (
+        'SELECT "status", SUM("total_price") AS "total_price__sum", COUNT(*) AS "n"'
+        ' FROM "order" WHERE "quantity" > $1 AND "status" != $2 GROUP BY "status"'
+        ' HAVING COUNT(*) >= $3 ORDER BY "n" DESC LIMIT 10'
+    )
+    assert statement.params == (0, "void", 2)
+    with pytest.raises(ValueError):
+        Order.objects.values("status").annotate(status=Count())
+    with pytest.raises(ValueError):
+        Order.objects.values("nope")
+    with pytest.raises(ValueError):
+        await Order.objects.aggregate(Sum("nope"))
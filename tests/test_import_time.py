@@ -0,0 +1,81 @@
+"""Import-cost tests: ``import riverorm`` stays cheap and driver-free.
+
+Each test imports RiverORM in a fresh interpreter (``python -X importtime``),
+so modules already loaded by the test session don't hide the cost.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from riverorm.db import FakeDatabase, SQLiteDatabase, backend_class, register_backend
+from riverorm.db.backends import _BACKENDS
+
+#: Modules that only a chosen backend (or an explicit ``load_env()``) may load.
+LAZY_MODULES = ("asyncpg", "aiomysql", "pymysql", "sqlite3", "dotenv")
+
+#: Ceiling on the summed self-time of RiverORM's own modules, in microseconds.
+#: Generous on purpose (a cold, busy CI runner is slow); it catches import-time
+#: work creeping in, not small fluctuations.
+IMPORT_BUDGET_US = 300_000
+
+
+def _import_profile(code: str) -> dict[str, int]:
+    """Run ``code`` in a fresh interpreter and return ``{module: self-time µs}``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        profile[name.strip()] = int(self_us)
+    return profile
+
+
+def test_import_loads_no_driver():
+    profile = _import_profile("import riverorm, riverorm.db, riverorm.config")
+    assert [m for m in LAZY_MODULES if m in profile] == []
+
+
+def test_import_within_budget():
+    profile = _import_profile("import riverorm")
+    own = sum(us for name, us in profile.items() if name.split(".")[0] == "riverorm")
+    assert own < IMPORT_BUDGET_US, f"riverorm modules took {own / 1000:.1f}ms to import"
+
+
+@pytest.mark.parametrize(
+    ("name", "module"),
+    [("PostgresDatabase", "asyncpg"), ("MySQLDatabase", "aiomysql")],
+)
+def test_backend_loads_its_driver_on_first_access(name: str, module: str):
+    profile = _import_profile(f"from riverorm.db import {name}")
+    assert module in profile
+
+
+def test_backend_class_resolves_scheme_and_custom_backends():
+    assert backend_class("sqlite:///app.db") is SQLiteDatabase
+    assert backend_class("postgresql+pool://host/db").__name__ == "PostgresDatabase"
+    with pytest.raises(ValueError):
+        backend_class("oracle://host/db")
+    register_backend("memory", "riverorm.db.fake:FakeDatabase")
+    try:
+        assert backend_class("memory://") is FakeDatabase
+    finally:
+        del _BACKENDS["memory"]
+
+
+def test_backend_class_rejects_objects_that_are_not_backends():
+    register_backend("notadb", "riverorm.db.fake:Statement")
+    try:
+        with pytest.raises(TypeError, match="not a BaseDatabase subclass"):
+            backend_class("notadb://")
+    finally:
+        del _BACKENDS["notadb"]
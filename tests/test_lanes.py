@@ -0,0 +1,101 @@
+"""Priority-lane tests (``riverorm.lane`` / ``QuerySet.lane``).
+
+Pure unit tests: each lane is a fake backend over an ``asyncio.Queue`` pool,
+so routing and the per-lane connection cap can be asserted without servers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+import riverorm
+from riverorm.db import DatabaseRegistry, FakeDatabase, PoolConfig, PoolStats
+from riverorm.db.registry import DatabaseRegistryError
+from tests.models import User
+
+
+class LaneDatabase(FakeDatabase):
+    """FakeDatabase over a queue pool whose reads hold a connection for ``delay`` seconds."""
+
+    def __init__(self, max_size: int = 10, delay: float = 0.0) -> None:
+        super().__init__(pool=PoolConfig(min_size=0, max_size=max_size))
+        self.pool_stats = PoolStats(max_size=max_size)
+        self.free: asyncio.Queue[int] = asyncio.Queue()
+        for n in range(max_size):
+            self.free.put_nowait(n)
+        self.delay = delay
+        self.peak = 0
+        self.on(r"^SELECT COUNT", [{"count": 0}])
+
+    async def _acquire_connection(self) -> int:
+        return await self.free.get()
+
+    async def _release_connection(self, conn: int) -> None:
+        self.free.put_nowait(conn)
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        async with self.acquire():
+            self.peak = max(self.peak, self.pool_stats.in_use)
+            await asyncio.sleep(self.delay)
+            return await super().fetch_tuples(query, *args)
+
+
+@pytest.fixture
+def lanes(isolated_registry: None) -> tuple[LaneDatabase, LaneDatabase]:
+    """Register a main pool and a small ``bulk`` lane as the default alias."""
+    main, bulk = LaneDatabase(max_size=8), LaneDatabase(max_size=2, delay=0.05)
+    DatabaseRegistry.register("default", main, lanes={"bulk": bulk})
+    return main, bulk
+
+
+def test_lane_scope_selects_lane_backend(lanes):
+    main, bulk = lanes
+    assert DatabaseRegistry.get() is main
+    with riverorm.lane("bulk"):
+        assert DatabaseRegistry.get() is bulk
+        assert DatabaseRegistry.get(read=True) is bulk
+        with riverorm.lane(None):
+            assert DatabaseRegistry.get() is bulk
+        with riverorm.lane("interactive"):
+            # Unknown lanes fall back to the main pool.
+            assert DatabaseRegistry.get() is main
+    assert DatabaseRegistry.get() is main
+    assert DatabaseRegistry.lanes() == {"bulk": bulk}
+
+
+def test_lane_registration_errors(lanes):
+    with pytest.raises(DatabaseRegistryError):
+        DatabaseRegistry.register_lane("default", "bulk", LaneDatabase())
+    with pytest.raises(DatabaseRegistryError):
+        DatabaseRegistry.register_lane("missing", "bulk", LaneDatabase())
+    with pytest.raises(ValueError):
+        User.objects.lane("")
+
+
+@pytest.mark.asyncio
+async def test_queryset_lane_routes_terminals(lanes):
+    main, bulk = lanes
+    await User.objects.filter(is_active=True).lane("bulk")
+    await User.objects.lane("bulk").count()
+    await User.objects.lane("bulk").update(is_active=False)
+    await User.objects.all()
+    assert len(bulk.statements) == 3
+    assert len(main.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_lane_never_exceeds_its_share(lanes):
+    main, bulk = lanes
+    jobs = [asyncio.create_task(User.objects.lane("bulk").all()) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    # Interactive traffic gets a connection while the bulk lane is saturated.
+    await asyncio.wait_for(User.objects.all(), timeout=0.02)
+    await asyncio.gather(*jobs)
+    assert bulk.peak == 2
+    assert main.peak == 1
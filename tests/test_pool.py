@@ -0,0 +1,264 @@
+"""Connection-pool tests.
+
+Pure tests drive :meth:`BaseDatabase.acquire` through an in-memory pool to check
+configuration validation, stats and recycling; the DB-backed test checks that
+concurrent queries no longer serialize on (or break) a single connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from riverorm.db import FakeDatabase, PoolConfig, PoolStats, PoolTimeoutError
+from tests.models import User
+
+
+class _Conn:
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.closed = False
+        self.commands: list[tuple[int, bytes]] = []
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def _execute_command(self, command: int, payload: bytes) -> None:
+        self.commands.append((command, payload))
+
+    async def _read_packet(self) -> None: ...
+
+
+class PooledFakeDatabase(FakeDatabase):
+    """FakeDatabase over an ``asyncio.Queue`` standing in for a driver pool."""
+
+    def __init__(self, dsn: str = "fake://", debug: bool = False, pool: PoolConfig | None = None):
+        super().__init__(dsn, debug, pool)
+        self.pool_stats = PoolStats(max_size=self.pool_config.max_size)
+        self.free: asyncio.Queue[_Conn] = asyncio.Queue()
+        self.opened = 0
+        self.queries: dict[int, int] = {}
+
+    async def connect(self) -> None:
+        for _ in range(self.pool_config.max_size):
+            self._open()
+        self.is_connected = True
+
+    def _open(self) -> None:
+        self.opened += 1
+        self.free.put_nowait(_Conn(self.opened))
+
+    async def _acquire_connection(self) -> _Conn:
+        return await self.free.get()
+
+    async def _release_connection(self, conn: _Conn) -> None:
+        self.queries[conn.n] = self.queries.get(conn.n, 0) + 1
+        if self._should_recycle(None, self.queries[conn.n]):
+            conn.closed = True
+            self.pool_stats.recycled += 1
+            self._open()
+            return
+        self.free.put_nowait(conn)
+
+    async def execute(self, query: str, *args: Any) -> Any:
+        async with self.acquire() as conn:
+            await asyncio.sleep(0.01)
+            return conn
+
+
+# -- PoolConfig --------------------------------------------------------------
+
+
+def test_pool_config_defaults():
+    cfg = PoolConfig()
+    assert (cfg.min_size, cfg.max_size) == (1, 10)
+    assert cfg.acquire_timeout is None
+    assert cfg.max_lifetime is None
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_size": -1},
+        {"max_size": 0},
+        {"min_size": 5, "max_size": 2},
+        {"acquire_timeout": 0},
+        {"max_idle_time": -1.0},
+        {"max_queries": 0},
+    ],
+)
+def test_pool_config_rejects_invalid_values(kwargs: dict[str, Any]):
+    with pytest.raises(ValueError):
+        PoolConfig(**kwargs)
+
+
+def test_backends_accept_pool_config():
+    from riverorm.db import MySQLDatabase, PostgresDatabase
+
+    cfg = PoolConfig(min_size=2, max_size=20, acquire_timeout=1.5)
+    for db in (PostgresDatabase("postgresql://x", pool=cfg), MySQLDatabase("mysql://x", pool=cfg)):
+        assert db.pool_config is cfg
+        assert db.pool_stats.max_size == 20
+
+
+# -- warm-up -----------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_warm_up_primes_min_size_distinct_connections():
+    class WarmingDatabase(PooledFakeDatabase):
+        async def _warm_connection(self, conn: _Conn) -> None:
+            warmed.append(conn.n)
+
+    warmed: list[int] = []
+    db = WarmingDatabase(pool=PoolConfig(min_size=3, max_size=5))
+    await db.connect()
+    await db.warm_up()
+    assert sorted(warmed) == [1, 2, 3]
+    assert db.pool_stats.in_use == 0
+    assert db.free.qsize() == 5
+
+
+# -- acquire() / PoolStats ---------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_statements_use_separate_connections():
+    db = PooledFakeDatabase(pool=PoolConfig(max_size=4))
+    await db.connect()
+    conns = await asyncio.gather(*(db.execute("SELECT 1") for _ in range(4)))
+    assert len({c.n for c in conns}) == 4
+    assert db.pool_stats.acquired == 4
+    assert db.pool_stats.in_use == 0
+    assert db.pool_stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_records_wait_time():
+    db = PooledFakeDatabase(pool=PoolConfig(min_size=1, max_size=1))
+    await db.connect()
+    await asyncio.gather(*(db.execute("SELECT 1") for _ in range(3)))
+    stats = db.pool_stats
+    assert stats.acquired == 3
+    assert stats.wait_time_max > 0
+    assert stats.wait_time_avg > 0
+
+
+@pytest.mark.asyncio
+async def test_saturation_reflects_checked_out_connections():
+    db = PooledFakeDatabase(pool=PoolConfig(min_size=1, max_size=2))
+    await db.connect()
+    async with db.acquire():
+        assert db.pool_stats.saturation == 0.5
+        async with db.acquire():
+            assert db.pool_stats.saturation == 1.0
+    assert db.pool_stats.saturation == 0.0
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_raises_and_counts():
+    db = PooledFakeDatabase(pool=PoolConfig(min_size=1, max_size=1, acquire_timeout=0.01))
+    await db.connect()
+    async with db.acquire():
+        with pytest.raises(PoolTimeoutError, match="1/1 in use"):
+            async with db.acquire():
+                pass
+    assert db.pool_stats.timeouts == 1
+    assert db.pool_stats.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_connection_recycled_after_max_queries():
+    db = PooledFakeDatabase(pool=PoolConfig(min_size=1, max_size=1, max_queries=2))
+    await db.connect()
+    first = await db.execute("SELECT 1")
+    assert await db.execute("SELECT 1") is first
+    assert first.closed
+    assert db.pool_stats.recycled == 1
+    assert await db.execute("SELECT 1") is not first
+
+
+class _DriverPool:
+    """Mimics aiomysql's pool: waiters are only woken by a *live* connection."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.free: list[_Conn] = []
+        self.used: set[_Conn] = set()
+        self.opened = 0
+        self.cond = asyncio.Condition()
+
+    async def acquire(self) -> _Conn:
+        async with self.cond:
+            while not self.free and len(self.used) >= self.maxsize:
+                await self.cond.wait()
+            if not self.free:
+                self.opened += 1
+                self.free.append(_Conn(self.opened))
+            conn = self.free.pop()
+            self.used.add(conn)
+            return conn
+
+    async def release(self, conn: _Conn) -> None:
+        self.used.discard(conn)
+        if not conn.closed:
+            self.free.append(conn)
+            async with self.cond:
+                self.cond.notify()
+
+    def close(self) -> None: ...
+
+    async def wait_closed(self) -> None: ...
+
+
+@pytest.mark.asyncio
+async def test_mysql_waiter_gets_a_connection_after_one_is_retired():
+    from riverorm.db import MySQLDatabase
+
+    db = MySQLDatabase("mysql://x", pool=PoolConfig(min_size=0, max_size=1, max_queries=1))
+    pool = _DriverPool(maxsize=1)
+    db._pool = pool  # type: ignore[assignment]
+    async with db.acquire() as first:
+        waiter = asyncio.create_task(asyncio.wait_for(db._acquire_connection(), 1))
+        await asyncio.sleep(0)
+    # ``first`` hit max_queries and was closed, so the driver pool never woke
+    # anyone; the waiter must still get a fresh connection.
+    assert first.closed
+    second = await waiter
+    assert second is not first
+    assert pool.opened == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("multi_statements", [False, True])
+async def test_mysql_multi_statement_mode_is_off_unless_enabled(multi_statements: bool):
+    from riverorm.db import MySQLDatabase
+
+    db = MySQLDatabase("mysql://x", multi_statements=multi_statements)
+    db._pool = _DriverPool(maxsize=1)  # type: ignore[assignment]
+    async with db.acquire() as conn:
+        pass
+    # COM_SET_OPTION (27) with MYSQL_OPTION_MULTI_STATEMENTS_OFF (1).
+    assert conn.commands == ([] if multi_statements else [(27, b"\x01\x00")])
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_on_real_pool(db_setup_and_teardown):
+    await User.objects.create(username="alice")
+    counts = await asyncio.gather(*(User.objects.count() for _ in range(20)))
+    assert counts == [1] * 20
+    assert User.db().pool_stats.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_on_real_pool(db_setup_and_teardown):
+    db = User.db()
+    await db.warm_up()
+    assert db.pool_stats.in_use == 0
+    await User.objects.create(username="warm")
+    assert await User.objects.count() == 1
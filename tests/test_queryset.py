@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 
+from riverorm import Count, Max, Min
 from riverorm.queryset import Manager, QuerySet
 from tests.models import Order, Product, User
 
@@ -183,7 +184,60 @@ async def test_load_related_composes_with_ordering(db_setup_and_teardown):
     assert len(u.orders) == 2
 
 
+def test_reader_hydrates_positional_rows():
+    users = User.objects.get_queryset()._reader(["id", "username", "email", "is_active"])
+    user = users((1, "alice", None, True))
+    assert (user.id, user.username, user._persisted) == (1, "alice", True)
+
+    partial = User.objects.only("username")._reader(["id", "username"])((2, "bob"))
+    assert partial._loaded_fields == {"id", "username"}
+
+    columns = ["id", "name", "price", "description", "in_stock", "user_id"]
+    columns += ["user__id", "user__username", "user__email", "user__is_active"]
+    products = Product.objects.select_related("user")._reader(columns)
+    product = products((5, "Widget", 1.0, "w", True, 1, 1, "alice", None, True))
+    assert product.name == "Widget" and product.user.username == "alice"
+    orphan = products((6, "Gadget", 2.0, "g", True, None, None, None, None, None))
+    assert orphan.user is None
+
+
+@pytest.mark.asyncio
+async def test_mysql_tuple_rows_carry_one_column_list():
+    from riverorm.db.mysql import _columns_and_rows
+
+    class Cursor:
+        description = (("id", 3), ("username", 253))
+
+        async def fetchall(self):
+            return ((1, "alice"), (2, "bob"))
+
+    assert await _columns_and_rows(Cursor()) == (["id", "username"], ((1, "alice"), (2, "bob")))
+
+
 def test_queryset_is_generic_alias():
     # smoke check that the type parameterizes cleanly
     qs: QuerySet[User] = User.objects.filter(id=1)
     assert qs.model is User
+
+
+@pytest.mark.asyncio
+async def test_aggregate_and_grouped_annotate(db_setup_and_teardown):
+    await _seed_users()
+    stats = await User.objects.aggregate(
+        Count(), active=Count("email", distinct=True), first=Min("username")
+    )
+    assert stats == {"count": 3, "active": 3, "first": "alice"}
+    assert (await User.objects.filter(id__in=[]).aggregate(top=Max("id")))["top"] is None
+
+    rows = await User.objects.values("is_active").annotate(n=Count()).order_by("-n")
+    assert [(bool(r["is_active"]), r["n"]) for r in rows] == [(True, 2), (False, 1)]
+    rows = await User.objects.values("is_active").annotate(n=Count()).filter(n__gt=1)
+    assert [r["n"] for r in rows] == [2]
+    assert await User.objects.filter(username="bob").values("username") == [{"username": "bob"}]
+
+
+@pytest.mark.asyncio
+async def test_empty_in_matches_no_groups(db_setup_and_teardown):
+    await _seed_users()
+    assert await User.objects.filter(id__in=[]).values("is_active").annotate(n=Count()) == []
+    assert await User.objects.filter(id__in=[]).values("username") == []
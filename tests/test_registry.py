@@ -1,18 +1,26 @@
 """DatabaseRegistry and Meta.db_alias routing tests.
 
 Pure unit tests (no real connections): registration rules, default selection,
-error paths for unknown/duplicate aliases, and model→connection routing.
+error paths for unknown/duplicate aliases, model→connection routing,
+read-replica balancing and concurrent connect/close.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 import pytest
 
 from riverorm import Field, Model
-from riverorm.db import BaseDatabase, DatabaseRegistry
+from riverorm.db import (
+    BaseDatabase,
+    DatabaseRegistry,
+    LeastOutstandingPolicy,
+    PoolStats,
+    ReplicaPolicy,
+)
 from riverorm.db.registry import DatabaseRegistryError
 from riverorm.sql import Dialect
 from riverorm.sql.dialect import PostgresDialect
@@ -55,19 +63,6 @@ class FakeDatabase(BaseDatabase):
         return 0
 
 
-@pytest.fixture
-def isolated_registry() -> Iterator[None]:
-    """Snapshot the global registry, give the test a clean slate, then restore."""
-    saved_connections = dict(DatabaseRegistry._connections)
-    saved_default = DatabaseRegistry._default
-    DatabaseRegistry.clear()
-    try:
-        yield
-    finally:
-        DatabaseRegistry._connections = saved_connections
-        DatabaseRegistry._default = saved_default
-
-
 # ---------------------------------------------------------------------------
 # Registration & default selection
 # ---------------------------------------------------------------------------
@@ -172,3 +167,158 @@ def test_model_with_unregistered_alias_raises(isolated_registry):
 
     with pytest.raises(DatabaseRegistryError, match="No database connection found"):
         Orphan.db()
+
+
+# ---------------------------------------------------------------------------
+# Read replicas
+# ---------------------------------------------------------------------------
+
+
+class _Account(Model):
+    id: int | None = Field(default=None)
+
+
+def test_read_without_replicas_uses_primary(isolated_registry):
+    primary = FakeDatabase()
+    DatabaseRegistry.register("main", primary)
+    assert DatabaseRegistry.get("main", read=True) is primary
+
+
+def test_reads_round_robin_across_replicas(isolated_registry):
+    primary, r1, r2 = FakeDatabase(), FakeDatabase(), FakeDatabase()
+    DatabaseRegistry.register("main", primary, replicas=[r1, r2])
+    picked = [DatabaseRegistry.get("main", read=True) for _ in range(4)]
+    assert picked == [r1, r2, r1, r2]
+    assert DatabaseRegistry.get("main") is primary  # writes stay on the primary
+    assert DatabaseRegistry.replicas("main") == [r1, r2]
+
+
+def test_least_outstanding_prefers_idle_replica(isolated_registry):
+    busy, idle = FakeDatabase(), FakeDatabase()
+    busy.pool_stats = PoolStats(max_size=10, in_use=3)
+    idle.pool_stats = PoolStats(max_size=10, in_use=1, waiting=1)
+    DatabaseRegistry.register(
+        "main", FakeDatabase(), replicas=[busy, idle], policy=LeastOutstandingPolicy()
+    )
+    assert {DatabaseRegistry.get("main", read=True) for _ in range(3)} == {idle}
+
+
+def test_custom_policy(isolated_registry):
+    class LastReplica(ReplicaPolicy):
+        def choose(self, replicas: Sequence[BaseDatabase]) -> BaseDatabase:
+            return replicas[-1]
+
+    r1, r2 = FakeDatabase(), FakeDatabase()
+    DatabaseRegistry.register("main", FakeDatabase(), replicas=[r1, r2], policy=LastReplica())
+    assert DatabaseRegistry.get("main", read=True) is r2
+
+
+def test_queryset_reads_replica_and_writes_primary(isolated_registry):
+    primary, replica = FakeDatabase(), FakeDatabase()
+    DatabaseRegistry.register("main", primary, replicas=[replica])
+    qs = _Account.objects.filter(id=1)
+    assert qs._db() is replica
+    assert qs._db(write=True) is primary
+    assert qs.primary()._db() is primary
+    assert _Account.db() is primary
+
+
+def test_queryset_using_overrides_alias(isolated_registry):
+    default_db, other, other_replica = FakeDatabase(), FakeDatabase(), FakeDatabase()
+    DatabaseRegistry.register("default", default_db)
+    DatabaseRegistry.register("other", other, replicas=[other_replica])
+    qs = _Account.objects.using("other")
+    assert qs._db() is other_replica
+    assert qs.primary()._db() is other
+    assert _Account.objects.get_queryset()._db() is default_db
+
+
+@pytest.mark.asyncio
+async def test_connect_and_close_include_replicas(isolated_registry):
+    primary, replica = FakeDatabase(), FakeDatabase()
+    DatabaseRegistry.register("main", primary, replicas=[replica])
+    await DatabaseRegistry.connect()
+    assert primary.is_connected and replica.is_connected
+    await DatabaseRegistry.close()
+    assert not primary.is_connected and not replica.is_connected
+
+
+def test_clear_drops_replicas(isolated_registry):
+    DatabaseRegistry.register("main", FakeDatabase(), replicas=[FakeDatabase()])
+    DatabaseRegistry.clear()
+    assert DatabaseRegistry.replicas("main") == []
+
+
+# ---------------------------------------------------------------------------
+# Concurrent connect / close
+# ---------------------------------------------------------------------------
+
+
+class BarrierDatabase(FakeDatabase):
+    """Connects only once every peer has started connecting (proves concurrency)."""
+
+    def __init__(self, peers: int, started: list[BarrierDatabase]) -> None:
+        super().__init__()
+        self.peers = peers
+        self.started = started
+        self.warmed = False
+
+    async def _rendezvous(self) -> None:
+        self.started.append(self)
+        async with asyncio.timeout(1):
+            while len(self.started) < self.peers:
+                await asyncio.sleep(0)
+
+    async def connect(self) -> None:
+        await self._rendezvous()
+        self.is_connected = True
+
+    async def close(self) -> None:
+        await self._rendezvous()
+        self.is_connected = False
+
+    async def warm_up(self) -> None:
+        self.warmed = True
+
+
+@pytest.mark.asyncio
+async def test_connect_runs_concurrently_and_reports_latency(isolated_registry):
+    started: list[BarrierDatabase] = []
+    primary, replica, other = (BarrierDatabase(3, started) for _ in range(3))
+    DatabaseRegistry.register("main", primary, replicas=[replica])
+    DatabaseRegistry.register("other", other)
+    latencies = await DatabaseRegistry.connect()
+    assert set(latencies) == {"main", "main.replica0", "other"}
+    assert all(seconds >= 0 for seconds in latencies.values())
+    assert not primary.warmed
+
+    started.clear()
+    await DatabaseRegistry.close()
+    assert not any(db.is_connected for db in (primary, replica, other))
+
+
+@pytest.mark.asyncio
+async def test_connect_warm_up_and_skips_connected(isolated_registry):
+    started: list[BarrierDatabase] = []
+    fresh = BarrierDatabase(1, started)
+    connected = FakeDatabase()
+    connected.is_connected = True
+    DatabaseRegistry.register("fresh", fresh)
+    DatabaseRegistry.register("connected", connected)
+    latencies = await DatabaseRegistry.connect(warm_up=True)
+    assert list(latencies) == ["fresh"]
+    assert fresh.warmed
+
+
+@pytest.mark.asyncio
+async def test_connect_failure_is_raised_after_others_finish(isolated_registry):
+    class Broken(FakeDatabase):
+        async def connect(self) -> None:
+            raise ConnectionRefusedError("down")
+
+    healthy = FakeDatabase()
+    DatabaseRegistry.register("broken", Broken())
+    DatabaseRegistry.register("healthy", healthy)
+    with pytest.raises(ConnectionRefusedError, match="down"):
+        await DatabaseRegistry.connect()
+    assert healthy.is_connected
@@ -204,15 +204,18 @@ async def test_load_related_reverse_is_batched_no_n_plus_one(db_setup_and_teardo
         await _make_order(u.id, product.id)
 
     db = User.db()
-    original_fetch = db.fetch
     calls = 0
 
-    async def counting_fetch(query, *args):
-        nonlocal calls
-        calls += 1
-        return await original_fetch(query, *args)
+    def counting(method):
+        async def wrapper(query, *args):
+            nonlocal calls
+            calls += 1
+            return await method(query, *args)
 
-    monkeypatch.setattr(db, "fetch", counting_fetch)
+        return wrapper
+
+    monkeypatch.setattr(db, "fetch", counting(db.fetch))
+    monkeypatch.setattr(db, "fetch_tuples", counting(db.fetch_tuples))
 
     loaded = await User.load_related("orders").filter(id__in=[u.id for u in users])
 
@@ -0,0 +1,152 @@
+"""Transient-error retry tests.
+
+Pure tests drive :meth:`BaseDatabase._retrying` through a fake backend whose
+statements fail a scripted number of times with real driver exceptions, so
+classification, backoff, the read/write split and the counters are checked
+without a server.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import pytest
+from asyncpg.exceptions import DeadlockDetectedError, SerializationError, UniqueViolationError
+from pymysql.err import IntegrityError, OperationalError
+
+from riverorm.db import FakeDatabase, RetryPolicy, RetryStats, retry_writes
+from riverorm.db.base import R, is_read
+
+
+class FlakyDatabase(FakeDatabase):
+    """FakeDatabase whose statements raise ``errors`` (in order) before succeeding."""
+
+    def __init__(self, errors: list[Exception], retry: RetryPolicy | None = None) -> None:
+        super().__init__()
+        self.errors = errors
+        self.attempts = 0
+        self.retry_policy = retry or RetryPolicy(base_delay=0, jitter=False)
+        self.on(r"", lambda sql, params: "ok")
+
+    async def _flaky(self, statement: Callable[..., Awaitable[R]], query: str, *args: Any) -> R:
+        async def attempt() -> R:
+            self.attempts += 1
+            if self.errors:
+                raise self.errors.pop(0)
+            return await statement(query, *args)
+
+        return await self._retrying(attempt, read=is_read(query))
+
+    async def execute(self, query: str, *args: Any) -> Any:
+        return await self._flaky(super().execute, query, *args)
+
+    async def fetch(self, query: str, *args: Any) -> Sequence[Any]:
+        return await self._flaky(super().fetch, query, *args)
+
+
+# -- RetryPolicy ---------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("exc", "reason"),
+    [
+        (DeadlockDetectedError("deadlock"), "40P01"),
+        (SerializationError("serialization"), "40001"),
+        (OperationalError(1213, "Deadlock found"), "1213"),
+        (OperationalError(2013, "Lost connection"), "2013"),
+        (ConnectionResetError(104, "reset"), "ConnectionResetError"),
+        (UniqueViolationError("duplicate"), None),
+        (IntegrityError(1062, "Duplicate entry"), None),
+        (ValueError("bad"), None),
+    ],
+)
+def test_classify(exc: Exception, reason: str | None):
+    assert RetryPolicy().classify(exc) == reason
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, jitter=False)
+    assert [policy.delay(n) for n in (1, 2, 3, 4)] == [0.1, 0.2, 0.3, 0.3]
+    jittered = RetryPolicy(base_delay=0.1, max_delay=0.3)
+    assert all(0 <= jittered.delay(3) <= 0.3 for _ in range(50))
+
+
+def test_policy_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay=-1)
+
+
+# -- BaseDatabase._retrying ------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_read_retried_until_success():
+    db = FlakyDatabase([DeadlockDetectedError("x"), OperationalError(2006, "gone")])
+    assert await db.fetch("SELECT 1") == "ok"
+    assert db.attempts == 3
+    assert db.retry_stats.retries == 2
+    assert db.retry_stats.recovered == 1
+    assert db.retry_stats.reasons == {"40P01": 1, "2006": 1}
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_reraise_and_count():
+    db = FlakyDatabase([SerializationError("x")] * 5)
+    with pytest.raises(SerializationError):
+        await db.fetch("SELECT 1")
+    assert db.attempts == 3
+    assert db.retry_stats.exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_non_transient_error_is_not_retried():
+    db = FlakyDatabase([UniqueViolationError("dup")])
+    with pytest.raises(UniqueViolationError):
+        await db.fetch("SELECT 1")
+    assert db.attempts == 1
+    assert db.retry_stats.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_writes_retry_only_when_marked():
+    db = FlakyDatabase([DeadlockDetectedError("x")])
+    with pytest.raises(DeadlockDetectedError):
+        await db.execute("UPDATE t SET x = 1")
+    assert db.attempts == 1
+
+    db = FlakyDatabase([DeadlockDetectedError("x")])
+    with retry_writes():
+        assert await db.execute("UPDATE t SET x = 1") == "ok"
+    assert db.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_single_attempt_policy_disables_retries():
+    db = FlakyDatabase([DeadlockDetectedError("x")], retry=RetryPolicy(max_attempts=1))
+    with pytest.raises(DeadlockDetectedError):
+        await db.fetch("SELECT 1")
+    assert db.retry_stats.exhausted == 0
+
+
+def test_backends_accept_retry_policy():
+    from riverorm.db import MySQLDatabase, PostgresDatabase
+
+    policy = RetryPolicy(max_attempts=5)
+    for db in (
+        PostgresDatabase("postgresql://x", retry=policy),
+        MySQLDatabase("mysql://x", retry=policy),
+    ):
+        assert db.retry_policy is policy
+        assert db.retry_stats == RetryStats()
+    assert PostgresDatabase("postgresql://x").retry_policy == RetryPolicy()
+
+
+def test_only_selects_count_as_reads():
+    from riverorm.db.base import is_read
+
+    assert is_read('  select * FROM "user"')
+    assert not is_read('INSERT INTO "user" ("username") VALUES ($1) RETURNING "id"')
+    assert not is_read('UPDATE "user" SET "username" = $1')
@@ -0,0 +1,256 @@
+"""Horizontal sharding tests: shard maps, routing and scatter-gather queries.
+
+Pure unit tests: each shard is a fake backend serving pre-sorted rows (as the
+database would return them for the query's ``ORDER BY``) and recording every
+statement, so routing, per-shard limits and the k-way merge can be asserted
+without real servers.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+import pytest
+
+from riverorm import Avg, Count, Field, Max, Min, Model, Sum
+from riverorm.db import DatabaseRegistry, FakeDatabase, HashShardMap, RangeShardMap
+from riverorm.db.registry import DatabaseRegistryError
+
+
+class Event(Model):
+    id: int | None = Field(default=None)
+    tenant_id: int
+    score: int | None = None
+
+    class Meta:
+        db_alias = "events"
+        shard_key = "tenant_id"
+
+
+class ShardDatabase(FakeDatabase):
+    """Fake shard serving ``rows`` (honouring ``LIMIT``) and recording statements."""
+
+    _reducers: ClassVar[dict[str, Callable[[list[Any]], Any]]] = {
+        "SUM": sum,
+        "MIN": min,
+        "MAX": max,
+    }
+
+    def __init__(self, rows: list[dict[str, Any]] | None = None, dsn: str = "fake://") -> None:
+        super().__init__(dsn)
+        self.rows = rows or []
+        self.on(r"^SELECT", self._select)
+        self.on(r"^(UPDATE|DELETE)", lambda sql, params: len(self.rows))
+
+    def _select(self, query: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        if query.startswith("SELECT COUNT(*) FROM"):
+            return [{"count": len(self.rows)}]
+        if " AS " in query:
+            return [self._aggregates(query)]
+        match = re.search(r"LIMIT (\d+)", query)
+        return self.rows[: int(match.group(1))] if match else list(self.rows)
+
+    def _aggregates(self, query: str) -> dict[str, Any]:
+        """Evaluate the ``FUNC("col") AS "alias"`` projections of an aggregate query."""
+        row: dict[str, Any] = {}
+        for function, column, alias in re.findall(r'(\w+)\((\*|"\w+")\) AS "(\w+)"', query):
+            values = [r[column.strip('"')] for r in self.rows] if column != "*" else self.rows
+            values = [v for v in values if v is not None]
+            if function == "COUNT":
+                row[alias] = len(values)
+            else:
+                row[alias] = self._reducers[function](values) if values else None
+        return row
+
+
+def _events(tenant_id: int, scores: list[int | None]) -> list[dict[str, Any]]:
+    return [
+        {"id": tenant_id * 100 + i, "tenant_id": tenant_id, "score": score}
+        for i, score in enumerate(scores)
+    ]
+
+
+@pytest.fixture
+def shards(isolated_registry: None) -> dict[str, ShardDatabase]:
+    """Register shards ``s0``/``s1`` behind the ``events`` range-sharded group."""
+    dbs = {"s0": ShardDatabase(), "s1": ShardDatabase()}
+    for alias, db in dbs.items():
+        DatabaseRegistry.register(alias, db)
+    DatabaseRegistry.register_shards("events", RangeShardMap([(100, "s0"), (None, "s1")]))
+    return dbs
+
+
+# ---------------------------------------------------------------------------
+# Shard maps
+# ---------------------------------------------------------------------------
+
+
+def test_hash_shard_map_is_stable_and_spreads_keys():
+    shard_map = HashShardMap(["a", "b", "c"])
+    assert shard_map.alias_for(42) == HashShardMap(["a", "b", "c"]).alias_for(42)
+    assert {shard_map.alias_for(k) for k in range(100)} == {"a", "b", "c"}
+
+
+def test_range_shard_map_bounds():
+    shard_map = RangeShardMap([(10, "low"), (20, "mid"), (None, "high")])
+    assert [shard_map.alias_for(k) for k in (0, 9, 10, 19, 20, 10**9)] == [
+        "low",
+        "low",
+        "mid",
+        "mid",
+        "high",
+        "high",
+    ]
+    with pytest.raises(ValueError, match="beyond the last"):
+        RangeShardMap([(10, "low")]).alias_for(10)
+    with pytest.raises(ValueError, match="sorted"):
+        RangeShardMap([(20, "a"), (10, "b")])
+
+
+def test_shard_maps_reject_none_keys():
+    with pytest.raises(ValueError, match="None"):
+        HashShardMap(["a"]).alias_for(None)
+
+
+def test_sharded_model_has_no_single_db(shards):
+    with pytest.raises(DatabaseRegistryError, match="sharded"):
+        Event.db()
+    assert Event.db_for_shard(150) is shards["s1"]
+    assert Event.databases() == [shards["s0"], shards["s1"]]
+
+
+# ---------------------------------------------------------------------------
+# Routing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_save_routes_to_the_key_shard(shards):
+    await Event(tenant_id=7).save()
+    await Event(tenant_id=700).save()
+    assert len(shards["s0"].statements) == 1
+    assert len(shards["s1"].statements) == 1
+    assert shards["s1"].statements[0].params[0] == 700
+
+
+@pytest.mark.asyncio
+async def test_save_without_shard_key_raises(shards):
+    event = Event.model_construct(tenant_id=None)
+    with pytest.raises(ValueError, match="sharded by 'tenant_id'"):
+        await event.save()
+
+
+@pytest.mark.asyncio
+async def test_get_with_key_hits_one_shard(shards):
+    shards["s1"].rows = _events(150, [1])
+    event = await Event.objects.get(tenant_id=150, id=15000)
+    assert event.id == 15000
+    assert shards["s0"].statements == []
+
+
+@pytest.mark.asyncio
+async def test_in_filter_narrows_shards(shards):
+    await Event.objects.filter(tenant_id__in=[1, 2]).all()
+    assert shards["s1"].statements == []
+    assert len(shards["s0"].statements) == 1
+
+
+# ---------------------------------------------------------------------------
+# Scatter-gather
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_fan_out_merges_order_and_limit(shards):
+    shards["s0"].rows = _events(1, [1, 4, 6, 9])
+    shards["s1"].rows = _events(200, [2, 3, 8])
+    events = await Event.objects.order_by("score").offset(1).limit(3)
+    assert [e.score for e in events] == [2, 3, 4]
+    # Each shard is asked only for offset + limit rows, with the offset dropped.
+    for db in shards.values():
+        assert db.statements[0].sql.endswith('ORDER BY "score" ASC LIMIT 4')
+
+
+@pytest.mark.asyncio
+async def test_fan_out_merges_descending_with_nulls(shards):
+    shards["s0"].rows = _events(1, [None, 5, 1])
+    shards["s1"].rows = _events(200, [None, 7, 3])
+    events = await Event.objects.order_by("-score")
+    # Postgres sorts NULLs first in descending order.
+    assert [e.score for e in events] == [None, None, 7, 5, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_count_update_delete_sum_across_shards(shards):
+    shards["s0"].rows = _events(1, [1, 2])
+    shards["s1"].rows = _events(200, [3])
+    assert await Event.objects.count() == 3
+    assert await Event.objects.update(score=0) == 3
+    assert await Event.objects.filter(tenant_id=1).delete() == 2
+
+
+@pytest.mark.asyncio
+async def test_aggregate_combines_shard_results(shards):
+    shards["s0"].rows = _events(1, [1, 2, None])
+    shards["s1"].rows = _events(200, [6])
+    stats = await Event.objects.aggregate(
+        Count(), total=Sum("score"), avg=Avg("score"), low=Min("score"), high=Max("score")
+    )
+    assert stats == {"count": 4, "total": 9, "avg": 3.0, "low": 1, "high": 6}
+    with pytest.raises(ValueError):
+        await Event.objects.aggregate(Count("score", distinct=True))
+    with pytest.raises(ValueError):
+        await Event.objects.values("tenant_id").annotate(n=Count())
+    empty = Event.objects.filter(tenant_id__in=[])
+    assert await empty.aggregate(n=Count(), s=Sum("score"), d=Count("score", distinct=True)) == {
+        "n": 0,
+        "s": None,
+        "d": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_aggregate_names_cannot_clash_with_internal_ones(shards):
+    shards["s0"].rows = _events(1, [2])
+    shards["s1"].rows = _events(200, [4])
+    assert await Event.objects.aggregate(Avg("score"), score__avg__n=Count()) == {
+        "score__avg": 3.0,
+        "score__avg__n": 2,
+    }
+    with pytest.raises(ValueError, match="must not start with"):
+        await Event.objects.aggregate(_riverorm_score__avg__n=Count())
+
+
+@pytest.mark.asyncio
+async def test_iteration_streams_merged_rows(shards):
+    shards["s0"].rows = _events(1, [1, 4, 6])
+    shards["s1"].rows = _events(200, [2, 5])
+    scores = [e.score async for e in Event.objects.order_by("score").iterator(chunk_size=2)]
+    assert scores == [1, 2, 4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_merge_requires_selected_order_fields(shards):
+    shards["s0"].rows = [{"id": 1, "tenant_id": 1}]
+    shards["s1"].rows = [{"id": 2, "tenant_id": 200}]
+    with pytest.raises(ValueError, match="order_by"):
+        await Event.objects.only("tenant_id").order_by("score")
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_groups_rows_per_shard(shards):
+    result = await Event.objects.bulk_copy(
+        [{"tenant_id": t} for t in (1, 150, 2, 3, 250)], batch_size=2
+    )
+    assert result.rows == 5
+    assert [len(s.params) for s in shards["s0"].statements] == [4, 2]
+    assert [len(s.params) for s in shards["s1"].statements] == [4]
+
+
+@pytest.mark.asyncio
+async def test_using_targets_one_shard(shards):
+    await Event.objects.using("s1").all()
+    assert shards["s0"].statements == []
+    assert len(shards["s1"].statements) == 1
@@ -12,17 +12,23 @@ from uuid import UUID
 import pytest
 
 from riverorm.sql import (
+    Aggregate,
+    AggregateFunction,
+    BulkUpdateQuery,
     Column,
     Compiler,
     Condition,
     DeleteQuery,
     InsertQuery,
     Join,
+    OnConflict,
     MySQLDialect,
     Operator,
     OrderBy,
     PostgresDialect,
     SelectQuery,
+    SQLCache,
+    SQLiteDialect,
     UpdateQuery,
 )
 
@@ -72,11 +78,11 @@ def test_select_with_mixed_where_order_limit_offset(compiler: Compiler):
     sql, params = compiler.compile_select(query)
     assert sql == (
         'SELECT * FROM "users"'
-        ' WHERE "age" >= $1 AND "status" != $2 AND "id" IN ($3, $4, $5)'
+        ' WHERE "age" >= $1 AND "status" != $2 AND "id" = ANY($3)'
         ' ORDER BY "created_at" DESC'
         " LIMIT 10 OFFSET 5"
     )
-    assert params == [18, "banned", 1, 2, 3]
+    assert params == [18, "banned", [1, 2, 3]]
 
 
 def test_select_with_join_projection_and_aliases(compiler: Compiler):
@@ -135,8 +141,35 @@ def test_select_negated_condition(compiler: Compiler):
         ),
     )
     sql, params = compiler.compile_select(query)
-    assert sql == ('SELECT * FROM "users" WHERE NOT ("status" = $1) AND NOT ("id" IN ($2, $3))')
-    assert params == ["banned", 1, 2]
+    assert sql == ('SELECT * FROM "users" WHERE NOT ("status" = $1) AND "id" <> ALL($2)')
+    assert params == ["banned", [1, 2]]
+
+
+def test_in_list_per_value_placeholders_on_mysql():
+    query = SelectQuery(
+        table="users",
+        where=(
+            Condition(Column("id"), Operator.IN, [1, 2]),
+            Condition(Column("role"), Operator.IN, ("a",), negated=True),
+        ),
+    )
+    sql, params = Compiler(MySQLDialect()).compile_select(query)
+    assert sql == "SELECT * FROM `users` WHERE `id` IN (%s, %s) AND NOT (`role` IN (%s))"
+    assert params == [1, 2, "a"]
+
+
+@pytest.mark.parametrize("dialect", [PostgresDialect(), MySQLDialect()])
+def test_empty_in_list_renders_a_constant(dialect):
+    query = DeleteQuery(
+        table="users",
+        where=(
+            Condition(Column("id"), Operator.IN, []),
+            Condition(Column("role"), Operator.IN, [], negated=True),
+        ),
+    )
+    sql, params = Compiler(dialect).compile_delete(query)
+    assert sql.endswith(" WHERE FALSE AND TRUE")
+    assert params == []
 
 
 # -- INSERT ------------------------------------------------------------------
@@ -154,6 +187,24 @@ def test_insert_with_returning(compiler: Compiler):
     assert params == ["alice", "alice@example.com"]
 
 
+def test_insert_multiple_rows(compiler: Compiler):
+    query = InsertQuery(
+        table="users",
+        columns=("username", "email"),
+        rows=(("alice", "a@ex.com"), ("bob", None)),
+    )
+    sql, params = compiler.compile_insert(query)
+    assert sql == 'INSERT INTO "users" ("username", "email") VALUES ($1, $2), ($3, $4)'
+    assert params == ["alice", "a@ex.com", "bob", None]
+
+
+def test_insert_multiple_rows_mysql():
+    query = InsertQuery(table="users", columns=("username",), rows=(("alice",), ("bob",)))
+    sql, params = Compiler(MySQLDialect()).compile_insert(query)
+    assert sql == "INSERT INTO `users` (`username`) VALUES (%s), (%s)"
+    assert params == ["alice", "bob"]
+
+
 # -- UPDATE & DELETE ---------------------------------------------------------
 
 
@@ -278,3 +329,275 @@ def test_mysql_insert_has_no_returning():
     sql, params = compiler.compile_insert(query)
     assert sql == "INSERT INTO `users` (`username`, `email`) VALUES (%s, %s)"
     assert params == ["alice", "alice@example.com"]
+
+
+# -- compiled-SQL cache -----------------------------------------------------
+
+
+def _by_id(*values) -> SelectQuery:
+    op = Operator.IN if len(values) > 1 else Operator.EQ
+    value = list(values) if len(values) > 1 else values[0]
+    return SelectQuery(table="users", where=(Condition(Column("id"), op, value),))
+
+
+def test_cache_reuses_sql_and_rebuilds_params():
+    cached = Compiler(PostgresDialect(), cache=SQLCache())
+    assert cached.compile_select(_by_id(1)) == ('SELECT * FROM "users" WHERE "id" = $1', [1])
+    assert cached.compile_select(_by_id(2)) == ('SELECT * FROM "users" WHERE "id" = $1', [2])
+    assert cached.compile_select(_by_id(3, 4)) == (
+        'SELECT * FROM "users" WHERE "id" = ANY($1)',
+        [[3, 4]],
+    )
+    # Every non-empty list length shares one array-parameter shape.
+    assert cached.compile_select(_by_id(5, 6, 7))[1] == [[5, 6, 7]]
+    assert (cached.cache.stats.hits, cached.cache.stats.misses) == (2, 2)
+    assert cached.cache.stats.hit_rate == pytest.approx(1 / 2)
+
+
+def test_cached_output_matches_uncached():
+    cache = SQLCache()
+    where = (
+        Condition(Column("id"), Operator.GT, 5),
+        Condition(Column("role"), Operator.IN, ["a", "b"], negated=True),
+        Condition(Column("team"), Operator.IN, []),
+    )
+    queries = [
+        UpdateQuery(table="users", columns=("name",), values=("x",), where=where),
+        DeleteQuery(table="users", where=where),
+        InsertQuery(table="users", columns=("a", "b"), rows=((1, 2), (3, 4))),
+        InsertQuery(table="users", columns=("a",), values=(1,), returning="id"),
+    ]
+    for dialect in (PostgresDialect(), MySQLDialect()):
+        plain, cached = Compiler(dialect, cache=None), Compiler(dialect, cache=cache)
+        for query in queries * 2:
+            method = f"compile_{type(query).__name__.removesuffix('Query').lower()}"
+            assert getattr(cached, method)(query) == getattr(plain, method)(query)
+    assert cache.stats.hits == len(queries) * 2
+
+
+def test_cache_is_lru_bounded_and_shared_by_default():
+    cache = SQLCache(max_size=2)
+    compiler = Compiler(PostgresDialect(), cache=cache)
+    for table in ("a", "b", "a", "c"):
+        compiler.compile_delete(DeleteQuery(table=table))
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    compiler.compile_delete(DeleteQuery(table="a"))  # "b" was evicted, "a" kept
+    assert cache.stats.hits == 2
+    assert Compiler(PostgresDialect()).cache is Compiler(MySQLDialect()).cache
+    with pytest.raises(ValueError):
+        SQLCache(max_size=0)
+
+
+# -- upserts -----------------------------------------------------------------
+
+
+def test_insert_on_conflict_postgres(compiler: Compiler):
+    update = InsertQuery(
+        table="users",
+        columns=("email", "name"),
+        values=("a@x", "A"),
+        returning=("id", "email"),
+        on_conflict=OnConflict(("email",), ("name",)),
+    )
+    assert compiler.compile_insert(update) == (
+        'INSERT INTO "users" ("email", "name") VALUES ($1, $2)'
+        ' ON CONFLICT ("email") DO UPDATE SET "name" = EXCLUDED."name"'
+        ' RETURNING "id", "email"',
+        ["a@x", "A"],
+    )
+    nothing = InsertQuery(
+        table="users", columns=("email",), values=("a@x",), on_conflict=OnConflict(("email",))
+    )
+    sql, _ = compiler.compile_insert(nothing)
+    assert sql.endswith(' ON CONFLICT ("email") DO NOTHING')
+
+
+def test_insert_on_conflict_mysql():
+    compiler = Compiler(MySQLDialect())
+    query = InsertQuery(
+        table="users",
+        columns=("email", "name", "age"),
+        rows=(("a@x", "A", 1), ("b@x", "B", 2)),
+        on_conflict=OnConflict(("email",), ("name", "age")),
+    )
+    sql, params = compiler.compile_insert(query)
+    assert sql == (
+        "INSERT INTO `users` (`email`, `name`, `age`) VALUES (%s, %s, %s), (%s, %s, %s)"
+        " ON DUPLICATE KEY UPDATE `name` = VALUES(`name`), `age` = VALUES(`age`)"
+    )
+    assert params == ["a@x", "A", 1, "b@x", "B", 2]
+    nothing = InsertQuery(
+        table="users", columns=("email",), values=("a@x",), on_conflict=OnConflict(("email",))
+    )
+    sql, _ = compiler.compile_insert(nothing)
+    assert sql.endswith(" ON DUPLICATE KEY UPDATE `email` = `email`")
+    with pytest.raises(ValueError):
+        OnConflict(())
+
+
+def test_insert_upsert_reports_inserted_rows(compiler: Compiler):
+    query = InsertQuery(
+        table="users",
+        columns=("email", "name"),
+        values=("a@x", "A"),
+        returning=("id",),
+        on_conflict=OnConflict(("email",), ("name",), strict=True),
+        returning_inserted="inserted",
+    )
+    sql, _ = compiler.compile_insert(query)
+    assert sql.endswith(' RETURNING "id", (xmax = 0) AS "inserted"')
+    with pytest.raises(NotImplementedError):
+        Compiler(MySQLDialect()).compile_insert(query)
+
+
+def test_insert_on_conflict_mysql_strict_only_updates_the_target_row():
+    query = InsertQuery(
+        table="users",
+        columns=("email", "name"),
+        values=("a@x", "A"),
+        on_conflict=OnConflict(("email",), ("email", "name"), strict=True),
+    )
+    sql, _ = Compiler(MySQLDialect((8, 0, 36))).compile_insert(query)
+    # The target column is assigned last, so the guard sees its old value.
+    assert sql.endswith(
+        " AS `_new` ON DUPLICATE KEY UPDATE"
+        " `name` = IF(`email` <=> `_new`.`email`, `_new`.`name`, `name`),"
+        " `email` = IF(`email` <=> `_new`.`email`, `_new`.`email`, `email`)"
+    )
+
+
+def test_insert_on_conflict_mysql_row_alias():
+    query = InsertQuery(
+        table="users",
+        columns=("email", "name"),
+        values=("a@x", "A"),
+        on_conflict=OnConflict(("email",), ("name",)),
+    )
+    sql, _ = Compiler(MySQLDialect((8, 0, 36))).compile_insert(query)
+    assert sql == (
+        "INSERT INTO `users` (`email`, `name`) VALUES (%s, %s)"
+        " AS `_new` ON DUPLICATE KEY UPDATE `name` = `_new`.`name`"
+    )
+    # Older servers and MariaDB have no row alias and keep VALUES(col).
+    for dialect in (MySQLDialect((8, 0, 18)), MySQLDialect((11, 4, 2), mariadb=True)):
+        sql, _ = Compiler(dialect).compile_insert(query)
+        assert sql.endswith(" ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)")
+
+
+@pytest.mark.parametrize(
+    ("server_info", "row_alias"),
+    [
+        ("8.0.36", True),
+        ("8.4.0-commercial", True),
+        ("8.0.18-log", False),
+        ("5.7.44", False),
+        ("5.5.5-10.11.6-MariaDB", False),
+        ("11.4.2-MariaDB-ubu2404", False),
+        ("unknown", False),
+    ],
+)
+def test_mysql_dialect_for_server(server_info: str, row_alias: bool):
+    assert MySQLDialect.for_server(server_info).row_alias is row_alias
+
+
+def test_bulk_update_case_form_and_cached_params():
+    compiler = Compiler(SQLiteDialect())
+    query = BulkUpdateQuery(
+        table="users", key="id", columns=("name", "age"), rows=((1, "A", 30), (2, "B", None))
+    )
+    expected = (
+        'UPDATE "users" SET "name" = CASE "id" WHEN ? THEN ? WHEN ? THEN ? END,'
+        ' "age" = CASE "id" WHEN ? THEN ? WHEN ? THEN ? END WHERE "id" IN (?, ?)',
+        [1, "A", 2, "B", 1, 30, 2, None, 1, 2],
+    )
+    assert compiler.compile_bulk_update(query) == expected
+    # A cache hit rebuilds the parameters in the same order.
+    assert compiler.compile_bulk_update(query) == expected
+    assert SQLiteDialect().bulk_update_params(2) == 5
+
+
+def test_bulk_update_values_form_casts_first_row():
+    query = BulkUpdateQuery(
+        table="users",
+        key="id",
+        columns=("name",),
+        rows=((1, "A"), (2, "B")),
+        types=("INTEGER", ""),
+    )
+    sql, params = Compiler(PostgresDialect(), cache=None).compile_bulk_update(query)
+    assert sql == (
+        'UPDATE "users" SET "name" = "_v"."name" FROM (VALUES (CAST($1 AS INTEGER), $2),'
+        ' ($3, $4)) AS "_v" ("id", "name") WHERE "users"."id" = "_v"."id"'
+    )
+    assert params == [1, "A", 2, "B"]
+
+
+def test_update_and_delete_returning(compiler: Compiler):
+    where = (Condition(Column("id"), Operator.EQ, 1),)
+    update = UpdateQuery(
+        table="users", columns=("name",), values=("A",), where=where, returning=("id", "name")
+    )
+    sql, params = compiler.compile_update(update)
+    assert sql == 'UPDATE "users" SET "name" = $1 WHERE "id" = $2 RETURNING "id", "name"'
+    assert params == ["A", 1]
+    sql, _ = compiler.compile_delete(DeleteQuery(table="users", where=where, returning="id"))
+    assert sql == 'DELETE FROM "users" WHERE "id" = $1 RETURNING "id"'
+
+
+def test_mariadb_returns_deleted_rows_only():
+    where = (Condition(Column("id"), Operator.EQ, 1),)
+    update = UpdateQuery(
+        table="users", columns=("name",), values=("A",), where=where, returning="id"
+    )
+    delete = DeleteQuery(table="users", where=where, returning="id")
+    compiler = Compiler(MySQLDialect((11, 4, 2), mariadb=True))
+    sql, _ = compiler.compile_delete(delete)
+    assert sql == "DELETE FROM `users` WHERE `id` = %s RETURNING `id`"
+    assert compiler.compile_update(update)[0] == "UPDATE `users` SET `name` = %s WHERE `id` = %s"
+    # Sharing a cache with MySQL must not hand MySQL the RETURNING form.
+    mysql = Compiler(MySQLDialect((5, 7, 44)), cache=compiler.cache)
+    assert mysql.compile_delete(delete)[0] == "DELETE FROM `users` WHERE `id` = %s"
+    assert MySQLDialect.for_server("5.5.5-10.11.6-MariaDB").delete_returning is True
+    assert not MySQLDialect.for_server("8.0.36").delete_returning
+
+
+def test_select_for_update_only_where_rows_lock(compiler: Compiler):
+    query = SelectQuery(table="users", limit=1, for_update=True)
+    assert compiler.compile_select(query)[0] == 'SELECT * FROM "users" LIMIT 1 FOR UPDATE'
+    assert Compiler(SQLiteDialect()).compile_select(query)[0] == 'SELECT * FROM "users" LIMIT 1'
+
+
+def test_select_aggregates_group_by_having(compiler: Compiler):
+    total = Aggregate(AggregateFunction.SUM, Column("total"), alias="total")
+    query = SelectQuery(
+        table="orders",
+        columns=(Column("status"),),
+        aggregates=(total, Aggregate(AggregateFunction.COUNT, Column("user_id"), True, "buyers")),
+        where=(Condition(Column("quantity"), Operator.GT, 1),),
+        group_by=(Column("status"),),
+        having=(Condition(Column("total"), Operator.GTE, 100),),
+        order_by=(OrderBy(Column("total"), descending=True),),
+    )
+    expected = (
+        'SELECT "status", SUM("total") AS "total", COUNT(DISTINCT "user_id") AS "buyers"'
+        ' FROM "orders" WHERE "quantity" > $1 GROUP BY "status" HAVING SUM("total") >= $2'
+        ' ORDER BY "total" DESC',
+        [1, 100],
+    )
+    assert compiler.compile_select(query) == expected
+    assert compiler.compile_select(query) == expected  # cached: WHERE then HAVING params
+    with pytest.raises(ValueError):
+        compiler.compile_select(
+            SelectQuery(table="orders", having=(Condition(Column("n"), Operator.GT, 1),))
+        )
+
+
+def test_aggregate_requires_column_except_count():
+    assert Compiler(MySQLDialect()).compile_select(
+        SelectQuery(table="orders", aggregates=(Aggregate(AggregateFunction.COUNT, alias="n"),))
+    ) == ("SELECT COUNT(*) AS `n` FROM `orders`", [])
+    with pytest.raises(ValueError):
+        Aggregate(AggregateFunction.AVG)
+    with pytest.raises(ValueError):
+        Aggregate(AggregateFunction.COUNT, distinct=True)
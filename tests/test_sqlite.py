@@ -0,0 +1,141 @@
+"""Embedded SQLite backend tests.
+
+SQLite needs no server, so these open real databases (in memory, or a file in
+``tmp_path`` for WAL) directly instead of going through the registry fixture.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from riverorm.db import QueryTimeoutError, SQLiteDatabase, statement_timeout
+from riverorm.sql import Compiler, SelectQuery, SQLiteDialect
+
+
+@pytest.mark.parametrize(
+    ("dsn", "path"),
+    [
+        ("sqlite://", ":memory:"),
+        ("sqlite:///:memory:", ":memory:"),
+        ("sqlite:///app.db", "app.db"),
+        ("sqlite:////var/lib/app.db", "/var/lib/app.db"),
+    ],
+)
+def test_dsn_to_path(dsn: str, path: str):
+    assert SQLiteDatabase.dsn_to_path(dsn) == path
+
+
+def test_dsn_rejects_other_schemes():
+    with pytest.raises(ValueError):
+        SQLiteDatabase.dsn_to_path("postgresql://localhost/db")
+
+
+def test_dialect_renders_qmarks_and_offset_without_limit():
+    sql, params = Compiler(SQLiteDialect()).compile_select(SelectQuery(table="user", offset=10))
+    assert sql == 'SELECT * FROM "user" LIMIT -1 OFFSET 10'
+    assert params == []
+    assert SQLiteDialect().auto_increment_pk("id") == '"id" INTEGER PRIMARY KEY'
+
+
+@pytest.mark.asyncio
+async def test_values_round_trip_through_adapters_and_json_converter():
+    db = SQLiteDatabase("sqlite://")
+    await db.connect()
+    try:
+        await db.execute('CREATE TABLE "t" ("at" TEXT, "key" TEXT, "tags" JSON)')
+        at = datetime(2024, 5, 1, 12, 30)
+        key = UUID("12345678-1234-5678-1234-567812345678")
+        await db.execute('INSERT INTO "t" VALUES (?, ?, ?)', at, key, ["a", "b"])
+        row = await db.fetchrow('SELECT * FROM "t"')
+        assert row == {"at": at.isoformat(), "key": str(key), "tags": ["a", "b"]}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_copy_records_batches_executemany():
+    async def records() -> AsyncIterator[tuple[int, str]]:
+        for i in range(25):
+            yield i, f"name{i}"
+
+    db = SQLiteDatabase("sqlite://")
+    await db.connect()
+    try:
+        await db.execute('CREATE TABLE "t" ("id" INTEGER PRIMARY KEY, "name" TEXT)')
+        assert await db.copy_records("t", ["id", "name"], records(), batch_size=10) == 25
+        assert (await db.fetchrow('SELECT count(*) AS n FROM "t"'))["n"] == 25
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_file_database_uses_wal(tmp_path):
+    db = SQLiteDatabase(f"sqlite:///{tmp_path / 'app.db'}")
+    await db.connect()
+    try:
+        assert (await db.fetchrow("PRAGMA journal_mode"))["journal_mode"] == "wal"
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_timeout_interrupts_worker_thread():
+    db = SQLiteDatabase("sqlite://")
+    await db.connect()
+    try:
+        with pytest.raises(QueryTimeoutError), statement_timeout(0.1):
+            await db.fetch(
+                "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n"
+                " WHERE i < 1000000000) SELECT count(*) FROM n"
+            )
+        # The interrupted statement freed the thread for the next one.
+        assert await db.fetchrow("SELECT 1 AS one") == {"one": 1}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_rolls_back_its_transaction():
+    db = SQLiteDatabase("sqlite://")
+    await db.connect()
+    try:
+        await db.execute('CREATE TABLE "t" ("n" INTEGER NOT NULL)')
+        with pytest.raises(Exception):
+            await db.run_batch(
+                [
+                    ("BEGIN IMMEDIATE", (), "execute"),
+                    ('INSERT INTO "t" VALUES (?)', (1,), "execute"),
+                    ('INSERT INTO "t" VALUES (?)', (None,), "execute"),
+                    ("COMMIT", (), "execute"),
+                ]
+            )
+        assert await db.fetch('SELECT * FROM "t"') == []
+        await db.execute('INSERT INTO "t" VALUES (?)', 2)  # not stuck in a transaction
+        assert await db.fetch('SELECT * FROM "t"') == [{"n": 2}]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_transaction_is_rolled_back():
+    db = SQLiteDatabase("sqlite://")
+    await db.connect()
+    try:
+        await db.execute('CREATE TABLE "t" ("n" INTEGER UNIQUE)')
+        await db.execute('INSERT INTO "t" VALUES (?), (?)', 1, 2)
+        with pytest.raises(sqlite3.IntegrityError):
+            await db.run_transaction(
+                [
+                    ('SELECT "n" FROM "t" WHERE "n" = ?', (2,), "fetch"),
+                    ('UPDATE "t" SET "n" = ? WHERE "n" = ?', (1, 2), "execute"),
+                ]
+            )
+        assert db._conn is not None and not db._conn.in_transaction
+        assert await db.run_transaction([('DELETE FROM "t" WHERE "n" = ?', (2,), "execute")]) == [1]
+    finally:
+        await db.close()
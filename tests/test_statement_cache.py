@@ -0,0 +1,141 @@
+"""Prepared-statement cache tests for :class:`PostgresDatabase`.
+
+Pure tests use a fake connection whose ``prepare`` hands out fake statements,
+so LRU order, counters and DDL invalidation are checked without a server.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import asyncpg
+import pytest
+from asyncpg.exceptions import InvalidCachedStatementError
+
+from riverorm.db import PoolConfig, PostgresDatabase
+from riverorm.db.postgres import StatementCache, StatementCacheStats
+from tests.models import User
+
+
+class _FakeStatement:
+    def __init__(self, query: str, conn: _FakeConnection) -> None:
+        self.query = query
+        self.conn = conn
+
+    async def fetch(self, *args: Any) -> list[Any]:
+        if self.conn.fail_next:
+            self.conn.fail_next = False
+            raise InvalidCachedStatementError("cached plan must not change result type")
+        return [(self.query, args)]
+
+    async def fetchrow(self, *args: Any) -> Any:
+        return (await self.fetch(*args))[0]
+
+    def get_statusmsg(self) -> str:
+        return "UPDATE 1"
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.prepared: list[str] = []
+        self.fail_next = False
+        self.statement_cache: StatementCache | None = None
+
+    async def prepare(self, query: str) -> _FakeStatement:
+        self.prepared.append(query)
+        return _FakeStatement(query, self)
+
+
+def _cached_connection(size: int = 2) -> tuple[_FakeConnection, StatementCacheStats]:
+    conn = _FakeConnection()
+    stats = StatementCacheStats()
+    conn.statement_cache = StatementCache(conn, size, stats)  # type: ignore[arg-type]
+    return conn, stats
+
+
+@pytest.mark.asyncio
+async def test_repeated_sql_is_prepared_once():
+    conn, stats = _cached_connection()
+    cache = conn.statement_cache
+    assert cache is not None
+    first = await cache.get("SELECT 1")
+    assert await cache.get("SELECT 1") is first
+    assert conn.prepared == ["SELECT 1"]
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_statement_is_evicted():
+    conn, stats = _cached_connection(size=2)
+    cache = conn.statement_cache
+    assert cache is not None
+    await cache.get("A")
+    await cache.get("B")
+    await cache.get("A")  # B is now least recently used
+    await cache.get("C")
+    assert len(cache) == 2
+    assert stats.evictions == 1
+    await cache.get("A")
+    await cache.get("B")  # re-prepared after eviction
+    assert conn.prepared == ["A", "B", "C", "B"]
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_status_message():
+    conn, _ = _cached_connection()
+    db = PostgresDatabase("postgresql://x")
+    assert await db._run(conn, "UPDATE t SET a = $1", (1,), "execute") == "UPDATE 1"
+
+
+@pytest.mark.asyncio
+async def test_invalidated_plan_clears_cache_and_reprepares():
+    conn, stats = _cached_connection()
+    db = PostgresDatabase("postgresql://x")
+    await db._run(conn, "SELECT * FROM t", (), "fetch")
+    conn.fail_next = True
+    rows = await db._run(conn, "SELECT * FROM t", (), "fetch")
+    assert rows == [("SELECT * FROM t", ())]
+    assert stats.invalidations == 1
+    assert conn.prepared == ["SELECT * FROM t", "SELECT * FROM t"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_statements_are_prepared_into_the_cache():
+    db = PostgresDatabase(
+        "postgresql://x", pool=PoolConfig(warm_up=('SELECT * FROM "user" WHERE "id" = $1',))
+    )
+    conn, stats = _cached_connection()
+    await db._warm_connection(conn)
+    assert conn.prepared == ['SELECT * FROM "user" WHERE "id" = $1']
+    assert stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_asyncpg_statement_cache_is_disabled(monkeypatch):
+    seen: dict[str, Any] = {}
+
+    async def create_pool(dsn: str, **kwargs: Any) -> None:
+        seen.update(kwargs)
+
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    await PostgresDatabase("postgresql://x", statement_cache_size=50).connect()
+    assert seen["statement_cache_size"] == 0
+
+
+def test_negative_cache_size_rejected():
+    with pytest.raises(ValueError):
+        PostgresDatabase("postgresql://x", statement_cache_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_statement_cache_hits_on_real_postgres(db_setup_and_teardown, db_type):
+    if db_type != "postgres":
+        pytest.skip("prepared-statement cache is Postgres-only")
+    db = User.db()
+    assert isinstance(db, PostgresDatabase)
+    await User.objects.create(username="alice")
+    before = db.statement_cache_stats.hits
+    for _ in range(3):
+        assert await User.objects.filter(username="alice").count() == 1
+    assert db.statement_cache_stats.hits > before
@@ -0,0 +1,202 @@
+"""Streaming iteration tests: ``async for`` and ``QuerySet.iterator()``.
+
+Pure tests use a fake backend whose ``stream`` hands out scripted chunks and
+whose ``fetch`` refuses to run, proving iteration never materializes the full
+result. The DB-backed tests walk real server-side cursors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any
+
+import pytest
+
+from riverorm.db import DatabaseRegistry, FakeDatabase, MySQLDatabase
+from tests.models import User
+
+
+class StreamingDatabase(FakeDatabase):
+    """Backend that serves ``rows`` through ``stream`` and refuses to ``fetch``."""
+
+    def __init__(self, rows: list[dict[str, Any]], dsn: str = "fake://", debug: bool = False):
+        super().__init__(dsn, debug)
+        self.rows = rows
+        self.calls: list[tuple[str, int]] = []
+        self.chunks_served = 0
+        self.closed = False
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        self.calls.append((query, chunk_size))
+        try:
+            for start in range(0, len(self.rows), chunk_size):
+                self.chunks_served += 1
+                yield self.rows[start : start + chunk_size]
+        finally:
+            self.closed = True
+
+    async def fetch(self, query: str, *args: Any) -> Sequence[Any]:
+        raise AssertionError("iteration must stream, not fetch()")
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        raise AssertionError("iteration must stream, not fetch_tuples()")
+
+
+def _users(n: int) -> list[dict[str, Any]]:
+    return [
+        {"id": i, "username": f"user{i}", "email": None, "is_active": True} for i in range(1, n + 1)
+    ]
+
+
+@pytest.fixture
+def streaming_db(isolated_registry: None) -> StreamingDatabase:
+    db = StreamingDatabase(_users(5))
+    DatabaseRegistry.register("stream", db)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_async_for_streams_with_default_chunk_size(streaming_db: StreamingDatabase):
+    names = [u.username async for u in User.objects.filter(is_active=True)]
+    assert names == [f"user{i}" for i in range(1, 6)]
+    sql, chunk_size = streaming_db.calls[0]
+    assert sql == 'SELECT * FROM "user" WHERE "is_active" = $1'
+    assert chunk_size == 1000
+
+
+@pytest.mark.asyncio
+async def test_iterator_uses_requested_chunk_size(streaming_db: StreamingDatabase):
+    users = [u async for u in User.objects.iterator(chunk_size=2)]
+    assert [u.id for u in users] == [1, 2, 3, 4, 5]
+    assert all(u._persisted for u in users)
+    assert streaming_db.chunks_served == 3
+
+
+@pytest.mark.asyncio
+async def test_breaking_early_pulls_only_the_first_chunk(streaming_db: StreamingDatabase):
+    iterator = User.objects.iterator(chunk_size=2)
+    async for user in iterator:
+        if user.id == 1:
+            break
+    # Rows are hydrated chunk by chunk, so nothing past the first chunk is read.
+    assert streaming_db.chunks_served == 1
+    await iterator.aclose()  # type: ignore[attr-defined]
+    assert streaming_db.closed
+
+
+@pytest.mark.asyncio
+async def test_iterator_honours_only(streaming_db: StreamingDatabase):
+    streaming_db.rows = [{"id": 1, "username": "alice"}]
+    users = [u async for u in User.objects.only("username").iterator()]
+    assert users[0]._loaded_fields == {"id", "username"}
+    assert streaming_db.calls[0][0] == 'SELECT "id", "username" FROM "user"'
+
+
+def test_iterator_rejects_non_positive_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        User.objects.iterator(chunk_size=0)
+
+
+class _UnbufferedCursor:
+    """Stands in for ``SSDictCursor``: ``close()`` drains the unread rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.drained = False
+
+    async def execute(self, query: str, args: tuple[Any, ...]) -> None: ...
+
+    async def fetchmany(self, size: int) -> list[dict[str, Any]]:
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+        return chunk
+
+    async def close(self) -> None:
+        self.rows = []
+        self.drained = True
+
+
+class _StreamingConnection:
+    closed = False
+
+    def __init__(self, cursor: _UnbufferedCursor) -> None:
+        self._cursor = cursor
+
+    async def cursor(self, cursor_class: Any) -> _UnbufferedCursor:
+        return self._cursor
+
+    def thread_id(self) -> int:
+        return 7
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _mysql_streaming(rows: list[dict[str, Any]]) -> tuple[MySQLDatabase, _StreamingConnection]:
+    db = MySQLDatabase("mysql://x")
+    conn = _StreamingConnection(_UnbufferedCursor(rows))
+    killed: list[int] = []
+
+    async def acquire() -> _StreamingConnection:
+        return conn
+
+    async def release(conn: _StreamingConnection) -> None: ...
+
+    async def kill_query(thread_id: int) -> None:
+        killed.append(thread_id)
+
+    db._acquire_connection = acquire  # type: ignore[method-assign]
+    db._release_connection = release  # type: ignore[method-assign]
+    db._kill_query = kill_query  # type: ignore[method-assign]
+    return db, conn
+
+
+@pytest.mark.asyncio
+async def test_mysql_stream_exhausted_closes_cursor_and_keeps_connection():
+    db, conn = _mysql_streaming(_users(3))
+    chunks = [rows async for rows in db.stream("SELECT 1", chunk_size=2)]
+    assert [len(rows) for rows in chunks] == [2, 1]
+    assert conn._cursor.drained
+    assert not conn.closed
+
+
+@pytest.mark.asyncio
+async def test_mysql_stream_early_exit_abandons_instead_of_draining():
+    db, conn = _mysql_streaming(_users(10))
+    stream = db.stream("SELECT 1", chunk_size=2)
+    async for _ in stream:
+        break
+    await stream.aclose()
+    await asyncio.gather(*db._kills)
+    # The unread rows are left on the server instead of pulled over the wire.
+    assert not conn._cursor.drained
+    assert len(conn._cursor.rows) == 8
+    assert conn.closed
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_iterator_streams_real_cursor(db_setup_and_teardown):
+    for i in range(7):
+        await User.objects.create(username=f"u{i}")
+    names = [u.username async for u in User.objects.order_by("id").iterator(chunk_size=3)]
+    assert names == [f"u{i}" for i in range(7)]
+    assert User.db().pool_stats.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_iterator_early_exit_releases_connection(db_setup_and_teardown):
+    for i in range(5):
+        await User.objects.create(username=f"u{i}")
+    iterator = User.objects.order_by("id").iterator(chunk_size=2)
+    async for _ in iterator:
+        break
+    await iterator.aclose()  # type: ignore[attr-defined]
+    assert User.db().pool_stats.in_use == 0
+    assert await User.objects.count() == 5
@@ -0,0 +1,265 @@
+"""Statement timeout tests (``QuerySet.timeout()`` / ``statement_timeout``).
+
+Pure tests drive :meth:`BaseDatabase._bounded` through a fake backend that
+records the limit each statement saw, and check the backend-specific pieces
+(session script, ``MAX_EXECUTION_TIME`` hint, connection abandonment) without
+a server. The DB-backed test sleeps on the real backends past a short limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from typing import Any
+
+import pytest
+from asyncpg.exceptions import QueryCanceledError
+from pymysql.err import OperationalError
+
+from riverorm import constants
+from riverorm.db import (
+    DatabaseRegistry,
+    FakeDatabase,
+    MySQLDatabase,
+    PoolConfig,
+    PostgresDatabase,
+    QueryTimeoutError,
+    statement_timeout,
+)
+from riverorm.db.base import R
+from tests.models import User
+
+
+class SlowDatabase(FakeDatabase):
+    """FakeDatabase whose statements take ``delay`` seconds and record their limit."""
+
+    def __init__(self, delay: float = 0.0, dsn: str = "fake://") -> None:
+        super().__init__(dsn)
+        self.delay = delay
+        self.rows = [{"id": 1, "username": "alice", "email": None, "is_active": True}]
+        self.seen: list[float | None] = []
+        self.on(r"^SELECT", lambda sql, params: self.rows)
+        self.on(r"^SELECT COUNT", lambda sql, params: [{"count": len(self.rows)}])
+        self.on(r"^UPDATE", 1)
+
+    async def _slow(self, statement: Callable[..., Awaitable[R]], *args: Any) -> R:
+        timeout = self._timeout()
+        self.seen.append(timeout)
+
+        async def run() -> R:
+            await asyncio.sleep(self.delay)
+            return await statement(*args)
+
+        return await self._bounded(timeout, run)
+
+    async def fetch_tuples(
+        self, query: str, *args: Any
+    ) -> tuple[list[str], Sequence[Sequence[Any]]]:
+        return await self._slow(super().fetch_tuples, query, *args)
+
+    async def fetchrow(self, query: str, *args: Any) -> Any:
+        return await self._slow(super().fetchrow, query, *args)
+
+    async def execute_returning_rowcount(self, query: str, *args: Any) -> int:
+        return await self._slow(super().execute_returning_rowcount, query, *args)
+
+    async def stream(
+        self, query: str, *args: Any, chunk_size: int = constants.DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[Sequence[Any], None]:
+        for row in await super().fetch(query, *args):
+            yield await self._slow(_chunk, row)
+
+
+async def _chunk(row: Any) -> list[Any]:
+    return [row]
+
+
+@pytest.fixture
+def slow_db(isolated_registry: None) -> SlowDatabase:
+    db = SlowDatabase()
+    DatabaseRegistry.register("slow", db)
+    return db
+
+
+# -- scopes and QuerySet.timeout() ---------------------------------------------
+
+
+def test_statement_timeout_scopes_nest():
+    from riverorm.db.timeout import current_timeout
+
+    assert current_timeout() is None
+    with statement_timeout(2):
+        with statement_timeout(None):
+            assert current_timeout() == 2
+        with statement_timeout(0.5):
+            assert current_timeout() == 0.5
+        assert current_timeout() == 2
+    assert current_timeout() is None
+    with pytest.raises(ValueError), statement_timeout(0):
+        pass
+
+
+def test_queryset_timeout_validates_and_chains():
+    qs = User.objects.filter(is_active=True).timeout(1.5)
+    assert qs.timeout_value == 1.5
+    assert qs.order_by("id").timeout_value == 1.5
+    with pytest.raises(ValueError):
+        User.objects.timeout(0)
+
+
+@pytest.mark.asyncio
+async def test_queryset_timeout_overrides_backend_default(slow_db: SlowDatabase):
+    slow_db.statement_timeout = 10
+    await User.objects.all()
+    await User.objects.timeout(0.5).all()
+    await User.objects.timeout(0.25).count()
+    await User.objects.timeout(0.125).filter(id=1).update(username="bob")
+    assert slow_db.seen == [10, 0.5, 0.25, 0.125]
+
+
+@pytest.mark.asyncio
+async def test_iterator_scopes_timeout_to_each_chunk(slow_db: SlowDatabase):
+    from riverorm.db.timeout import current_timeout
+
+    slow_db.rows = slow_db.rows * 3
+    seen_by_consumer = []
+    async for _ in User.objects.timeout(0.5).iterator(chunk_size=1):
+        seen_by_consumer.append(current_timeout())
+    assert slow_db.seen == [0.5, 0.5, 0.5]
+    assert seen_by_consumer == [None, None, None]
+
+
+# -- client-side deadline -----------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_slow_statement_raises_query_timeout(slow_db: SlowDatabase):
+    slow_db.delay = 1
+    with pytest.raises(QueryTimeoutError):
+        await User.objects.timeout(0.01).all()
+    slow_db.delay = 0
+    assert len(await User.objects.timeout(0.01).all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_unrelated_timeout_errors_pass_through():
+    db = SlowDatabase()
+
+    async def fails() -> None:
+        raise TimeoutError("from elsewhere")
+
+    with pytest.raises(TimeoutError) as info:
+        await db._bounded(1, fails)
+    assert not isinstance(info.value, QueryTimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_query_timeout_is_not_retried():
+    db = SlowDatabase()
+    attempts = 0
+
+    async def attempt() -> None:
+        nonlocal attempts
+        attempts += 1
+        await db._bounded(0.01, lambda: asyncio.sleep(1))
+
+    db.retry_policy = PostgresDatabase("postgresql://x").retry_policy
+    with pytest.raises(QueryTimeoutError):
+        await db._retrying(attempt, read=True)
+    assert attempts == 1
+
+
+# -- backend specifics ----------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_server_side_timeouts_map_to_query_timeout():
+    pg = PostgresDatabase("postgresql://x", statement_timeout=1)
+    my = MySQLDatabase("mysql://x", statement_timeout=1)
+    for db, exc in (
+        (pg, QueryCanceledError("canceling statement due to statement timeout")),
+        (my, OperationalError(3024, "Query execution was interrupted")),
+    ):
+
+        async def fails(exc: Exception = exc) -> None:
+            raise exc
+
+        with pytest.raises(QueryTimeoutError):
+            await db._bounded(1, fails)
+        with pytest.raises(type(exc)):
+            await db._bounded(None, fails)
+
+
+def test_backends_validate_statement_timeout():
+    assert PostgresDatabase("postgresql://x").statement_timeout is None
+    for backend, dsn in ((PostgresDatabase, "postgresql://x"), (MySQLDatabase, "mysql://x")):
+        with pytest.raises(ValueError):
+            backend(dsn, statement_timeout=0)
+
+
+def test_postgres_session_script_restores_settings_and_default():
+    db = PostgresDatabase(
+        "postgresql://x",
+        pool=PoolConfig(session_init=("SET TIME ZONE 'UTC';",)),
+        statement_timeout=1.5,
+    )
+    assert db._session_script() == "SET TIME ZONE 'UTC';\nSET statement_timeout = 1500;\n"
+    assert PostgresDatabase("postgresql://x")._session_script() == ""
+
+
+def test_mysql_hints_only_selects():
+    db = MySQLDatabase("mysql://x")
+    assert (
+        db._hint("  SELECT * FROM `user`", 0.25)
+        == "SELECT /*+ MAX_EXECUTION_TIME(250) */ * FROM `user`"
+    )
+    assert db._hint("SELECT 1", None) == "SELECT 1"
+    assert db._hint("UPDATE `user` SET `x` = %s", 0.25) == "UPDATE `user` SET `x` = %s"
+
+
+class FakeMySQLConnection:
+    closed = False
+
+    def thread_id(self) -> int:
+        return 42
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_mysql_cancelled_statement_abandons_connection():
+    db = MySQLDatabase("mysql://x")
+    killed: list[int] = []
+
+    async def kill_query(thread_id: int) -> None:
+        killed.append(thread_id)
+
+    db._kill_query = kill_query  # type: ignore[method-assign]
+    conn = FakeMySQLConnection()
+    with pytest.raises(QueryTimeoutError):
+        await db._bounded(0.01, lambda: db._guard(conn, asyncio.sleep(1)))
+    await asyncio.gather(*db._kills)
+    assert conn.closed
+    assert killed == [42]
+
+
+# -- DB-backed ---------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_slow_query_and_keeps_pool_usable(db_setup_and_teardown, db_type):
+    db = DatabaseRegistry.get(db_type)
+    sleep = {
+        "postgres": "SELECT pg_sleep(5)",
+        "mysql": "SELECT SLEEP(5)",
+        # No sleep function: count far enough to take seconds.
+        "sqlite": (
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n"
+            " WHERE i < 1000000000) SELECT count(*) FROM n"
+        ),
+    }[db_type]
+    with pytest.raises(QueryTimeoutError), statement_timeout(0.2):
+        await db.fetch(sleep)
+    await User.objects.create(username="alice")
+    assert await User.objects.timeout(5).count() == 1
@@ -0,0 +1,98 @@
+"""DSN-driven backend construction (``DatabaseRegistry.from_url``).
+
+Pure unit tests: backends are built but never connected, so option parsing,
+validation and what reaches the driver can be checked without servers.
+"""
+
+from __future__ import annotations
+
+import ssl
+
+import pytest
+
+from riverorm.db import (
+    DatabaseRegistry,
+    FakeDatabase,
+    MySQLDatabase,
+    PoolConfig,
+    PostgresDatabase,
+    SQLiteDatabase,
+)
+from riverorm.db.url import parse_url
+
+
+def test_postgres_pool_cache_and_timeout_options():
+    db = DatabaseRegistry.from_url(
+        "postgresql+pool://app:secret@db:5432/app"
+        "?min_size=5&max_size=50&statement_cache=500&timeout=2&sslmode=require"
+    )
+    assert isinstance(db, PostgresDatabase)
+    assert db.pool_config == PoolConfig(min_size=5, max_size=50)
+    assert db.statement_cache_size == 500
+    assert db.statement_timeout == 2.0
+    # Driver options stay in the DSN for asyncpg; ours and the +suffix do not.
+    assert db._dsn == "postgresql://app:secret@db:5432/app?sslmode=require"
+
+
+def test_mysql_driver_options_reach_aiomysql():
+    db = DatabaseRegistry.from_url(
+        "mysql://app@db/app?charset=utf8mb4&connect_timeout=3&sslmode=verify-ca&retries=5"
+    )
+    assert isinstance(db, MySQLDatabase)
+    assert db.retry_policy.max_attempts == 5
+    assert db.multi_statements is False
+    assert DatabaseRegistry.from_url("mysql://db/app?multi_statements=on").multi_statements
+    params = db.dsn_to_dict(db._dsn)
+    assert (params["charset"], params["connect_timeout"]) == ("utf8mb4", 3.0)
+    assert params["ssl"].verify_mode == ssl.CERT_REQUIRED
+    assert params["ssl"].check_hostname is False
+
+
+def test_sqlite_and_fake_options():
+    db = DatabaseRegistry.from_url("sqlite:///:memory:?wal=off&busy_timeout=0.5")
+    assert isinstance(db, SQLiteDatabase)
+    assert (db._path, db.wal, db.busy_timeout) == (":memory:", False, 0.5)
+    fake = DatabaseRegistry.from_url("fake://?dialect=mysql&debug=true")
+    assert isinstance(fake, FakeDatabase)
+    assert fake.dialect.placeholder(1) == "%s"
+    assert fake.debug is True
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "postgresql://db/app?compress=1",  # unknown option
+        "postgresql://db/app?max_size=lots",  # bad value
+        "postgresql://db/app?max_size=10&max_size=20",  # repeated
+        "postgresql://db/app?min_size=20&max_size=10",  # PoolConfig rejects it
+        "mysql://db/app?sslmode=sometimes",
+        "sqlite:///:memory:?statement_cache=10",  # Postgres-only
+        "oracle://db/app",
+    ],
+)
+def test_invalid_urls_are_rejected(url: str):
+    with pytest.raises(ValueError):
+        DatabaseRegistry.from_url(url)
+
+
+def test_aliases_of_one_setting_cannot_both_be_given():
+    with pytest.raises(ValueError, match="'timeout' and 'statement_timeout'"):
+        DatabaseRegistry.from_url("postgresql://db/app?timeout=1&statement_timeout=5")
+
+
+def test_mysql_dsn_rejects_unknown_query_parameters():
+    with pytest.raises(ValueError):
+        MySQLDatabase("mysql://db/app?compress=true")
+
+
+def test_keyword_arguments_override_url_and_alias_registers(isolated_registry):
+    db = DatabaseRegistry.from_url(
+        "postgresql://db/app?statement_cache=500", alias="main", statement_cache_size=0
+    )
+    assert db.statement_cache_size == 0
+    assert DatabaseRegistry.get("main") is db
+
+
+def test_parse_url_without_options():
+    backend, dsn, kwargs = parse_url("postgres://db/app")
+    assert (backend, dsn, kwargs) == (PostgresDatabase, "postgres://db/app", {})
@@ -161,3 +161,117 @@ async def test_get_or_create_no_defaults(db_setup_and_teardown):
     same, created2 = await User.objects.get_or_create(username="alice", is_active=True)
     assert created2 is False
     assert same.id == user.id
+
+
+# ---------------------------------------------------------------------------
+# bulk_create()
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_backfills_generated_keys(db_setup_and_teardown):
+    users = await User.objects.bulk_create(
+        [User(username=f"user{n}") for n in range(5)] + [{"username": "dict"}], batch_size=2
+    )
+    assert all(u._persisted for u in users)
+    fetched = {u.id: u.username for u in await User.objects.all()}
+    assert fetched == {u.id: u.username for u in users}
+    assert len(fetched) == 6
+
+    users[0].username = "renamed"
+    await users[0].save()  # persisted: an UPDATE, not a second row
+    assert await User.objects.count() == 6
+    assert (await User.objects.get(id=users[0].id)).username == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_with_explicit_keys(db_setup_and_teardown):
+    await User.objects.bulk_create([User(id=100 + n, username=f"u{n}") for n in range(3)])
+    assert [u.id for u in await User.objects.order_by("id")] == [100, 101, 102]
+    assert await User.objects.bulk_create([]) == []
+
+
+# ---------------------------------------------------------------------------
+# upserts
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_and_updates(db_setup_and_teardown):
+    await User.objects.bulk_create([User(id=1, username="alice"), User(id=2, username="bob")])
+    await User.objects.bulk_upsert(
+        [User(id=2, username="robert"), User(id=3, username="carol")],
+        conflict_fields=["id"],
+        update_fields=["username"],
+    )
+    rows = await User.objects.order_by("id")
+    assert [(u.id, u.username) for u in rows] == [(1, "alice"), (2, "robert"), (3, "carol")]
+
+    await User.objects.upsert(User(id=1, username="ignored"), ["id"], update_fields=[])
+    assert (await User.objects.get(id=1)).username == "alice"
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_and_update_or_create_by_primary_key(db_setup_and_teardown):
+    user, created = await User.objects.get_or_create(id=5, defaults={"username": "eve"})
+    assert created is True
+    same, created = await User.objects.get_or_create(id=5, defaults={"username": "other"})
+    assert (created, same.username) == (False, "eve")
+
+    updated, created = await User.objects.update_or_create(id=5, defaults={"username": "eva"})
+    assert (created, updated.username) == (False, "eva")
+    assert (await User.objects.get(id=5)).username == "eva"
+    assert await User.objects.count() == 1
+
+    new, created = await User.objects.update_or_create(id=6, defaults={"username": "fay"})
+    assert (created, new.id, new.username) == (True, 6, "fay")
+    same, created = await User.objects.update_or_create(id=6, defaults={"username": "fay"})
+    assert (created, same.username) == (False, "fay")
+    assert await User.objects.count() == 2
+
+
+# ---------------------------------------------------------------------------
+# bulk updates
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_writes_each_rows_values(db_setup_and_teardown):
+    users = await User.objects.bulk_create(
+        [User(username=f"u{n}", email=f"u{n}@x") for n in range(5)]
+    )
+    for user in users:
+        user.username = user.username.upper()
+        user.is_active = user.id % 2 == 0
+    assert await User.objects.bulk_update(users, ["username", "is_active"], batch_size=2) == 5
+    rows = await User.objects.order_by("id")
+    assert [(u.username, u.is_active) for u in rows] == [(u.username, u.is_active) for u in users]
+
+    partial = await User.objects.only("id", "username").order_by("id")
+    for user in partial:
+        user.username = f"p{user.id}"
+    await User.objects.bulk_update(partial, ["username", "email"])
+    rows = await User.objects.order_by("id")
+    # ``email`` was not fetched, so it keeps its stored value.
+    assert [(u.username, u.email) for u in rows] == [
+        (f"p{u.id}", f"u{n}@x") for n, u in enumerate(rows)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# update / delete returning
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_returning_rows(db_setup_and_teardown):
+    await User.objects.bulk_create([User(username=f"u{n}") for n in range(3)])
+    updated = await User.objects.filter(username__in=["u0", "u1"]).update(
+        is_active=False, returning=True
+    )
+    assert sorted((u.username, u.is_active) for u in updated) == [("u0", False), ("u1", False)]
+
+    deleted = await User.objects.filter(is_active=False).delete(returning=["username"])
+    assert sorted(u.username for u in deleted) == ["u0", "u1"]
+    assert all(u.id is not None and not u._persisted for u in deleted)
+    assert [u.username for u in await User.objects.all()] == ["u2"]